@@ -7,7 +7,9 @@ import pygame
 import math
 import random
 import numpy as np
+from functools import lru_cache
 from typing import List, Tuple, Dict
+from render_utils import ParticlePool, blit_batch
 
 # Professional color palette
 PALETTE = {
@@ -59,6 +61,63 @@ PALETTE = {
     'item_gold': (255, 215, 0),
 }
 
+# Glow offset patterns, shared so no call site builds its own literal
+GLOW_OFFSETS_1 = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+GLOW_OFFSETS_2 = ((-2, -2), (2, -2), (-2, 2), (2, 2))
+GLOW_OFFSETS_3 = ((3, 3), (-3, -3), (3, -3), (-3, 3))
+
+@lru_cache(maxsize=128)
+def make_glow_surface(font, text, fg_color, glow_color, offsets):
+    """Compose text and its offset glow copies into one sprite"""
+    # The sprite is padded evenly, so it shares its center with the plain text
+    text_surf = font.render(text, True, fg_color)
+    glow_surf = font.render(text, True, glow_color)
+    pad = max(max(abs(dx), abs(dy)) for dx, dy in offsets)
+    sprite = pygame.Surface((text_surf.get_width() + pad * 2, text_surf.get_height() + pad * 2), pygame.SRCALPHA)
+    for dx, dy in offsets:
+        sprite.blit(glow_surf, (pad + dx, pad + dy))
+    sprite.blit(text_surf, (pad, pad))
+    return sprite
+
+# Panel titles share one font, created lazily once pygame.font is ready
+_panel_font = None
+
+def get_panel_title_surface(title):
+    """Return the cached glowing sprite for a panel title"""
+    global _panel_font
+    if _panel_font is None:
+        _panel_font = pygame.font.Font(None, 24)
+    return make_glow_surface(_panel_font, title, PALETTE['ui_accent'], (100, 80, 0), GLOW_OFFSETS_1)
+
+def compose_blits(blit_list):
+    """Flatten (surface, pos) pairs into one surface; returns (surface, topleft)"""
+    rects = [surf.get_rect(topleft=(pos[0], pos[1])) for surf, pos in blit_list]
+    bounds = rects[0].unionall(rects[1:])
+    composed = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    for (surf, _), rect in zip(blit_list, rects):
+        composed.blit(surf, (rect.x - bounds.x, rect.y - bounds.y))
+    return composed, bounds.topleft
+
+def finish_sprite(surf):
+    """Convert a cached SRCALPHA sprite to the display format once a display exists"""
+    if pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
+
+@lru_cache(maxsize=256)
+def get_glow_circle(size, center, radius, rgba):
+    """Translucent glow disc on a transparent sprite, cached per look"""
+    glow_surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(glow_surf, rgba, center, radius)
+    return finish_sprite(glow_surf)
+
+@lru_cache(maxsize=32)
+def get_glow_rect(size, rgba, border_radius):
+    """Translucent rounded-rect glow on a transparent sprite, cached per look"""
+    glow_surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(glow_surf, rgba, (0, 0, *size), border_radius=border_radius)
+    return finish_sprite(glow_surf)
+
 class AdvancedSprite:
     """Advanced sprite with animations and effects"""
     def __init__(self, width, height):
@@ -74,6 +133,17 @@ class AdvancedSprite:
     def get_surface(self):
         return self.surface
 
+@lru_cache(maxsize=1)
+def get_player_glow():
+    """Layered glow drawn behind the player after a pickup"""
+    glow_surface = pygame.Surface((48, 48), pygame.SRCALPHA)
+    for i in range(5):
+        alpha = 50 - i * 10
+        radius = 20 + i * 3
+        glow_color = (*PALETTE['item_glow'][:3], alpha)
+        pygame.draw.circle(glow_surface, glow_color, (24, 24), radius)
+    return finish_sprite(glow_surface)
+
 class PlayerSprite(AdvancedSprite):
     """Advanced player sprite with detailed design and animations"""
     def __init__(self):
@@ -106,14 +176,7 @@ class PlayerSprite(AdvancedSprite):
     
     def draw_with_glow(self, screen, x, y, glow=False):
         if glow:
-            # Create glow effect
-            glow_surface = pygame.Surface((48, 48), pygame.SRCALPHA)
-            for i in range(5):
-                alpha = 50 - i * 10
-                radius = 20 + i * 3
-                glow_color = (*PALETTE['item_glow'][:3], alpha)
-                pygame.draw.circle(glow_surface, glow_color, (24, 24), radius)
-            screen.blit(glow_surface, (x - 8, y - 8))
+            screen.blit(get_player_glow(), (x - 8, y - 8))
         
         screen.blit(self.surface, (x, y))
 
@@ -286,208 +349,253 @@ class DoorSprite(AdvancedSprite):
             keyhole_rect = pygame.Rect(50, 46, 4, 2)
             pygame.draw.rect(self.surface, (0, 0, 0), keyhole_rect)
 
-class AdvancedParticleSystem:
+# Particle kinds, stored as small ints in the particle arrays
+_KIND_EXPLOSION = 0
+_KIND_SPARKLE = 1
+_KIND_FIRE = 2
+
+@lru_cache(maxsize=1024)
+def get_particle_sprite(kind, color, size, alpha):
+    """Pre-rendered particle of the given kind, color, radius and alpha"""
+    particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    rgba = (*color, alpha)
+    
+    if kind == _KIND_SPARKLE:
+        # Draw sparkle as a star shape
+        center = (size, size)
+        points = []
+        for i in range(8):
+            angle = i * math.pi / 4
+            if i % 2 == 0:
+                radius = size
+            else:
+                radius = size // 2
+            x = center[0] + math.cos(angle) * radius
+            y = center[1] + math.sin(angle) * radius
+            points.append((x, y))
+        pygame.draw.polygon(particle_surf, rgba, points)
+    else:
+        # Draw regular circular particle
+        pygame.draw.circle(particle_surf, rgba, (size, size), size)
+    
+    return finish_sprite(particle_surf)
+
+class AdvancedParticleSystem(ParticlePool):
     """Professional particle system with multiple effect types"""
-    def __init__(self):
-        self.particles = []
+    # Particles live in parallel NumPy arrays (struct-of-arrays), so a frame's
+    # update is a few vectorized operations instead of a Python loop
+    _ARRAYS = ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime', 'size', 'kind', 'color')
+    
+    def __init__(self, capacity=256):
+        self.count = 0
+        for name in ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime', 'size'):
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
         self.emitters = []
     
+    def spawn(self, x, y, vx, vy, color, size, lifetime, max_lifetime, kind):
+        """Add a batch of len(vx) particles; scalar arguments apply to the whole batch"""
+        n = len(vx)
+        self._reserve(self.count + n)
+        batch = slice(self.count, self.count + n)
+        self.x[batch] = x
+        self.y[batch] = y
+        self.vx[batch] = vx
+        self.vy[batch] = vy
+        self.color[batch] = color
+        self.size[batch] = size
+        self.lifetime[batch] = lifetime
+        self.max_lifetime[batch] = max_lifetime
+        self.kind[batch] = kind
+        self.count += n
+    
     def add_explosion(self, x, y, color, count=15, size_range=(2, 6), speed_range=(50, 150)):
         """Create explosion effect"""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(*speed_range)
-            size = random.uniform(*size_range)
-            lifetime = random.uniform(0.8, 2.0)
-            
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'color': color,
-                'size': size,
-                'lifetime': lifetime,
-                'max_lifetime': lifetime,
-                'type': 'explosion'
-            }
-            self.particles.append(particle)
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        speed = np.random.uniform(*speed_range, count)
+        lifetime = np.random.uniform(0.8, 2.0, count)
+        self.spawn(x, y, np.cos(angle) * speed, np.sin(angle) * speed, color[:3],
+                   np.random.uniform(*size_range, count), lifetime, lifetime, _KIND_EXPLOSION)
     
     def add_sparkle_trail(self, x, y, color, count=8):
         """Create sparkle trail effect"""
-        for _ in range(count):
-            offset_x = random.uniform(-20, 20)
-            offset_y = random.uniform(-20, 20)
-            size = random.uniform(1, 3)
-            lifetime = random.uniform(1.0, 2.5)
-            
-            particle = {
-                'x': x + offset_x,
-                'y': y + offset_y,
-                'vx': random.uniform(-10, 10),
-                'vy': random.uniform(-30, -5),
-                'color': color,
-                'size': size,
-                'lifetime': lifetime,
-                'max_lifetime': lifetime,
-                'type': 'sparkle'
-            }
-            self.particles.append(particle)
+        lifetime = np.random.uniform(1.0, 2.5, count)
+        self.spawn(x + np.random.uniform(-20, 20, count), y + np.random.uniform(-20, 20, count),
+                   np.random.uniform(-10, 10, count), np.random.uniform(-30, -5, count), color[:3],
+                   np.random.uniform(1, 3, count), lifetime, lifetime, _KIND_SPARKLE)
     
     def add_fire_effect(self, x, y, count=5):
         """Create fire particle effect"""
-        for _ in range(count):
-            particle = {
-                'x': x + random.uniform(-5, 5),
-                'y': y,
-                'vx': random.uniform(-10, 10),
-                'vy': random.uniform(-40, -20),
-                'color': random.choice([PALETTE['particle_fire'], (255, 140, 0), (255, 200, 0)]),
-                'size': random.uniform(2, 4),
-                'lifetime': random.uniform(0.5, 1.2),
-                'max_lifetime': random.uniform(0.5, 1.2),
-                'type': 'fire'
-            }
-            self.particles.append(particle)
+        fire_colors = np.array([PALETTE['particle_fire'], (255, 140, 0), (255, 200, 0)], dtype=np.uint8)
+        self.spawn(x + np.random.uniform(-5, 5, count), y,
+                   np.random.uniform(-10, 10, count), np.random.uniform(-40, -20, count),
+                   fire_colors[np.random.randint(0, len(fire_colors), count)],
+                   np.random.uniform(2, 4, count), np.random.uniform(0.5, 1.2, count),
+                   np.random.uniform(0.5, 1.2, count), _KIND_FIRE)
     
     def add_magic_sparkle(self, x, y, count=5):
         """Create magical sparkle effect"""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(20, 60)
-            size = random.uniform(2, 4)
-            lifetime = random.uniform(1.5, 3.0)
-            
-            particle = {
-                'x': x + random.uniform(-10, 10),
-                'y': y + random.uniform(-10, 10),
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'color': PALETTE['particle_magic'],
-                'size': size,
-                'lifetime': lifetime,
-                'max_lifetime': lifetime,
-                'type': 'sparkle'
-            }
-            self.particles.append(particle)
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        speed = np.random.uniform(20, 60, count)
+        lifetime = np.random.uniform(1.5, 3.0, count)
+        self.spawn(x + np.random.uniform(-10, 10, count), y + np.random.uniform(-10, 10, count),
+                   np.cos(angle) * speed, np.sin(angle) * speed, PALETTE['particle_magic'],
+                   np.random.uniform(2, 4, count), lifetime, lifetime, _KIND_SPARKLE)
     
     def update(self, dt):
         """Update all particles"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['lifetime'] -= dt
-            
-            # Add gravity for certain particle types
-            if particle['type'] in ['explosion', 'fire']:
-                particle['vy'] += 50 * dt  # Gravity
-            
-            # Remove dead particles
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.lifetime[:n] -= dt
+        
+        # Add gravity for explosion and fire particles
+        vy = self.vy[:n]
+        vy[self.kind[:n] != _KIND_SPARKLE] += 50 * dt
+        
+        # Compact the live particles to the front of the arrays
+        alive = self.lifetime[:n] > 0
+        live_count = int(np.count_nonzero(alive))
+        if live_count < n:
+            for name in self._ARRAYS:
+                arr = getattr(self, name)
+                arr[:live_count] = arr[:n][alive]
+            self.count = live_count
     
     def draw(self, screen):
         """Draw all particles with advanced effects"""
-        for particle in self.particles:
-            alpha_ratio = particle['lifetime'] / particle['max_lifetime']
-            alpha = int(255 * alpha_ratio)
-            
-            if alpha > 0:
-                size = max(1, int(particle['size'] * alpha_ratio))
-                color = (*particle['color'][:3], min(255, alpha))
-                
-                # Create particle surface with alpha
-                particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                
-                if particle['type'] == 'sparkle':
-                    # Draw sparkle as a star shape
-                    center = (size, size)
-                    points = []
-                    for i in range(8):
-                        angle = i * math.pi / 4
-                        if i % 2 == 0:
-                            radius = size
-                        else:
-                            radius = size // 2
-                        x = center[0] + math.cos(angle) * radius
-                        y = center[1] + math.sin(angle) * radius
-                        points.append((x, y))
-                    pygame.draw.polygon(particle_surf, color, points)
-                else:
-                    # Draw regular circular particle
-                    pygame.draw.circle(particle_surf, color, (size, size), size)
-                
-                screen.blit(particle_surf, (int(particle['x'] - size), int(particle['y'] - size)))
+        n = self.count
+        if n == 0:
+            return
+        alpha_ratio = self.lifetime[:n] / self.max_lifetime[:n]
+        # Alpha is snapped to steps of 8 so the sprite cache stays small
+        alpha = (np.minimum(255, (255 * alpha_ratio).astype(np.int32)) >> 3) << 3
+        size = np.maximum(1, (self.size[:n] * alpha_ratio).astype(np.int32))
+        left = (self.x[:n] - size).astype(np.int32)
+        top = (self.y[:n] - size).astype(np.int32)
+        
+        visible = np.flatnonzero(alpha > 0)
+        colors = map(tuple, self.color[visible].tolist())
+        blit_batch(screen, [
+            (get_particle_sprite(kind, color, s, a), (px, py))
+            for kind, color, s, a, px, py in zip(self.kind[visible].tolist(), colors, size[visible].tolist(),
+                                                 alpha[visible].tolist(), left[visible].tolist(),
+                                                 top[visible].tolist())
+        ])
 
-def draw_advanced_background(screen, width, height):
-    """Draw professional gradient background with atmospheric effects"""
+# Star brightness is quantized to a few pre-rendered alpha levels
+_STAR_ALPHA_LEVELS = 8
+
+@lru_cache(maxsize=4)
+def get_background_surface(width, height):
+    """Bake the sky gradient once; returns (surface, star positions)"""
+    background = pygame.Surface((width, height))
+    if pygame.display.get_surface() is not None:
+        background = background.convert()
+    
     # Create gradient from top to bottom
     for y in range(height):
         ratio = y / height
         r = int(PALETTE['sky_top'][0] * (1 - ratio) + PALETTE['sky_bottom'][0] * ratio)
         g = int(PALETTE['sky_top'][1] * (1 - ratio) + PALETTE['sky_bottom'][1] * ratio)
         b = int(PALETTE['sky_top'][2] * (1 - ratio) + PALETTE['sky_bottom'][2] * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
-    
-    # Add atmospheric stars
-    star_positions = [(random.randint(0, width), random.randint(0, height // 2)) for _ in range(100)]
-    current_time = pygame.time.get_ticks()
+        pygame.draw.line(background, (r, g, b), (0, y), (width, y))
     
-    for i, (x, y) in enumerate(star_positions):
-        # Twinkling effect
-        twinkle = math.sin(current_time * 0.001 + i * 0.1) * 0.5 + 0.5
-        alpha = int(30 + twinkle * 70)
-        
+    # Atmospheric stars keep fixed positions and only twinkle
+    star_positions = tuple((random.randint(0, width), random.randint(0, height // 2)) for _ in range(100))
+    return background, star_positions
+
+@lru_cache(maxsize=1)
+def get_star_sprites():
+    """Star dots for each brightness level, from dim (alpha 30) to bright (alpha 100)"""
+    sprites = []
+    for level in range(_STAR_ALPHA_LEVELS):
+        alpha = int(30 + 70 * level / (_STAR_ALPHA_LEVELS - 1))
         star_surf = pygame.Surface((3, 3), pygame.SRCALPHA)
         pygame.draw.circle(star_surf, (*PALETTE['text_primary'], alpha), (1, 1), 1)
-        screen.blit(star_surf, (x, y))
+        sprites.append(finish_sprite(star_surf))
+    return tuple(sprites)
 
-def draw_advanced_ui_panel(screen, rect, title="", alpha=200, border_color=None):
-    """Draw professional UI panel with gradient and effects"""
-    # Create panel surface
-    panel_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+@lru_cache(maxsize=4)
+def get_star_phases(count):
+    """Per-star twinkle phase offsets"""
+    return np.arange(count, dtype=np.float32) * 0.1
+
+def draw_advanced_background(screen, width, height, background=None):
+    """Draw professional gradient background with atmospheric effects"""
+    # Callers may pass their own copy of the baked sky with static scenery on it
+    base, star_positions = get_background_surface(width, height)
+    screen.blit(base if background is None else background, (0, 0))
+    
+    # Twinkling effect: all star brightness levels in one vectorized pass
+    t = pygame.time.get_ticks() * 0.001
+    top = _STAR_ALPHA_LEVELS - 1
+    twinkle = np.sin(t + get_star_phases(len(star_positions))) * 0.5 + 0.5
+    levels = (twinkle * top + 0.5).astype(np.intp).tolist()
+    
+    sprites = get_star_sprites()
+    blit_batch(screen, [(sprites[level], pos) for level, pos in zip(levels, star_positions)])
+
+@lru_cache(maxsize=128)
+def get_panel_surface(width, height, alpha, border_col):
+    """Build (once per size/alpha/border) the gradient panel body"""
+    panel_surf = pygame.Surface((width, height), pygame.SRCALPHA)
     
     # Gradient background
-    for y in range(rect.height):
-        ratio = y / rect.height
-        base_color = PALETTE['ui_bg']
-        highlight_color = tuple(min(255, c + 20) for c in base_color)
+    base_color = PALETTE['ui_bg']
+    highlight_color = tuple(min(255, c + 20) for c in base_color)
+    for y in range(height):
+        ratio = y / height
         
         r = int(base_color[0] * (1 - ratio) + highlight_color[0] * ratio)
         g = int(base_color[1] * (1 - ratio) + highlight_color[1] * ratio)
         b = int(base_color[2] * (1 - ratio) + highlight_color[2] * ratio)
         
-        pygame.draw.line(panel_surf, (*((r, g, b)), alpha), (0, y), (rect.width, y))
+        pygame.draw.line(panel_surf, (*((r, g, b)), alpha), (0, y), (width, y))
     
     # Border with glow effect
+    pygame.draw.rect(panel_surf, (*border_col, alpha), (0, 0, width, height), 2)
+    pygame.draw.rect(panel_surf, (*border_col, alpha // 2), (1, 1, width - 2, height - 2), 1)
+    return panel_surf
+
+def draw_advanced_ui_panel(screen, rect, title="", alpha=200, border_color=None):
+    """Draw professional UI panel with gradient and effects"""
+    # Panel bodies are cached; only the blit happens per call
     border_col = border_color or PALETTE['ui_border']
-    pygame.draw.rect(panel_surf, (*border_col, alpha), (0, 0, rect.width, rect.height), 2)
-    pygame.draw.rect(panel_surf, (*border_col, alpha // 2), (1, 1, rect.width - 2, rect.height - 2), 1)
-    
-    screen.blit(panel_surf, rect)
+    screen.blit(get_panel_surface(rect.width, rect.height, alpha, tuple(border_col)), rect)
     
     # Title with glow effect
     if title:
-        font = pygame.font.Font(None, 24)
-        title_surf = font.render(title, True, PALETTE['ui_accent'])
+        title_surf = get_panel_title_surface(title)
         title_rect = title_surf.get_rect()
         title_rect.centerx = rect.centerx
-        title_rect.y = rect.y + 5
-        
-        # Title glow
-        glow_surf = font.render(title, True, (100, 80, 0))
-        for offset in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
-            screen.blit(glow_surf, (title_rect.x + offset[0], title_rect.y + offset[1]))
+        title_rect.y = rect.y + 4  # Sprite has a 1px glow margin
         
         screen.blit(title_surf, title_rect)
 
-def draw_circular_timer(screen, center, radius, progress, color):
-    """Draw professional circular timer with effects"""
-    # Background circle
+@lru_cache(maxsize=8)
+def get_timer_background(radius):
+    """Circular timer backing disc with its border"""
     bg_surf = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
     pygame.draw.circle(bg_surf, (*PALETTE['ui_bg'], 180), (radius + 5, radius + 5), radius + 3)
     pygame.draw.circle(bg_surf, (*PALETTE['ui_border'], 200), (radius + 5, radius + 5), radius + 3, 2)
-    screen.blit(bg_surf, (center[0] - radius - 5, center[1] - radius - 5))
+    return finish_sprite(bg_surf)
+
+@lru_cache(maxsize=8)
+def get_timer_inner(inner_radius, color):
+    """Circular timer center disc with a colored glow rim"""
+    glow_surf = pygame.Surface((inner_radius * 2 + 6, inner_radius * 2 + 6), pygame.SRCALPHA)
+    pygame.draw.circle(glow_surf, (*color, 100), (inner_radius + 3, inner_radius + 3), inner_radius + 2)
+    pygame.draw.circle(glow_surf, (*PALETTE['ui_bg'], 255), (inner_radius + 3, inner_radius + 3), inner_radius)
+    return finish_sprite(glow_surf)
+
+def draw_circular_timer(screen, center, radius, progress, color):
+    """Draw professional circular timer with effects"""
+    # Background circle
+    screen.blit(get_timer_background(radius), (center[0] - radius - 5, center[1] - radius - 5))
     
     # Progress arc
     if progress > 0:
@@ -507,7 +615,4 @@ def draw_circular_timer(screen, center, radius, progress, color):
     
     # Inner circle with glow
     inner_radius = radius - 8
-    glow_surf = pygame.Surface((inner_radius * 2 + 6, inner_radius * 2 + 6), pygame.SRCALPHA)
-    pygame.draw.circle(glow_surf, (*color, 100), (inner_radius + 3, inner_radius + 3), inner_radius + 2)
-    pygame.draw.circle(glow_surf, (*PALETTE['ui_bg'], 255), (inner_radius + 3, inner_radius + 3), inner_radius)
-    screen.blit(glow_surf, (center[0] - inner_radius - 3, center[1] - inner_radius - 3))
+    screen.blit(get_timer_inner(inner_radius, tuple(color)), (center[0] - inner_radius - 3, center[1] - inner_radius - 3))
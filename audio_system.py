@@ -5,17 +5,31 @@ Immersive sound design with contextual audio
 """
 
 import pygame
-import math
 import random
+import numpy as np
+from functools import lru_cache
 from typing import Dict, Optional
 
+# Clips of the same length share one read-only time axis
+@lru_cache(maxsize=None)
+def sample_times(duration: float, sample_rate: int = 44100) -> np.ndarray:
+    """Timestamps of every sample in a clip, for vectorized synthesis"""
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    t.flags.writeable = False
+    return t
+
 class AudioSystem:
     """Manages all game audio with dynamic mixing"""
     
     def __init__(self):
         # Initialize mixer with high quality settings
         pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
-        pygame.mixer.init()
+        try:
+            pygame.mixer.init()
+            self.enabled = True
+        except pygame.error:
+            # No audio device; callers check enabled before doing any sound work
+            self.enabled = False
         
         self.sounds = {}
         self.music_volume = 0.7
@@ -24,7 +38,8 @@ class AudioSystem:
         self.ambient_sounds = {}
         
         # Create procedural sounds
-        self.create_procedural_sounds()
+        if self.enabled:
+            self.create_procedural_sounds()
     
     def create_procedural_sounds(self):
         """Create sounds procedurally using pygame"""
@@ -69,154 +84,101 @@ class AudioSystem:
         level_complete = pygame.sndarray.make_sound(self.generate_level_complete())
         self.sounds['level_complete'] = level_complete
     
+    @staticmethod
+    def to_stereo_pcm(wave: np.ndarray) -> np.ndarray:
+        """Duplicate a mono [-1, 1] wave into both channels as 16-bit samples"""
+        return (np.column_stack((wave, wave)) * 32767).astype('int16')
+    
     def generate_wave(self, frequency: float, duration: float, sample_rate: int = 44100, 
                      wave_type: str = 'sine', amplitude: float = 0.5):
         """Generate a basic waveform"""
-        try:
-            import numpy as np
-            
-            frames = int(duration * sample_rate)
-            arr = np.zeros((frames, 2))
-            
-            for i in range(frames):
-                t = float(i) / sample_rate
-                
-                if wave_type == 'sine':
-                    wave = amplitude * math.sin(2 * math.pi * frequency * t)
-                elif wave_type == 'square':
-                    wave = amplitude * (1 if math.sin(2 * math.pi * frequency * t) > 0 else -1)
-                elif wave_type == 'sawtooth':
-                    wave = amplitude * (2 * (t * frequency - math.floor(t * frequency + 0.5)))
-                elif wave_type == 'triangle':
-                    wave = amplitude * (2 * abs(2 * (t * frequency - math.floor(t * frequency + 0.5))) - 1)
-                else:
-                    wave = 0
-                
-                # Apply envelope (fade in/out)
-                envelope = 1.0
-                fade_frames = int(0.01 * sample_rate)  # 10ms fade
-                if i < fade_frames:
-                    envelope = i / fade_frames
-                elif i > frames - fade_frames:
-                    envelope = (frames - i) / fade_frames
-                
-                wave *= envelope
-                arr[i] = [wave, wave]
-            
-            return (arr * 32767).astype('int16')
-        except ImportError:
-            # Fallback: return empty sound if numpy is not available
-            return pygame.sndarray.make_sound([[0, 0]])
+        t = sample_times(duration, sample_rate)
+        frames = len(t)
+        phase = t * frequency
+        
+        if wave_type == 'sine':
+            wave = amplitude * np.sin(2 * np.pi * frequency * t)
+        elif wave_type == 'square':
+            wave = amplitude * np.where(np.sin(2 * np.pi * frequency * t) > 0, 1, -1)
+        elif wave_type == 'sawtooth':
+            wave = amplitude * (2 * (phase - np.floor(phase + 0.5)))
+        elif wave_type == 'triangle':
+            wave = amplitude * (2 * np.abs(2 * (phase - np.floor(phase + 0.5))) - 1)
+        else:
+            wave = np.zeros(frames)
+        
+        # Apply envelope (fade in/out)
+        fade_frames = int(0.01 * sample_rate)  # 10ms fade
+        i = np.arange(frames)
+        envelope = np.ones(frames)
+        fade_out = i > frames - fade_frames
+        envelope[fade_out] = (frames - i[fade_out]) / fade_frames
+        fade_in = i < fade_frames
+        envelope[fade_in] = i[fade_in] / fade_frames
+        
+        return self.to_stereo_pcm(wave * envelope)
     
     def generate_footstep(self):
         """Generate a footstep sound"""
-        try:
-            import numpy as np
-            
-            duration = 0.15
-            sample_rate = 44100
-            frames = int(duration * sample_rate)
-            arr = np.zeros((frames, 2))
-            
-            for i in range(frames):
-                t = float(i) / sample_rate
-                
-                # Low frequency thump
-                thump = 0.3 * math.sin(2 * math.pi * 80 * t) * math.exp(-t * 10)
-                
-                # High frequency scratch (noise)
-                scratch = 0.1 * (random.random() - 0.5) * math.exp(-t * 15)
-                
-                wave = thump + scratch
-                arr[i] = [wave, wave]
-            
-            return (arr * 32767).astype('int16')
-        except ImportError:
-            return pygame.sndarray.make_sound([[0, 0]])
+        t = sample_times(0.15)
+        
+        # Low frequency thump
+        thump = 0.3 * np.sin(2 * np.pi * 80 * t) * np.exp(-t * 10)
+        
+        # High frequency scratch (noise)
+        scratch = 0.1 * (np.random.random(len(t)) - 0.5) * np.exp(-t * 15)
+        
+        return self.to_stereo_pcm(thump + scratch)
     
     def generate_key_pickup(self):
         """Generate a magical key pickup sound"""
         # Rising chime with sparkle
         base_freq = 440  # A4
         harmonics = [1, 1.5, 2, 3]
-        duration = 0.5
-        
-        import numpy as np
-        sample_rate = 44100
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        
-        for i in range(frames):
-            t = float(i) / sample_rate
-            wave = 0
-            
-            for harmonic in harmonics:
-                freq = base_freq * harmonic
-                amplitude = 0.2 / harmonic
-                wave += amplitude * math.sin(2 * math.pi * freq * t)
-            
-            # Rising pitch effect
-            pitch_mod = 1 + 0.5 * t
-            wave *= math.exp(-t * 2)  # Decay
-            
-            # Add sparkle (high frequency modulation)
-            sparkle = 0.1 * math.sin(2 * math.pi * 2000 * t) * math.exp(-t * 5)
-            wave += sparkle
-            
-            arr[i] = [wave, wave]
-        
-        return (arr * 32767).astype('int16')
+        t = sample_times(0.5)
+        
+        wave = np.zeros(len(t))
+        for harmonic in harmonics:
+            freq = base_freq * harmonic
+            amplitude = 0.2 / harmonic
+            wave += amplitude * np.sin(2 * np.pi * freq * t)
+        
+        wave *= np.exp(-t * 2)  # Decay
+        
+        # Add sparkle (high frequency modulation)
+        wave += 0.1 * np.sin(2 * np.pi * 2000 * t) * np.exp(-t * 5)
+        
+        return self.to_stereo_pcm(wave)
     
     def generate_door_open(self):
         """Generate a wooden door opening sound"""
-        import numpy as np
-        
         duration = 0.8
-        sample_rate = 44100
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        
-        for i in range(frames):
-            t = float(i) / sample_rate
-            
-            # Creaking sound (low frequency with noise)
-            creak_freq = 150 + 50 * math.sin(2 * math.pi * 3 * t)
-            creak = 0.3 * math.sin(2 * math.pi * creak_freq * t)
-            
-            # Wood friction noise
-            noise = 0.2 * (random.random() - 0.5)
-            
-            # Combine and apply envelope
-            wave = (creak + noise) * (1 - t / duration)
-            arr[i] = [wave, wave]
-        
-        return (arr * 32767).astype('int16')
+        t = sample_times(duration)
+        
+        # Creaking sound (low frequency with noise)
+        creak_freq = 150 + 50 * np.sin(2 * np.pi * 3 * t)
+        creak = 0.3 * np.sin(2 * np.pi * creak_freq * t)
+        
+        # Wood friction noise
+        noise = 0.2 * (np.random.random(len(t)) - 0.5)
+        
+        # Combine and apply envelope
+        return self.to_stereo_pcm((creak + noise) * (1 - t / duration))
     
     def generate_success_chime(self):
         """Generate a success chime"""
         # Major chord progression
         notes = [261.63, 329.63, 392.00, 523.25]  # C, E, G, C
-        duration = 1.0
-        
-        import numpy as np
-        sample_rate = 44100
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        
-        for i in range(frames):
-            t = float(i) / sample_rate
-            wave = 0
-            
-            for j, freq in enumerate(notes):
-                delay = j * 0.1  # Stagger notes
-                if t > delay:
-                    note_t = t - delay
-                    amplitude = 0.25 * math.exp(-note_t * 2)
-                    wave += amplitude * math.sin(2 * math.pi * freq * note_t)
-            
-            arr[i] = [wave, wave]
-        
-        return (arr * 32767).astype('int16')
+        t = sample_times(1.0)
+        
+        wave = np.zeros(len(t))
+        for j, freq in enumerate(notes):
+            delay = j * 0.1  # Stagger notes
+            note_t = t - delay
+            amplitude = 0.25 * np.exp(-note_t * 2)
+            wave += np.where(t > delay, amplitude * np.sin(2 * np.pi * freq * note_t), 0)
+        
+        return self.to_stereo_pcm(wave)
     
     def generate_orb_collect(self):
         """Generate orb collection sound"""
@@ -224,12 +186,8 @@ class AudioSystem:
     
     def generate_heartbeat(self):
         """Generate heartbeat sound"""
-        import numpy as np
-        
-        duration = 0.6
-        sample_rate = 44100
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        t = sample_times(0.6)
+        wave = np.zeros(len(t))
         
         # Two beats: lub-dub
         beat1_start = 0.0
@@ -237,23 +195,17 @@ class AudioSystem:
         beat2_start = 0.2
         beat2_duration = 0.1
         
-        for i in range(frames):
-            t = float(i) / sample_rate
-            wave = 0
-            
-            # First beat (lub)
-            if beat1_start <= t <= beat1_start + beat1_duration:
-                beat_t = (t - beat1_start) / beat1_duration
-                wave += 0.5 * math.sin(2 * math.pi * 60 * beat_t) * (1 - beat_t)
-            
-            # Second beat (dub)
-            if beat2_start <= t <= beat2_start + beat2_duration:
-                beat_t = (t - beat2_start) / beat2_duration
-                wave += 0.4 * math.sin(2 * math.pi * 80 * beat_t) * (1 - beat_t)
-            
-            arr[i] = [wave, wave]
-        
-        return (arr * 32767).astype('int16')
+        # First beat (lub)
+        beat_t = (t - beat1_start) / beat1_duration
+        in_beat = (beat1_start <= t) & (t <= beat1_start + beat1_duration)
+        wave += np.where(in_beat, 0.5 * np.sin(2 * np.pi * 60 * beat_t) * (1 - beat_t), 0)
+        
+        # Second beat (dub)
+        beat_t = (t - beat2_start) / beat2_duration
+        in_beat = (beat2_start <= t) & (t <= beat2_start + beat2_duration)
+        wave += np.where(in_beat, 0.4 * np.sin(2 * np.pi * 80 * beat_t) * (1 - beat_t), 0)
+        
+        return self.to_stereo_pcm(wave)
     
     def generate_ambient_hum(self):
         """Generate ambient background hum"""
@@ -270,30 +222,20 @@ class AudioSystem:
     def generate_level_complete(self):
         """Generate level complete fanfare"""
         # Ascending scale
-        notes = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25]
+        notes = np.array([261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25])
         duration = 1.5
-        
-        import numpy as np
-        sample_rate = 44100
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        t = sample_times(duration)
         
         note_duration = duration / len(notes)
+        note_index = (t / note_duration).astype(int)
+        playing = note_index < len(notes)
+        note_index = np.minimum(note_index, len(notes) - 1)
+        
+        note_t = t - note_index * note_duration
+        amplitude = 0.3 * np.exp(-note_t * 3)
+        wave = np.where(playing, amplitude * np.sin(2 * np.pi * notes[note_index] * note_t), 0)
         
-        for i in range(frames):
-            t = float(i) / sample_rate
-            wave = 0
-            
-            note_index = int(t / note_duration)
-            if note_index < len(notes):
-                note_t = t - note_index * note_duration
-                freq = notes[note_index]
-                amplitude = 0.3 * math.exp(-note_t * 3)
-                wave = amplitude * math.sin(2 * math.pi * freq * note_t)
-            
-            arr[i] = [wave, wave]
-        
-        return (arr * 32767).astype('int16')
+        return self.to_stereo_pcm(wave)
     
     def play_sound(self, sound_name: str, volume: float = 1.0):
         """Play a sound effect"""
@@ -322,22 +264,25 @@ class AudioSystem:
         self.music_volume = max(0.0, min(1.0, music_vol))
         self.sfx_volume = max(0.0, min(1.0, sfx_vol))
     
-    def play_contextual_sound(self, context: str, **kwargs):
+    def play_contextual_sound(self, context: str, time_remaining: float = 10, **kwargs):
         """Play sound based on game context"""
+        # time_remaining is positional so per-frame callers don't build a kwargs dict
+        if not self.enabled:
+            return
+        
         if context == "player_move":
             if random.random() < 0.1:  # 10% chance per frame
                 self.play_sound('footstep', 0.3)
         
         elif context == "timer_low":
-            time_remaining = kwargs.get('time_remaining', 10)
             if time_remaining < 3 and int(time_remaining * 10) % 10 == 0:
                 self.play_sound('timer_warning', 0.6)
         
         elif context == "heartbeat":
-            time_remaining = kwargs.get('time_remaining', 10)
             if time_remaining < 5:
                 self.play_sound('heartbeat', 0.4)
     
     def cleanup(self):
         """Clean up audio resources"""
-        pygame.mixer.quit()
+        if self.enabled:
+            pygame.mixer.quit()
@@ -7,7 +7,10 @@ Realistic sprites, modern UI, and immersive visual effects
 import pygame
 import math
 import random
+import numpy as np
+from functools import lru_cache
 from typing import Tuple, List
+from render_utils import ParticlePool, blit_batch
 
 # Enhanced Color Palette
 PALETTE = {
@@ -53,92 +56,121 @@ PALETTE = {
     'fire_yellow': (255, 200, 50)
 }
 
-class ParticleSystem:
+@lru_cache(maxsize=1024)
+def get_sparkle_sprite(color: Tuple[int, int, int], size: int, alpha: int):
+    """Sparkle dot of the given radius and alpha, drawn once and reused"""
+    particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(particle_surf, (*color, alpha), (size, size), size)
+    return particle_surf
+
+@lru_cache(maxsize=128)
+def get_glow_disc(radius: int, color: Tuple[int, int, int]):
+    """Opaque glow disc, faded per frame with set_alpha so every alpha shares one surface"""
+    glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(glow_surf, (*color, 255), (radius, radius), radius)
+    return glow_surf
+
+class ParticleSystem(ParticlePool):
     """Advanced particle system for visual effects"""
-    
-    def __init__(self):
-        self.particles = []
+    # Particles are stored as parallel NumPy arrays (struct-of-arrays) so the
+    # per-frame update is a handful of vectorized operations. The arrays are a
+    # pool: live particles are packed into [:count] and new ones are written
+    # at the cursor, so spawning doesn't reallocate
+    _ARRAYS = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'size', 'radius', 'max_radius', 'glow', 'color')
+    
+    def __init__(self, capacity: int = 256):
+        self.count = 0
+        for name in ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'size', 'radius', 'max_radius'):
+            setattr(self, name, np.zeros(capacity, dtype=np.float32))
+        self.glow = np.zeros(capacity, dtype=bool)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+    
+    def _append(self, **columns):
+        """Write a batch of particles at the cursor; missing columns are zeroed"""
+        n = len(columns['life'])
+        self._reserve(self.count + n)
+        batch = slice(self.count, self.count + n)
+        for name in self._ARRAYS:
+            getattr(self, name)[batch] = columns.get(name, 0)
+        self.count += n
     
     def add_sparkle(self, x: int, y: int, color: Tuple[int, int, int] = None):
         """Add sparkle particles around a point"""
         if color is None:
             color = PALETTE['sparkle_gold']
         
-        for _ in range(random.randint(3, 6)):
-            particle = {
-                'x': x + random.randint(-10, 10),
-                'y': y + random.randint(-10, 10),
-                'vx': random.uniform(-50, 50),
-                'vy': random.uniform(-50, 50),
-                'life': random.uniform(0.5, 1.5),
-                'max_life': random.uniform(0.5, 1.5),
-                'color': color,
-                'size': random.randint(2, 4)
-            }
-            self.particles.append(particle)
+        count = random.randint(3, 6)
+        self._append(
+            x=x + np.random.randint(-10, 11, count),
+            y=y + np.random.randint(-10, 11, count),
+            vx=np.random.uniform(-50, 50, count),
+            vy=np.random.uniform(-50, 50, count),
+            life=np.random.uniform(0.5, 1.5, count),
+            max_life=np.random.uniform(0.5, 1.5, count),
+            color=color[:3],
+            size=np.random.randint(2, 5, count),
+        )
     
     def add_glow_pulse(self, x: int, y: int, radius: int, color: Tuple[int, int, int]):
         """Add a pulsing glow effect"""
-        particle = {
-            'x': x,
-            'y': y,
-            'radius': radius,
-            'max_radius': radius + 20,
-            'life': 1.0,
-            'max_life': 1.0,
-            'color': color,
-            'type': 'glow'
-        }
-        self.particles.append(particle)
+        self._append(x=(x,), y=(y,), radius=(radius,), max_radius=(radius + 20,),
+                     life=(1.0,), max_life=(1.0,), color=color[:3], glow=(True,))
     
     def update(self, dt: float):
         """Update all particles"""
-        for particle in self.particles[:]:
-            particle['life'] -= dt
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                continue
-            
-            if particle.get('type') == 'glow':
-                # Pulsing glow effect
-                life_ratio = particle['life'] / particle['max_life']
-                particle['radius'] = particle['max_radius'] * (0.5 + 0.5 * math.sin(particle['life'] * 8))
-            else:
-                # Regular particle movement
-                particle['x'] += particle['vx'] * dt
-                particle['y'] += particle['vy'] * dt
-                particle['vy'] += 100 * dt  # Gravity
+        n = self.count
+        if n == 0:
+            return
+        life = self.life[:n]
+        life -= dt
+        
+        # Compact the live particles to the front of the pool
+        alive = life > 0
+        live_count = int(np.count_nonzero(alive))
+        if live_count < n:
+            for name in self._ARRAYS:
+                arr = getattr(self, name)
+                arr[:live_count] = arr[:n][alive]
+            self.count = n = live_count
+        
+        # Pulsing glow effect
+        glow = self.glow[:n]
+        self.radius[:n][glow] = self.max_radius[:n][glow] * (0.5 + 0.5 * np.sin(self.life[:n][glow] * 8))
+        
+        # Regular particle movement
+        moving = ~glow
+        self.x[:n][moving] += self.vx[:n][moving] * dt
+        self.y[:n][moving] += self.vy[:n][moving] * dt
+        self.vy[:n][moving] += 100 * dt  # Gravity
     
     def draw(self, screen):
         """Draw all particles"""
-        for particle in self.particles:
-            if particle['life'] <= 0:
+        n = self.count
+        if n == 0:
+            return
+        life_ratio = self.life[:n] / self.max_life[:n]
+        alpha = np.clip((255 * life_ratio).astype(np.int32), 0, 255)
+        glow = self.glow[:n]
+        
+        # Draw sparkle particles from cached sprites
+        size = (self.size[:n] * life_ratio).astype(np.int32)
+        sparkles = np.flatnonzero(~glow & (size > 0))
+        size = size[sparkles]
+        colors = map(tuple, self.color[sparkles].tolist())
+        blit_batch(screen, [
+            (get_sparkle_sprite(color, s, a), (px - s, py - s))
+            for color, s, a, px, py in zip(colors, size.tolist(), alpha[sparkles].tolist(),
+                                           self.x[sparkles].tolist(), self.y[sparkles].tolist())
+        ])
+        
+        # Draw glow effect
+        for i in np.flatnonzero(glow).tolist():
+            radius = int(self.radius[i])
+            if radius <= 0:
                 continue
-            
-            life_ratio = particle['life'] / particle['max_life']
-            alpha = int(255 * life_ratio)
-            
-            if particle.get('type') == 'glow':
-                # Draw glow effect
-                glow_surf = pygame.Surface((particle['radius'] * 2, particle['radius'] * 2), pygame.SRCALPHA)
-                # Ensure alpha is within valid range
-                safe_alpha = max(0, min(255, alpha // 3))
-                color_with_alpha = (particle['color'][0], particle['color'][1], particle['color'][2], safe_alpha)
-                pygame.draw.circle(glow_surf, color_with_alpha, 
-                                 (particle['radius'], particle['radius']), particle['radius'])
-                screen.blit(glow_surf, (particle['x'] - particle['radius'], particle['y'] - particle['radius']))
-            else:
-                # Draw sparkle particle
-                size = int(particle['size'] * life_ratio)
-                if size > 0:
-                    # Ensure alpha is within valid range and color is RGB tuple
-                    safe_alpha = max(0, min(255, alpha))
-                    base_color = particle['color'][:3]  # Ensure only RGB components
-                    color_with_alpha = (base_color[0], base_color[1], base_color[2], safe_alpha)
-                    particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(particle_surf, color_with_alpha, (size, size), size)
-                    screen.blit(particle_surf, (particle['x'] - size, particle['y'] - size))
+            glow_surf = get_glow_disc(radius, tuple(self.color[i].tolist()))
+            glow_surf.set_alpha(int(alpha[i]) // 3)
+            screen.blit(glow_surf, (float(self.x[i]) - radius, float(self.y[i]) - radius))
 
 def draw_realistic_player(screen, x: int, y: int, width: int, height: int):
     """Draw a realistic player character"""
@@ -249,30 +281,58 @@ def draw_realistic_door(screen, x: int, y: int, width: int, height: int, is_open
     pygame.draw.rect(shadow_surf, (*PALETTE['shadow'], 100), (0, 0, width, height))
     screen.blit(shadow_surf, (x + 2, y + 2))
 
+def fill_vertical_gradient(surface, color1, color2, alpha: int = None):
+    """Fill a surface with a top-to-bottom gradient in one array write"""
+    width, height = surface.get_size()
+    ratio = (np.arange(height) / height)[:, None]
+    rows = (np.array(color1) * (1 - ratio) + np.array(color2) * ratio).astype(np.uint8)
+    pygame.surfarray.blit_array(surface, np.broadcast_to(rows, (width, height, 3)))
+    
+    if alpha is not None:
+        surface_alpha = pygame.surfarray.pixels_alpha(surface)
+        surface_alpha[:] = alpha
+        del surface_alpha  # unlock the surface
+
+@lru_cache(maxsize=32)
+def get_panel_column(height: int, alpha: int):
+    """One-pixel-wide strip of the panel gradient; every panel width stretches it"""
+    column = pygame.Surface((1, height), pygame.SRCALPHA)
+    fill_vertical_gradient(column, PALETTE['ui_panel'], PALETTE['bg_secondary'], alpha)
+    return column
+
+def _fill_ring(surface, color, inset: int):
+    """Fill a one-pixel outline inset pixels in from the surface edge"""
+    width, height = surface.get_size()
+    surface.fill(color, (inset, inset, width - 2 * inset, 1))
+    surface.fill(color, (inset, height - 1 - inset, width - 2 * inset, 1))
+    surface.fill(color, (inset, inset, 1, height - 2 * inset))
+    surface.fill(color, (width - 1 - inset, inset, 1, height - 2 * inset))
+
+@lru_cache(maxsize=32)
+def get_modern_panel(width: int, height: int, alpha: int):
+    """Gradient body, border and highlight of a panel, baked once per size/alpha"""
+    # Stretch the shared gradient strip, then outline with plain fills
+    panel_surf = pygame.transform.scale(get_panel_column(height, alpha), (width, height))
+    
+    # Border (outer ring) and subtle inner highlight (drawn opaque, the way it
+    # always came out on the screen)
+    _fill_ring(panel_surf, PALETTE['ui_border'], 0)
+    _fill_ring(panel_surf, PALETTE['ui_accent'], 1)
+    return panel_surf
+
 def draw_modern_ui_panel(screen, rect: pygame.Rect, alpha: int = 200):
     """Draw a modern UI panel with gradient and border"""
-    # Create gradient background
-    panel_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    
-    for y in range(rect.height):
-        gradient_ratio = y / rect.height
-        color1 = PALETTE['ui_panel']
-        color2 = PALETTE['bg_secondary']
-        
-        r = int(color1[0] * (1 - gradient_ratio) + color2[0] * gradient_ratio)
-        g = int(color1[1] * (1 - gradient_ratio) + color2[1] * gradient_ratio)
-        b = int(color1[2] * (1 - gradient_ratio) + color2[2] * gradient_ratio)
-        
-        pygame.draw.line(panel_surf, (r, g, b, alpha), (0, y), (rect.width, y))
-    
-    screen.blit(panel_surf, rect)
-    
-    # Border
-    pygame.draw.rect(screen, PALETTE['ui_border'], rect, 2)
-    
-    # Subtle inner highlight
-    inner_rect = pygame.Rect(rect.x + 1, rect.y + 1, rect.width - 2, rect.height - 2)
-    pygame.draw.rect(screen, (*PALETTE['ui_accent'], 30), inner_rect, 1)
+    screen.blit(get_modern_panel(rect.width, rect.height, alpha), rect)
+
+_timer_font = None
+
+@lru_cache(maxsize=128)
+def get_timer_text(time_text: str):
+    """Timer label, rendered once per distinct value (there are only ~100)"""
+    global _timer_font
+    if _timer_font is None:
+        _timer_font = pygame.font.Font(None, 24)
+    return _timer_font.render(time_text, True, PALETTE['text_primary'])
 
 def draw_circular_timer(screen, center_x: int, center_y: int, radius: int, 
                        time_remaining: float, max_time: float):
@@ -309,16 +369,23 @@ def draw_circular_timer(screen, center_x: int, center_y: int, radius: int,
     pygame.draw.circle(screen, PALETTE['bg_primary'], (center_x, center_y), radius - 5)
     
     # Time text
-    font = pygame.font.Font(None, 24)
-    time_text = f"{time_remaining:.1f}s"
-    text_surface = font.render(time_text, True, PALETTE['text_primary'])
+    text_surface = get_timer_text(f"{time_remaining:.1f}s")
     text_rect = text_surface.get_rect(center=(center_x, center_y))
     screen.blit(text_surface, text_rect)
 
-def draw_lesson_panel(screen, lesson_text: str, x: int, y: int, width: int):
-    """Draw a beautiful lesson panel with the real-life wisdom"""
-    # Calculate panel height based on text
-    font = pygame.font.Font(None, 28)
+_lesson_fonts = None
+
+def get_lesson_fonts():
+    """(body, title) fonts for the lesson panel, created on first use"""
+    global _lesson_fonts
+    if _lesson_fonts is None:
+        _lesson_fonts = (pygame.font.Font(None, 28), pygame.font.Font(None, 32))
+    return _lesson_fonts
+
+@lru_cache(maxsize=16)
+def wrap_lesson_text(lesson_text: str, width: int):
+    """Word-wrap a lesson and render its lines; only redone when the text changes"""
+    font = get_lesson_fonts()[0]
     words = lesson_text.split()
     lines = []
     current_line = ""
@@ -338,7 +405,19 @@ def draw_lesson_panel(screen, lesson_text: str, x: int, y: int, width: int):
     if current_line:
         lines.append(current_line.strip())
     
-    panel_height = len(lines) * 35 + 40
+    return tuple(font.render(line, True, PALETTE['text_primary']) for line in lines)
+
+@lru_cache(maxsize=1)
+def get_lesson_title():
+    """The "Life Lesson" heading, rendered once"""
+    return get_lesson_fonts()[1].render("Life Lesson", True, PALETTE['ui_accent'])
+
+def draw_lesson_panel(screen, lesson_text: str, x: int, y: int, width: int):
+    """Draw a beautiful lesson panel with the real-life wisdom"""
+    # Calculate panel height based on text
+    line_surfaces = wrap_lesson_text(lesson_text, width)
+    
+    panel_height = len(line_surfaces) * 35 + 40
     panel_rect = pygame.Rect(x, y, width, panel_height)
     
     # Draw modern panel
@@ -350,33 +429,31 @@ def draw_lesson_panel(screen, lesson_text: str, x: int, y: int, width: int):
     pygame.draw.circle(screen, PALETTE['text_primary'], icon_center, 8)
     
     # Draw lesson text
-    title_font = pygame.font.Font(None, 32)
-    title_surface = title_font.render("Life Lesson", True, PALETTE['ui_accent'])
-    screen.blit(title_surface, (x + 50, y + 10))
+    blit_list = [(get_lesson_title(), (x + 50, y + 10))]
     
     # Draw lesson content
-    for i, line in enumerate(lines):
-        line_surface = font.render(line, True, PALETTE['text_primary'])
-        screen.blit(line_surface, (x + 20, y + 45 + i * 35))
+    for i, line_surface in enumerate(line_surfaces):
+        blit_list.append((line_surface, (x + 20, y + 45 + i * 35)))
+    blit_batch(screen, blit_list)
 
-def create_background_pattern(screen):
-    """Create a subtle background pattern"""
-    width, height = screen.get_size()
+@lru_cache(maxsize=4)
+def get_background_pattern(width: int, height: int):
+    """Gradient and grid background, baked once per screen size"""
+    surface = pygame.Surface((width, height))
     
     # Gradient background
-    for y in range(height):
-        gradient_ratio = y / height
-        color1 = PALETTE['bg_primary']
-        color2 = PALETTE['bg_secondary']
-        
-        r = int(color1[0] * (1 - gradient_ratio) + color2[0] * gradient_ratio)
-        g = int(color1[1] * (1 - gradient_ratio) + color2[1] * gradient_ratio)
-        b = int(color1[2] * (1 - gradient_ratio) + color2[2] * gradient_ratio)
-        
-        pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
+    fill_vertical_gradient(surface, PALETTE['bg_primary'], PALETTE['bg_secondary'])
     
     # Subtle grid pattern
     for x in range(0, width, 50):
-        pygame.draw.line(screen, (*PALETTE['ui_border'], 20), (x, 0), (x, height))
+        pygame.draw.line(surface, (*PALETTE['ui_border'], 20), (x, 0), (x, height))
     for y in range(0, height, 50):
-        pygame.draw.line(screen, (*PALETTE['ui_border'], 20), (0, y), (width, y))
+        pygame.draw.line(surface, (*PALETTE['ui_border'], 20), (0, y), (width, y))
+    
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+def create_background_pattern(screen):
+    """Create a subtle background pattern"""
+    screen.blit(get_background_pattern(*screen.get_size()), (0, 0))
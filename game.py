@@ -11,17 +11,42 @@ import pygame
 import json
 import math
 import random
+import time
+import numpy as np
+from functools import lru_cache
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
+from audio_system import sample_times
+from render_utils import RedrawGate, blit_batch
 
 # Initialize Pygame
+# A larger mixer buffer lets SDL's audio thread ride out slow frames without crackling
+pygame.mixer.pre_init(buffer=2048)
 pygame.init()
 
 # Constants
 WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 768
 FPS = 60
+IDLE_FPS = 15
+UPDATE_STEP = 1 / FPS
+# Longest stretch of simulation caught up after a stall
+MAX_FRAME_TIME = 0.25
+# Video drivers without a renderer to scale or vsync with
+HEADLESS_DRIVERS = ('dummy', 'offscreen')
+MESSAGE_CACHE_SIZE = 16
+# Rate the synthesized sound effects are generated at
+SOUND_SAMPLE_RATE = 22050
+SCREEN_RECT = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+# Item glows reach at most this far past the item's rect
+ITEM_GLOW_MARGIN = 10
+# Below this many items a plain colliderect loop beats NumPy's per-call overhead
+VECTOR_ITEM_THRESHOLD = 32
+# High-volume input the game never reads; window and focus events still come through
+IGNORED_EVENTS = [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+                  pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING, pygame.JOYAXISMOTION,
+                  pygame.FINGERMOTION]
 LIFE_DURATION = 10.0  # 10 seconds per life
 
 # Colors
@@ -50,6 +75,158 @@ COLORS = {
     'time_crystal': (100, 200, 255)
 }
 
+# Movement keys, looked up once instead of through the pygame module every frame
+_K_LEFT, _K_A, _K_RIGHT, _K_D, _K_UP, _K_W, _K_DOWN, _K_S = (
+    pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d, pygame.K_UP, pygame.K_w, pygame.K_DOWN, pygame.K_s)
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> pygame.font.Font:
+    """Shared default font of the given size, created on first use"""
+    return pygame.font.Font(None, size)
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a cached surface to the display's pixel format so blits take SDL's fast path.
+    
+    Lazily built caches can run before set_mode, in which case the surface is kept as is.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+@lru_cache(maxsize=32)
+def layout_wrapped_text(text: str, max_width: int, font: pygame.font.Font, color,
+                        center: bool = False) -> Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]:
+    """Word-wrap text once into rendered lines with their offsets from the block's top-left"""
+    words = text.split(' ')
+    lines = []
+    current_line = []
+    
+    # font.size measures without rasterizing, so only the final lines get rendered
+    for word in words:
+        test_line = ' '.join(current_line + [word])
+        
+        if font.size(test_line)[0] <= max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+            else:
+                lines.append(word)
+    
+    if current_line:
+        lines.append(' '.join(current_line))
+    
+    line_height = font.get_height() + 5
+    layout = []
+    for i, line in enumerate(lines):
+        line_surface = to_display_format(font.render(line, True, color))
+        # Center each line within the max_width
+        line_x = (max_width - line_surface.get_width()) // 2 if center else 0
+        layout.append((line_surface, (line_x, i * line_height)))
+    return tuple(layout)
+
+def centered_rect(width: int, height: int) -> pygame.Rect:
+    """Rect of the given size centred in the window"""
+    return pygame.Rect((WINDOW_WIDTH - width) // 2, (WINDOW_HEIGHT - height) // 2, width, height)
+
+@lru_cache(maxsize=None)
+def get_glow_disc(radius: int, color: Tuple[int, int, int, int]) -> pygame.Surface:
+    """Translucent filled circle, the soft light used around torches and revealed items"""
+    glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(glow_surface, color, (radius, radius), radius)
+    return to_display_format(glow_surface)
+
+@lru_cache(maxsize=None)
+def get_window_shade(color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """Window-sized translucent fill laid over the scene behind overlays"""
+    shade = to_display_format(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+    shade.fill(color)
+    shade.set_alpha(alpha)
+    return shade
+
+@lru_cache(maxsize=128)
+def render_text(text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Antialiased text surface, rendered once per distinct string"""
+    return to_display_format(get_font(size).render(text, True, color))
+
+# One period of sine sampled at 256 steps, for per-frame animation wobble
+_SIN_LUT = np.sin(np.linspace(0, 2 * math.pi, 256, endpoint=False)).tolist()
+_SIN_LUT_SCALE = 256 / (2 * math.pi)
+
+def fast_sin(x: float) -> float:
+    """Table lookup sine, accurate to about 0.025 which is plenty for animation"""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & 255]
+
+# Synthesized sound effects, built on first use and replayed afterwards
+_SOUND_CACHE: Dict[str, pygame.mixer.Sound] = {}
+# Without an audio device there is nothing to build or play
+AUDIO_ENABLED = pygame.mixer.get_init() is not None
+
+def load_cached_sound(name: str, build, *args, volume: float = 1.0) -> Optional[pygame.mixer.Sound]:
+    """Synthesize a sound into the cache if it isn't there yet"""
+    if not AUDIO_ENABLED:
+        return None
+    sound = _SOUND_CACHE.get(name)
+    if sound is None:
+        try:
+            sound = pygame.mixer.Sound(buffer=build(*args))
+        except pygame.error:
+            return None  # No audio device
+        sound.set_volume(volume)
+        _SOUND_CACHE[name] = sound
+    return sound
+
+def play_cached_sound(name: str, build, *args, volume: float = 1.0):
+    """Play a synthesized sound, generating its samples only the first time"""
+    sound = load_cached_sound(name, build, *args, volume=volume)
+    if sound is not None:
+        sound.play()
+
+# Decay envelopes are shared by every partial and sound of the same length
+@lru_cache(maxsize=None)
+def _decay(duration: float, rate: float) -> np.ndarray:
+    """exp(-t * rate) envelope over a clip of the given length"""
+    envelope = np.exp(-sample_times(duration, SOUND_SAMPLE_RATE) * rate)
+    envelope.flags.writeable = False
+    return envelope
+
+def _tone(amplitude: float, freq, duration: float, decay: float) -> np.ndarray:
+    """Decaying sine, truncated to whole sample values like int() did per sample"""
+    t = sample_times(duration, SOUND_SAMPLE_RATE)
+    return np.trunc(amplitude * np.sin(2 * np.pi * freq * t) * _decay(duration, decay))
+
+# (amplitude, frequency, decay) partials for each pickup sound
+_COLLECT_PARTIALS = {
+    'orb': ((12000, 440, 3), (8000, 880, 4)),      # Magical chime for orb
+    'key': ((10000, 800, 5), (6000, 1200, 8)),     # Metallic clink for key
+    'coin': ((15000, 1000, 2), (10000, 1500, 3)),  # Coin ding sound
+}
+_DEFAULT_PARTIALS = ((10000, 600, 4),)            # Default pickup sound
+
+def _build_step_sound():
+    """Create a simple step sound"""
+    # Simple thump sound
+    return _tone(8000, 100, 0.1, 15).astype(np.int16)
+
+def _build_collect_sound(item_type: str):
+    """Create the pickup sound for an item type"""
+    wave = sum(_tone(amplitude, freq, 0.3, decay)
+               for amplitude, freq, decay in _COLLECT_PARTIALS.get(item_type, _DEFAULT_PARTIALS))
+    return wave.astype(np.int16)
+
+def _build_door_sound():
+    """Create the door opening creak"""
+    t = sample_times(0.8, SOUND_SAMPLE_RATE)
+    # Creaking wood sound
+    creak_freq = 150 + 30 * np.sin(2 * np.pi * 2 * t)
+    wave = _tone(8000, creak_freq, 0.8, 1.5)
+    # Add some noise for realism
+    noise = np.trunc(2000 * (np.random.random(len(t)) - 0.5) * _decay(0.8, 2))
+    return (wave + noise).astype(np.int16)
+
 class GameState(Enum):
     MENU = 1
     PLAYING = 2
@@ -58,6 +235,9 @@ class GameState(Enum):
     VICTORY = 5
     GAME_OVER = 6
 
+# Screens with nothing animating, drawn once and then left on display
+STATIC_STATES = (GameState.MENU, GameState.DEATH, GameState.VICTORY, GameState.GAME_OVER)
+
 @dataclass
 class GameProgress:
     """Tracks overall game progress"""
@@ -69,9 +249,17 @@ class GameProgress:
         if self.levels_completed is None:
             self.levels_completed = []
 
-class GameObject:
+@lru_cache(maxsize=None)
+def get_solid_surface(size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+    """Plain filled surface used as the sprite image of simple objects"""
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return to_display_format(surface)
+
+class GameObject(pygame.sprite.Sprite):
     """Base class for all game objects"""
     def __init__(self, x: int, y: int, width: int, height: int, color: Tuple[int, int, int]):
+        pygame.sprite.Sprite.__init__(self)
         self.x = x
         self.y = y
         self.width = width
@@ -79,8 +267,14 @@ class GameObject:
         self.color = color
         self.rect = pygame.Rect(x, y, width, height)
     
-    def update_rect(self):
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+    def update_rect(self) -> None:
+        # Size never changes after construction, so just move the existing rect
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
+    
+    @property
+    def image(self) -> pygame.Surface:
+        return get_solid_surface((self.width, self.height), self.color)
     
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect)
@@ -98,24 +292,21 @@ class Player(GameObject):
         self.facing_right = True
         self.step_sound_timer = 0
     
-    def update(self, dt: float, keys):
+    def update(self, dt: float, keys: Sequence[bool]) -> None:
         old_x, old_y = self.x, self.y
         self.walking = False
         
         # Movement with direction tracking
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.x -= self.speed * dt
-            self.facing_right = False
-            self.walking = True
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.x += self.speed * dt
-            self.facing_right = True
-            self.walking = True
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.y -= self.speed * dt
-            self.walking = True
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            self.y += self.speed * dt
+        dx = (keys[_K_RIGHT] or keys[_K_D]) - (keys[_K_LEFT] or keys[_K_A])
+        dy = (keys[_K_DOWN] or keys[_K_S]) - (keys[_K_UP] or keys[_K_W])
+        if dx or dy:
+            step = self.speed * dt
+            if dx and dy:
+                step *= 0.7071  # Diagonals move at the same speed as straight lines
+            self.x += dx * step
+            self.y += dy * step
+            if dx:
+                self.facing_right = dx > 0
             self.walking = True
         
         # Keep player on screen
@@ -128,27 +319,11 @@ class Player(GameObject):
             # Play step sounds
             self.step_sound_timer += dt
             if self.step_sound_timer > 0.4:  # Every 400ms
-                pygame.mixer.Sound.play(pygame.mixer.Sound(buffer=self.create_step_sound()))
+                play_cached_sound('step', _build_step_sound)
                 self.step_sound_timer = 0
         
         self.update_rect()
     
-    def create_step_sound(self):
-        """Create a simple step sound"""
-        import array
-        duration = 0.1
-        sample_rate = 22050
-        frames = int(duration * sample_rate)
-        sound_array = array.array('h', [0] * frames)
-        
-        for i in range(frames):
-            t = float(i) / sample_rate
-            # Simple thump sound
-            wave = int(8000 * math.sin(2 * math.pi * 100 * t) * math.exp(-t * 15))
-            sound_array[i] = wave
-        
-        return sound_array
-    
     def reset_position(self):
         self.x = self.start_x
         self.y = self.start_y
@@ -157,67 +332,95 @@ class Player(GameObject):
         self.walking = False
         self.update_rect()
     
+    # Pre-drawn frames keyed by (facing_right, swing phase or None, held item)
+    _frames: Dict[tuple, pygame.Surface] = {}
+    # Transparent margin around the body so the glow and a held item fit on the frame
+    FRAME_PAD = 8
+    WALK_PHASES = 8
+    
     def draw(self, screen):
+        # Walking swing is quantized to a few phases so every pose can be pre-drawn
+        phase = None
+        if self.walking:
+            phase = int(self.animation_time * self.WALK_PHASES / (2 * math.pi)) % self.WALK_PHASES
+        held = self.inventory if self.inventory in ('key', 'coin') else None
+        
+        key = (self.facing_right, phase, held)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = self._render_frame(*key)
+        screen.blit(frame, (self.x - self.FRAME_PAD, self.y - self.FRAME_PAD))
+    
+    def _render_frame(self, facing_right: bool, phase: Optional[int], held: Optional[str]) -> pygame.Surface:
+        """Draw one pose of the character onto its own surface"""
+        pad = self.FRAME_PAD
+        frame = pygame.Surface((self.width + 2 * pad, self.height + 2 * pad), pygame.SRCALPHA)
+        x, y = pad, pad
+        
         # Draw realistic person character
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+        center_x = x + self.width // 2
         
         # Body (torso)
-        body_rect = pygame.Rect(self.x + 6, self.y + 12, 12, 16)
-        pygame.draw.ellipse(screen, (100, 150, 200), body_rect)
+        body_rect = pygame.Rect(x + 6, y + 12, 12, 16)
+        pygame.draw.ellipse(frame, (100, 150, 200), body_rect)
         
         # Head
-        head_center = (center_x, self.y + 8)
-        pygame.draw.circle(screen, (255, 220, 177), head_center, 6)  # Skin color
+        head_center = (center_x, y + 8)
+        pygame.draw.circle(frame, (255, 220, 177), head_center, 6)  # Skin color
         
         # Eyes
-        eye_offset = 2 if self.facing_right else -2
-        pygame.draw.circle(screen, (0, 0, 0), (center_x - 2 + eye_offset, self.y + 6), 1)
-        pygame.draw.circle(screen, (0, 0, 0), (center_x + 2 + eye_offset, self.y + 6), 1)
+        eye_offset = 2 if facing_right else -2
+        pygame.draw.circle(frame, (0, 0, 0), (center_x - 2 + eye_offset, y + 6), 1)
+        pygame.draw.circle(frame, (0, 0, 0), (center_x + 2 + eye_offset, y + 6), 1)
         
         # Arms with walking animation
-        arm_swing = math.sin(self.animation_time) * 3 if self.walking else 0
+        swing_angle = phase * 2 * math.pi / self.WALK_PHASES if phase is not None else None
+        arm_swing = math.sin(swing_angle) * 3 if phase is not None else 0
         # Left arm
-        arm1_start = (self.x + 4, self.y + 16)
-        arm1_end = (self.x + 2, self.y + 22 + arm_swing)
-        pygame.draw.line(screen, (255, 220, 177), arm1_start, arm1_end, 3)
+        arm1_start = (x + 4, y + 16)
+        arm1_end = (x + 2, y + 22 + arm_swing)
+        pygame.draw.line(frame, (255, 220, 177), arm1_start, arm1_end, 3)
         # Right arm  
-        arm2_start = (self.x + 20, self.y + 16)
-        arm2_end = (self.x + 22, self.y + 22 - arm_swing)
-        pygame.draw.line(screen, (255, 220, 177), arm2_start, arm2_end, 3)
+        arm2_start = (x + 20, y + 16)
+        arm2_end = (x + 22, y + 22 - arm_swing)
+        pygame.draw.line(frame, (255, 220, 177), arm2_start, arm2_end, 3)
         
         # Legs with walking animation
-        leg_swing = math.sin(self.animation_time + math.pi) * 4 if self.walking else 0
+        leg_swing = math.sin(swing_angle + math.pi) * 4 if phase is not None else 0
         # Left leg
-        leg1_start = (self.x + 8, self.y + 26)
-        leg1_end = (self.x + 6 + leg_swing, self.y + 32)
-        pygame.draw.line(screen, (50, 50, 150), leg1_start, leg1_end, 4)  # Blue pants
+        leg1_start = (x + 8, y + 26)
+        leg1_end = (x + 6 + leg_swing, y + 32)
+        pygame.draw.line(frame, (50, 50, 150), leg1_start, leg1_end, 4)  # Blue pants
         # Right leg
-        leg2_start = (self.x + 16, self.y + 26)
-        leg2_end = (self.x + 18 - leg_swing, self.y + 32)
-        pygame.draw.line(screen, (50, 50, 150), leg2_start, leg2_end, 4)
+        leg2_start = (x + 16, y + 26)
+        leg2_end = (x + 18 - leg_swing, y + 32)
+        pygame.draw.line(frame, (50, 50, 150), leg2_start, leg2_end, 4)
         
         # Draw inventory item if holding something
-        if self.inventory:
-            item_x = self.x + (20 if self.facing_right else 0)
-            item_y = self.y + 18
+        if held:
+            item_x = x + (20 if facing_right else 0)
+            item_y = y + 18
             
-            if self.inventory == 'key':
+            if held == 'key':
                 # Draw key in hand
-                pygame.draw.rect(screen, (255, 215, 0), (item_x, item_y, 8, 3))
-                pygame.draw.circle(screen, (255, 215, 0), (item_x + 8, item_y + 1), 3)
-            elif self.inventory == 'coin':
+                pygame.draw.rect(frame, (255, 215, 0), (item_x, item_y, 8, 3))
+                pygame.draw.circle(frame, (255, 215, 0), (item_x + 8, item_y + 1), 3)
+            elif held == 'coin':
                 # Draw coin in hand
-                pygame.draw.circle(screen, (255, 215, 0), (item_x + 4, item_y + 2), 4)
-                pygame.draw.circle(screen, (255, 235, 100), (item_x + 4, item_y + 2), 2)
+                pygame.draw.circle(frame, (255, 215, 0), (item_x + 4, item_y + 2), 4)
+                pygame.draw.circle(frame, (255, 235, 100), (item_x + 4, item_y + 2), 2)
         
         # Subtle glow around character
         glow_surf = pygame.Surface((self.width + 8, self.height + 8), pygame.SRCALPHA)
         pygame.draw.ellipse(glow_surf, (100, 150, 255, 30), (0, 0, self.width + 8, self.height + 8))
-        screen.blit(glow_surf, (self.x - 4, self.y - 4))
+        frame.blit(glow_surf, (x - 4, y - 4))
+        return to_display_format(frame)
 
 class Item(GameObject):
     """Enhanced collectible items with realistic graphics and sounds"""
+    # Glow layer surfaces keyed by (color, radius)
+    _GLOW_CACHE: Dict[tuple, List[pygame.Surface]] = {}
+    
     def __init__(self, x: int, y: int, item_type: str):
         color = COLORS.get(item_type, COLORS['orb'])
         super().__init__(x, y, 20, 20, color)
@@ -225,8 +428,11 @@ class Item(GameObject):
         self.collected = False
         self.glow_time = 0
         self.sparkle_timer = 0
+        # Alive flag in the owning level's overlap index; set by Level.index_items
+        self._alive: Optional[np.ndarray] = None
+        self._slot = 0
     
-    def update(self, dt: float):
+    def update(self, dt: float) -> None:
         self.glow_time += dt * 3
         self.sparkle_timer += dt
     
@@ -234,6 +440,9 @@ class Item(GameObject):
         """Mark item as collected and play sound"""
         if not self.collected:
             self.collected = True
+            self.kill()  # Leave the level's sprite group
+            if self._alive is not None:
+                self._alive[self._slot] = False  # Drop out of the level's overlap test
             self.play_collection_sound()
             
             # Handle time crystal bonus
@@ -242,88 +451,110 @@ class Item(GameObject):
                 return True  # Indicate time bonus was given
         return False
     
+    def load_collection_sound(self):
+        """Synthesize the collection sound ahead of the first pickup"""
+        return load_cached_sound('collect_' + self.type, _build_collect_sound, self.type, volume=0.7)
+    
     def play_collection_sound(self):
         """Play collection sound effect"""
-        try:
-            import array
-            duration = 0.3
-            sample_rate = 22050
-            frames = int(duration * sample_rate)
-            sound_array = array.array('h', [0] * frames)
-            
-            for i in range(frames):
-                t = float(i) / sample_rate
-                if self.type == 'orb':
-                    # Magical chime for orb
-                    wave = int(12000 * math.sin(2 * math.pi * 440 * t) * math.exp(-t * 3))
-                    wave += int(8000 * math.sin(2 * math.pi * 880 * t) * math.exp(-t * 4))
-                elif self.type == 'key':
-                    # Metallic clink for key
-                    wave = int(10000 * math.sin(2 * math.pi * 800 * t) * math.exp(-t * 5))
-                    wave += int(6000 * math.sin(2 * math.pi * 1200 * t) * math.exp(-t * 8))
-                elif self.type == 'coin':
-                    # Coin ding sound
-                    wave = int(15000 * math.sin(2 * math.pi * 1000 * t) * math.exp(-t * 2))
-                    wave += int(10000 * math.sin(2 * math.pi * 1500 * t) * math.exp(-t * 3))
-                else:
-                    # Default pickup sound
-                    wave = int(10000 * math.sin(2 * math.pi * 600 * t) * math.exp(-t * 4))
-                
-                sound_array[i] = wave
-            
-            sound = pygame.mixer.Sound(buffer=sound_array)
-            sound.set_volume(0.7)
-            sound.play()
-        except:
-            pass  # Silently fail if sound creation fails
+        play_cached_sound('collect_' + self.type, _build_collect_sound, self.type, volume=0.7)
+    
+    @classmethod
+    def glow_layers(cls, color, radius: int) -> List[pygame.Surface]:
+        """Opaque glow circles for one color and radius, faded at blit time with set_alpha"""
+        layers = cls._GLOW_CACHE.get((color, radius))
+        if layers is None:
+            layers = []
+            for i in range(3):
+                glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surf, (*color, 255), (radius, radius), radius - i * 3)
+                layers.append(to_display_format(glow_surf))
+            cls._GLOW_CACHE[(color, radius)] = layers
+        return layers
+    
+    def atlas_cell(self) -> str:
+        """Name of the atlas cell showing this item this frame"""
+        if self.type == 'coin' and int(self.sparkle_timer * 10) % 20 < 10:
+            return 'coin_sparkle'
+        return self.type if self.type in ITEM_TYPES else 'default'
+    
+    def draw_glow(self, screen):
+        center_x = self.x + self.width // 2
+        center_y = self.y + self.height // 2
+        
+        # Enhanced glow effect
+        glow_intensity = 0.8 + 0.4 * fast_sin(self.glow_time)
+        glow_radius = int(15 + 5 * fast_sin(self.glow_time * 1.5))
+        
+        # Multiple glow layers for depth
+        glow_pos = (center_x - glow_radius, center_y - glow_radius)
+        for i, glow_surf in enumerate(self.glow_layers(self.color, glow_radius)):
+            glow_surf.set_alpha(int(40 * glow_intensity * (3 - i) / 3))
+            screen.blit(glow_surf, glow_pos)
+    
+    @property
+    def image(self) -> pygame.Surface:
+        return get_item_image(self.atlas_cell())
     
     def draw(self, screen):
         if not self.collected:
-            center_x = self.x + self.width // 2
-            center_y = self.y + self.height // 2
-            
-            # Enhanced glow effect
-            glow_intensity = 0.8 + 0.4 * math.sin(self.glow_time)
-            glow_radius = int(15 + 5 * math.sin(self.glow_time * 1.5))
-            
-            # Multiple glow layers for depth
-            for i in range(3):
-                alpha = int(40 * glow_intensity * (3 - i) / 3)
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*self.color, alpha), 
-                                 (glow_radius, glow_radius), glow_radius - i * 3)
-                screen.blit(glow_surf, (center_x - glow_radius, center_y - glow_radius))
-            
-            # Draw specific item types
-            if self.type == 'orb':
-                # Magical orb with inner light
-                pygame.draw.circle(screen, self.color, (center_x, center_y), 8)
-                pygame.draw.circle(screen, (255, 255, 200), (center_x - 2, center_y - 2), 4)
-                pygame.draw.circle(screen, (255, 255, 255), (center_x - 3, center_y - 3), 2)
-                
-            elif self.type == 'key':
-                # Detailed golden key
-                # Key shaft
-                pygame.draw.rect(screen, (255, 215, 0), (center_x - 6, center_y - 1, 10, 3))
-                # Key head
-                pygame.draw.circle(screen, (255, 215, 0), (center_x + 5, center_y), 4)
-                pygame.draw.circle(screen, (255, 235, 100), (center_x + 5, center_y), 2)
-                # Key teeth
-                pygame.draw.rect(screen, (255, 215, 0), (center_x - 4, center_y + 1, 2, 3))
-                pygame.draw.rect(screen, (255, 215, 0), (center_x - 1, center_y + 1, 2, 2))
-                
-            elif self.type == 'coin':
-                # Shiny golden coin
-                pygame.draw.circle(screen, (255, 215, 0), (center_x, center_y), 8)
-                pygame.draw.circle(screen, (255, 235, 100), (center_x, center_y), 6)
-                pygame.draw.circle(screen, (255, 245, 150), (center_x - 2, center_y - 2), 3)
-                # Add sparkle effect
-                if int(self.sparkle_timer * 10) % 20 < 10:
-                    pygame.draw.circle(screen, (255, 255, 255), (center_x + 3, center_y - 3), 1)
-            
-            else:
-                # Default item appearance
-                pygame.draw.circle(screen, self.color, (center_x, center_y), 8)
+            self.draw_glow(screen)
+            screen.blit(self.image, self.rect)
+
+# Item art laid out in a single row of ITEM_SPRITE_SIZE cells
+ITEM_SPRITE_SIZE = 20
+ITEM_TYPES = ('orb', 'key', 'coin', 'coin_sparkle', 'torch', 'time_crystal',
+              'red_crystal', 'blue_crystal', 'green_crystal', 'default')
+
+def draw_item_art(surface, item_type: str, color, center_x: int, center_y: int):
+    """Draw the body of a collectible centred on the given point"""
+    if item_type == 'orb':
+        # Magical orb with inner light
+        pygame.draw.circle(surface, color, (center_x, center_y), 8)
+        pygame.draw.circle(surface, (255, 255, 200), (center_x - 2, center_y - 2), 4)
+        pygame.draw.circle(surface, (255, 255, 255), (center_x - 3, center_y - 3), 2)
+        
+    elif item_type == 'key':
+        # Detailed golden key
+        # Key shaft
+        pygame.draw.rect(surface, (255, 215, 0), (center_x - 6, center_y - 1, 10, 3))
+        # Key head
+        pygame.draw.circle(surface, (255, 215, 0), (center_x + 5, center_y), 4)
+        pygame.draw.circle(surface, (255, 235, 100), (center_x + 5, center_y), 2)
+        # Key teeth
+        pygame.draw.rect(surface, (255, 215, 0), (center_x - 4, center_y + 1, 2, 3))
+        pygame.draw.rect(surface, (255, 215, 0), (center_x - 1, center_y + 1, 2, 2))
+        
+    elif item_type in ('coin', 'coin_sparkle'):
+        # Shiny golden coin
+        pygame.draw.circle(surface, (255, 215, 0), (center_x, center_y), 8)
+        pygame.draw.circle(surface, (255, 235, 100), (center_x, center_y), 6)
+        pygame.draw.circle(surface, (255, 245, 150), (center_x - 2, center_y - 2), 3)
+        # Add sparkle effect
+        if item_type == 'coin_sparkle':
+            pygame.draw.circle(surface, (255, 255, 255), (center_x + 3, center_y - 3), 1)
+    
+    else:
+        # Default item appearance
+        pygame.draw.circle(surface, color, (center_x, center_y), 8)
+
+@lru_cache(maxsize=1)
+def get_item_atlas() -> Tuple[pygame.Surface, Dict[str, pygame.Rect]]:
+    """Sheet holding every item body plus the source rect of each cell"""
+    size = ITEM_SPRITE_SIZE
+    atlas = pygame.Surface((size * len(ITEM_TYPES), size), pygame.SRCALPHA)
+    cells = {}
+    for i, item_type in enumerate(ITEM_TYPES):
+        color = COLORS.get(item_type, COLORS['orb'])
+        draw_item_art(atlas, item_type, color, i * size + size // 2, size // 2)
+        cells[item_type] = pygame.Rect(i * size, 0, size, size)
+    return to_display_format(atlas), cells
+
+@lru_cache(maxsize=None)
+def get_item_image(cell: str) -> pygame.Surface:
+    """View of one atlas cell, so items can act as plain sprites"""
+    atlas, cells = get_item_atlas()
+    return atlas.subsurface(cells[cell])
 
 class Door(GameObject):
     """Enhanced doors with realistic graphics and sounds"""
@@ -338,76 +569,71 @@ class Door(GameObject):
             self.is_open = True
             self.play_door_sound()
     
+    def load_door_sound(self):
+        """Synthesize the door sound ahead of the first opening"""
+        return load_cached_sound('door', _build_door_sound, volume=0.6)
+    
     def play_door_sound(self):
         """Play door opening sound"""
-        try:
-            import array
-            duration = 0.8
-            sample_rate = 22050
-            frames = int(duration * sample_rate)
-            sound_array = array.array('h', [0] * frames)
-            
-            for i in range(frames):
-                t = float(i) / sample_rate
-                # Creaking wood sound
-                creak_freq = 150 + 30 * math.sin(2 * math.pi * 2 * t)
-                wave = int(8000 * math.sin(2 * math.pi * creak_freq * t) * math.exp(-t * 1.5))
-                # Add some noise for realism
-                noise = int(2000 * (random.random() - 0.5) * math.exp(-t * 2))
-                sound_array[i] = wave + noise
-            
-            sound = pygame.mixer.Sound(buffer=sound_array)
-            sound.set_volume(0.6)
-            sound.play()
-        except:
-            pass
+        play_cached_sound('door', _build_door_sound, volume=0.6)
     
     def draw(self, screen):
-        # Always draw door frame
-        frame_rect = pygame.Rect(self.x - 2, self.y - 2, self.width + 4, self.height + 4)
-        pygame.draw.rect(screen, (80, 60, 40), frame_rect)
-        
-        if not self.is_open:
-            # Enhanced door graphics
-            # Door frame
-            frame_rect = pygame.Rect(self.x - 2, self.y - 2, self.width + 4, self.height + 4)
-            pygame.draw.rect(screen, (80, 60, 40), frame_rect)
-            
-            # Door body with wood texture
-            door_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-            pygame.draw.rect(screen, (101, 67, 33), door_rect)
-            
-            # Wood grain lines
-            for i in range(0, self.height, 8):
-                line_y = self.y + i
-                pygame.draw.line(screen, (90, 60, 30), (self.x + 2, line_y), (self.x + self.width - 2, line_y), 1)
-            
-            # Door panels
-            panel1 = pygame.Rect(self.x + 3, self.y + 5, self.width - 6, self.height//2 - 8)
-            panel2 = pygame.Rect(self.x + 3, self.y + self.height//2 + 3, self.width - 6, self.height//2 - 8)
-            pygame.draw.rect(screen, (101, 67, 33), panel1, 2)
-            pygame.draw.rect(screen, (101, 67, 33), panel2, 2)
-            
-            # Door handle
-            handle_center = (self.x + self.width - 6, self.y + self.height//2)
-            pygame.draw.circle(screen, (184, 134, 11), handle_center, 4)
-            pygame.draw.circle(screen, (200, 150, 20), handle_center, 2)
+        if self.is_open:
+            screen.blit(get_door_image(self.width, self.height, True), (self.x - 8, self.y - 2))
         else:
-            # Open door - Draw partially opened door
-            # Dark doorway opening (passage)
-            doorway_rect = pygame.Rect(self.x + 5, self.y, self.width - 10, self.height)
-            pygame.draw.rect(screen, (30, 30, 30), doorway_rect)
-            
-            # Partially visible door (swung open to the left)
-            door_width = 8
-            partial_door = pygame.Rect(self.x - door_width, self.y, door_width, self.height)
-            pygame.draw.rect(screen, (101, 67, 33), partial_door)
-            
-            # Door edge shadow
-            pygame.draw.line(screen, (60, 40, 20), (self.x, self.y), (self.x, self.y + self.height), 2)
-            
-            # Subtle glow around the opening to indicate it's passable
-            pygame.draw.rect(screen, (100, 200, 100), doorway_rect, 2)
+            screen.blit(get_door_image(self.width, self.height, False), (self.x - 2, self.y - 2))
+
+@lru_cache(maxsize=None)
+def get_door_image(width: int, height: int, is_open: bool) -> pygame.Surface:
+    """Door art for one state, drawn once; open doors include the leaf swung out to the left"""
+    # Offset of the door's top-left corner inside the image
+    x = 8 if is_open else 2
+    y = 2
+    image = pygame.Surface((width + x + 2, height + 4), pygame.SRCALPHA)
+    
+    # Always draw door frame
+    frame_rect = pygame.Rect(x - 2, y - 2, width + 4, height + 4)
+    pygame.draw.rect(image, (80, 60, 40), frame_rect)
+    
+    if not is_open:
+        # Enhanced door graphics
+        # Door body with wood texture
+        door_rect = pygame.Rect(x, y, width, height)
+        pygame.draw.rect(image, (101, 67, 33), door_rect)
+        
+        # Wood grain lines
+        for i in range(0, height, 8):
+            line_y = y + i
+            pygame.draw.line(image, (90, 60, 30), (x + 2, line_y), (x + width - 2, line_y), 1)
+        
+        # Door panels
+        panel1 = pygame.Rect(x + 3, y + 5, width - 6, height//2 - 8)
+        panel2 = pygame.Rect(x + 3, y + height//2 + 3, width - 6, height//2 - 8)
+        pygame.draw.rect(image, (101, 67, 33), panel1, 2)
+        pygame.draw.rect(image, (101, 67, 33), panel2, 2)
+        
+        # Door handle
+        handle_center = (x + width - 6, y + height//2)
+        pygame.draw.circle(image, (184, 134, 11), handle_center, 4)
+        pygame.draw.circle(image, (200, 150, 20), handle_center, 2)
+    else:
+        # Open door - Draw partially opened door
+        # Dark doorway opening (passage)
+        doorway_rect = pygame.Rect(x + 5, y, width - 10, height)
+        pygame.draw.rect(image, (30, 30, 30), doorway_rect)
+        
+        # Partially visible door (swung open to the left)
+        door_width = 8
+        partial_door = pygame.Rect(x - door_width, y, door_width, height)
+        pygame.draw.rect(image, (101, 67, 33), partial_door)
+        
+        # Door edge shadow
+        pygame.draw.line(image, (60, 40, 20), (x, y), (x, y + height), 2)
+        
+        # Subtle glow around the opening to indicate it's passable
+        pygame.draw.rect(image, (100, 200, 100), doorway_rect, 2)
+    
+    return to_display_format(image)
 
 class NPC(GameObject):
     """Non-player characters"""
@@ -416,14 +642,14 @@ class NPC(GameObject):
         self.name = name
         self.dialogue = dialogue
         self.talked_to = False
+        # The name never changes, so its label is rendered once
+        self._name_surf = get_font(24).render(self.name, True, COLORS['text'])
     
     def draw(self, screen):
         super().draw(screen)
         # Draw name above NPC
-        font = pygame.font.Font(None, 24)
-        text = font.render(self.name, True, COLORS['text'])
-        text_rect = text.get_rect(center=(self.x + self.width//2, self.y - 15))
-        screen.blit(text, text_rect)
+        # Anchor to the integer rect rather than the float position so the label never lands between pixels
+        screen.blit(self._name_surf, self._name_surf.get_rect(center=(self.rect.centerx, self.rect.y - 15)))
 
 class Level:
     """Base class for all levels"""
@@ -437,15 +663,70 @@ class Level:
         self.npcs = []
         self.doors = []
         self.walls = []
+        # Item rect edges as rows (left, top, right, bottom) for one vectorized overlap test
+        self._item_source = None
+        self._item_edges = np.zeros((4, 0), dtype=np.int32)
+        self._item_alive = np.zeros(0, dtype=bool)
+        # Walls then items, drawn by one Group.draw; built on first draw
+        self.sprites: Optional[pygame.sprite.Group] = None
+    
+    def index_items(self) -> None:
+        """Rebuild the item rect arrays from the current item list"""
+        self._item_source = self.items
+        xywh = np.array([item.rect for item in self.items], dtype=np.int32).reshape(-1, 4)
+        # Store edges rather than sizes so the per-frame test needs no additions
+        self._item_edges = np.vstack((xywh[:, :2].T, (xywh[:, :2] + xywh[:, 2:]).T))
+        self._item_alive = np.array([not item.collected for item in self.items], dtype=bool)
+        for slot, item in enumerate(self.items):
+            item._alive = self._item_alive
+            item._slot = slot
+    
+    def ensure_item_index(self) -> None:
+        """Re-index items if the list was replaced or grew since the last index"""
+        if self._item_source is not self.items or len(self._item_alive) != len(self.items):
+            self.index_items()
+    
+    def touched_items(self, player: Player) -> List['Item']:
+        """Uncollected items overlapping the player; one vectorized AABB test on busy levels"""
+        if len(self.items) < VECTOR_ITEM_THRESHOLD:
+            rect = player.rect
+            return [item for item in self.items if not item.collected and rect.colliderect(item.rect)]
+        self.ensure_item_index()
+        px, py, pw, ph = player.rect
+        left, top, right, bottom = self._item_edges
+        hits = (px < right) & (px + pw > left) & (py < bottom) & (py + ph > top) & self._item_alive
+        if not hits.any():
+            return []
+        # Items leave the index when collected, so ones the caller skips stay collectable
+        return [self.items[i] for i in np.flatnonzero(hits) if not self.items[i].collected]
+    
+    def visible_items(self) -> List['Item']:
+        """Uncollected items whose glow reaches into the window"""
+        self.ensure_item_index()
+        left, top, right, bottom = self._item_edges
+        margin = ITEM_GLOW_MARGIN
+        visible = ((right > -margin) & (left < WINDOW_WIDTH + margin) &
+                   (bottom > -margin) & (top < WINDOW_HEIGHT + margin) & self._item_alive)
+        return [self.items[i] for i in np.flatnonzero(visible)]
     
     def setup(self):
         """Override in subclasses to set up level-specific content"""
         pass
     
+    def prefetch_sounds(self):
+        """Synthesize every sound this level can play so the first use doesn't stall"""
+        load_cached_sound('step', _build_step_sound)
+        for item in self.items:
+            item.load_collection_sound()
+        for door in self.doors:
+            door.load_door_sound()
+    
     def update(self, dt: float, player: Player) -> bool:
         """Update level logic. Return True if level is complete."""
+        # Only items still in play animate; collected ones are never drawn again
         for item in self.items:
-            item.update(dt)
+            if not item.collected:
+                item.update(dt)
         return False
     
     def handle_interaction(self, player: Player) -> Optional[str]:
@@ -454,12 +735,17 @@ class Level:
     
     def draw(self, screen):
         """Draw all level objects"""
-        for wall in self.walls:
-            wall.draw(screen)
+        if self.sprites is None:
+            # The view never scrolls, so off-screen objects can be culled once here
+            self.sprites = pygame.sprite.Group([wall for wall in self.walls if wall.rect.colliderect(SCREEN_RECT)],
+                                               self.visible_items())
+        # Doors and item glows reach outside their rects, so they are drawn by hand
         for door in self.doors:
             door.draw(screen)
-        for item in self.items:
-            item.draw(screen)
+        for item in self.sprites:
+            if isinstance(item, Item):
+                item.draw_glow(screen)
+        self.sprites.draw(screen)
         for npc in self.npcs:
             npc.draw(screen)
 
@@ -478,11 +764,10 @@ class Level1_FirstSteps(Level):
     def update(self, dt: float, player: Player, game=None) -> bool:
         super().update(dt, player)
         # Check if orb is collected
-        for item in self.items:
-            if not item.collected and player.rect.colliderect(item.rect):
-                time_bonus_given = item.collect(game)  # Pass game instance for time bonus
-                if item.type == 'orb':
-                    return True  # Level complete
+        for item in self.touched_items(player):
+            time_bonus_given = item.collect(game)  # Pass game instance for time bonus
+            if item.type == 'orb':
+                return True  # Level complete
         return False
     
     def handle_interaction(self, player: Player) -> Optional[str]:
@@ -511,12 +796,11 @@ class Level2_TheDoor(Level):
         super().update(dt, player)
         
         # Check item collection
-        for item in self.items:
-            if not item.collected and player.rect.colliderect(item.rect):
-                item.collect(game)  # Pass game instance for time bonus
-                if item.type == 'key':
-                    player.inventory = 'key'
-                    self.key_collected = True
+        for item in self.touched_items(player):
+            item.collect(game)  # Pass game instance for time bonus
+            if item.type == 'key':
+                player.inventory = 'key'
+                self.key_collected = True
         
         # Check if player walks through open door
         if self.doors[0].is_open and player.rect.colliderect(self.doors[0].rect):
@@ -577,14 +861,13 @@ class Level3_TimePressure(Level):
         super().update(dt, player)
         
         # Check item collection (coins and time crystal)
-        for item in self.items:
-            if not item.collected and player.rect.colliderect(item.rect):
-                item.collect(game)  # Pass game instance for time bonus
-                if item.type == 'coin':
-                    self.coins_collected += 1
+        for item in self.touched_items(player):
+            item.collect(game)  # Pass game instance for time bonus
+            if item.type == 'coin':
+                self.coins_collected += 1
                 
-                    if self.coins_collected >= self.target_coins:
-                        return True  # Level complete
+                if self.coins_collected >= self.target_coins:
+                    return True  # Level complete
         
         return False
     
@@ -613,7 +896,7 @@ class NPC:
     def update(self, dt: float):
         """Update NPC animations"""
         self.animation_timer += dt * 2
-        self.glow_intensity = int(50 + 30 * math.sin(self.animation_timer))
+        self.glow_intensity = int(50 + 30 * fast_sin(self.animation_timer))
     
     def draw(self, screen: pygame.Surface):
         """Draw animated NPC with glowing effect"""
@@ -628,14 +911,12 @@ class NPC:
         
         # Staff (floating beside NPC)
         staff_x = self.rect.x + 45
-        staff_y = self.rect.y + int(5 * math.sin(self.animation_timer))
+        staff_y = self.rect.y + int(5 * fast_sin(self.animation_timer))
         pygame.draw.line(screen, (139, 69, 19), (staff_x, staff_y), (staff_x, staff_y + 50), 3)
         pygame.draw.circle(screen, (255, 215, 0), (staff_x, staff_y), 6)
         
         # Interaction hint
-        hint_text = "SPACE to talk"
-        font = pygame.font.Font(None, 20)
-        hint_surface = font.render(hint_text, True, (255, 255, 100))
+        hint_surface = render_text("SPACE to talk", 20, (255, 255, 100))
         hint_rect = hint_surface.get_rect(center=(self.rect.centerx, self.rect.y - 15))
         screen.blit(hint_surface, hint_rect)
     
@@ -675,8 +956,8 @@ class TorchPlacement:
         pygame.draw.rect(screen, (139, 69, 19), self.rect)
         
         # Animated flame
-        flame_height = int(15 + 5 * math.sin(self.flame_animation))
-        flame_width = int(12 + 3 * math.sin(self.flame_animation * 1.2))
+        flame_height = int(15 + 5 * fast_sin(self.flame_animation))
+        flame_width = int(12 + 3 * fast_sin(self.flame_animation * 1.2))
         flame_rect = pygame.Rect(self.rect.centerx - flame_width//2, self.rect.y - flame_height, flame_width, flame_height)
         
         # Multi-layered flame effect
@@ -685,9 +966,7 @@ class TorchPlacement:
         pygame.draw.ellipse(screen, (255, 200, 0), inner_flame)
         
         # Light glow effect
-        glow_surface = pygame.Surface((self.light_radius * 2, self.light_radius * 2), pygame.SRCALPHA)
-        glow_color = (255, 200, 100, 30)
-        pygame.draw.circle(glow_surface, glow_color, (self.light_radius, self.light_radius), self.light_radius)
+        glow_surface = get_glow_disc(self.light_radius, (255, 200, 100, 30))
         screen.blit(glow_surface, (self.rect.centerx - self.light_radius, self.rect.centery - self.light_radius))
     
     def cast_shadow(self, obstacle_rect: pygame.Rect) -> pygame.Rect:
@@ -747,16 +1026,19 @@ class Level4_ShadowBasics(Level):
         # State tracking
         self.torch_carried = False
         self.torch_placed = False
+    
+    def prefetch_sounds(self):
+        super().prefetch_sounds()
+        self.hidden_key.load_collection_sound()  # Not in items until revealed
         
     def update(self, dt: float, player: Player, game=None) -> bool:
         super().update(dt, player)
         
         # Check item collection
-        for item in self.items:
-            if not item.collected and player.rect.colliderect(item.rect):
-                item.collect(game)
-                if item.type == 'torch':
-                    self.torch_carried = True
+        for item in self.touched_items(player):
+            item.collect(game)
+            if item.type == 'torch':
+                self.torch_carried = True
         
         # Check if hidden key is revealed and can be collected
         if self.key_revealed and not self.hidden_key.collected:
@@ -806,9 +1088,7 @@ class Level4_ShadowBasics(Level):
             pygame.draw.rect(screen, (255, 255, 0), self.torch_spot, 2)
             
             # Add instruction text
-            font = pygame.font.Font(None, 24)
-            instruction = "Press SPACE near the pillar to place torch"
-            text_surface = font.render(instruction, True, (255, 255, 100))
+            text_surface = render_text("Press SPACE near the pillar to place torch", 24, (255, 255, 100))
             screen.blit(text_surface, (200, 450))
         
         # Draw placed torch with flame effect
@@ -831,17 +1111,14 @@ class Level4_ShadowBasics(Level):
         # Draw revealed key with glow effect
         if self.key_revealed and not self.hidden_key.collected:
             # Glow effect
-            glow_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (255, 255, 0, 100), (30, 30), 30)
+            glow_surface = get_glow_disc(30, (255, 255, 0, 100))
             screen.blit(glow_surface, (self.hidden_key.rect.x - 20, self.hidden_key.rect.y - 20))
             
             # Draw key
             self.hidden_key.draw(screen)
             
             # Add discovery text
-            font = pygame.font.Font(None, 24)
-            discovery_text = "A key appeared in the shadow!"
-            text_surface = font.render(discovery_text, True, (255, 255, 100))
+            text_surface = render_text("A key appeared in the shadow!", 24, (255, 255, 100))
             screen.blit(text_surface, (300, 400))
 
 class Level5_TheHelper(Level):
@@ -878,10 +1155,21 @@ class Level5_TheHelper(Level):
         
         # Dialogue state
         self.showing_dialogue = False
+        self.dialogue_lines = []
         self.dialogue_text = ""
         self.dialogue_timer = 0
         self.help_given = False
         
+    @property
+    def dialogue_text(self) -> str:
+        return self._dialogue_text
+    
+    @dialogue_text.setter
+    def dialogue_text(self, text: str):
+        # Wrap and render as soon as the text changes so drawing it is blit-only
+        self._dialogue_text = text
+        self.dialogue_lines = self.wrap_text_lines(text, WINDOW_WIDTH - 130, get_font(24), (255, 255, 255))
+    
     def update(self, dt: float, player: Player, game=None) -> bool:
         super().update(dt, player)
         
@@ -895,21 +1183,20 @@ class Level5_TheHelper(Level):
                 self.showing_dialogue = False
         
         # Check crystal collection - auto-place crystals to avoid inventory issues
-        for item in self.items:
-            if not item.collected and player.rect.colliderect(item.rect):
-                item.collect(game)
-                if item.type == 'red_crystal' and not self.red_placed:
-                    self.red_placed = True
-                    print(f"DEBUG: Red crystal collected! Status - Red: {self.red_placed}, Blue: {self.blue_placed}, Green: {self.green_placed}")
-                    # Don't return here - continue level
-                elif item.type == 'blue_crystal' and not self.blue_placed:
-                    self.blue_placed = True
-                    print(f"DEBUG: Blue crystal collected! Status - Red: {self.red_placed}, Blue: {self.blue_placed}, Green: {self.green_placed}")
-                    # Don't return here - continue level
-                elif item.type == 'green_crystal' and not self.green_placed:
-                    self.green_placed = True
-                    print(f"DEBUG: Green crystal collected! Status - Red: {self.red_placed}, Blue: {self.blue_placed}, Green: {self.green_placed}")
-                    # Don't return here - continue level
+        for item in self.touched_items(player):
+            item.collect(game)
+            if item.type == 'red_crystal' and not self.red_placed:
+                self.red_placed = True
+                print(f"DEBUG: Red crystal collected! Status - Red: {self.red_placed}, Blue: {self.blue_placed}, Green: {self.green_placed}")
+                # Don't return here - continue level
+            elif item.type == 'blue_crystal' and not self.blue_placed:
+                self.blue_placed = True
+                print(f"DEBUG: Blue crystal collected! Status - Red: {self.red_placed}, Blue: {self.blue_placed}, Green: {self.green_placed}")
+                # Don't return here - continue level
+            elif item.type == 'green_crystal' and not self.green_placed:
+                self.green_placed = True
+                print(f"DEBUG: Green crystal collected! Status - Red: {self.red_placed}, Blue: {self.blue_placed}, Green: {self.green_placed}")
+                # Don't return here - continue level
         
         # Check if all crystals are placed correctly
         if self.red_placed and self.blue_placed and self.green_placed:
@@ -951,18 +1238,17 @@ class Level5_TheHelper(Level):
             pygame.draw.circle(screen, (50, 255, 50), self.green_pedestal.center, 15)
         
         # Draw instruction text
-        font = pygame.font.Font(None, 24)
         if not self.help_given:
             instruction = "Talk to the guide for help!"
         else:
             instruction = "Collect crystals and place them on matching colored pedestals"
         
-        text_surface = font.render(instruction, True, (255, 255, 255))
+        text_surface = render_text(instruction, 24, (255, 255, 255))
         screen.blit(text_surface, (200, 450))
         
         # Draw progress indicator
         progress_text = f"Crystals placed: {sum([self.red_placed, self.blue_placed, self.green_placed])}/3"
-        progress_surface = font.render(progress_text, True, (200, 200, 200))
+        progress_surface = render_text(progress_text, 24, (200, 200, 200))
         screen.blit(progress_surface, (200, 480))
         
         # Draw NPC
@@ -985,26 +1271,26 @@ class Level5_TheHelper(Level):
         pygame.draw.rect(screen, (100, 150, 200), panel_rect, 3)
         
         # NPC name
-        font_medium = pygame.font.Font(None, 28)
-        name_surface = font_medium.render(self.guide.name, True, (200, 200, 255))
+        name_surface = get_font(28).render(self.guide.name, True, (200, 200, 255))
         screen.blit(name_surface, (panel_x + 15, panel_y + 10))
         
-        # Dialogue text (wrapped)
-        font_small = pygame.font.Font(None, 24)
-        self.draw_wrapped_text_simple(self.dialogue_text, panel_x + 15, panel_y + 40, 
-                                    panel_width - 30, font_small, (255, 255, 255), screen)
+        # Dialogue text (wrapped and rendered when it was set)
+        line_height = get_font(24).get_height() + 2
+        for i, line_surface in enumerate(self.dialogue_lines):
+            screen.blit(line_surface, (panel_x + 15, panel_y + 40 + i * line_height))
     
-    def draw_wrapped_text_simple(self, text, x, y, max_width, font, color, screen):
-        """Simple text wrapping for dialogue"""
+    def wrap_text_lines(self, text, max_width, font, color, max_lines=3):
+        """Simple text wrapping for dialogue; returns up to max_lines rendered lines"""
+        if not text:
+            return []
         words = text.split(' ')
         lines = []
         current_line = []
         
         for word in words:
             test_line = ' '.join(current_line + [word])
-            test_surface = font.render(test_line, True, color)
             
-            if test_surface.get_width() <= max_width:
+            if font.size(test_line)[0] <= max_width:
                 current_line.append(word)
             else:
                 if current_line:
@@ -1016,11 +1302,7 @@ class Level5_TheHelper(Level):
         if current_line:
             lines.append(' '.join(current_line))
         
-        # Draw each line
-        line_height = font.get_height() + 2
-        for i, line in enumerate(lines[:3]):  # Limit to 3 lines
-            line_surface = font.render(line, True, color)
-            screen.blit(line_surface, (x, y + i * line_height))
+        return [font.render(line, True, color) for line in lines[:max_lines]]
     
     def get_objective_text(self) -> str:
         if not self.torch_item.collected:
@@ -1057,12 +1339,31 @@ class Level5_TheHelper(Level):
         
         return None
 
-class TenSecondLifeGame:
+class TenSecondLifeGame(RedrawGate):
     """Main game class"""
+    STATIC_STATES = STATIC_STATES
+    
     def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.screen = None
+        if pygame.display.get_driver() not in HEADLESS_DRIVERS:
+            try:
+                # Let the driver pace presents with vsync where the renderer supports it
+                self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED, vsync=1)
+            except pygame.error:
+                pass
+        # With vsync, flip() already waits for the display; run() must not pace on top of it
+        self.vsync = self.screen is not None
+        if self.screen is None:
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("10 Second Life: Echoes of a Short World")
         self.clock = pygame.time.Clock()
+        # Build the shared item atlas now that the display format is known
+        get_item_atlas()
+        # Keep unread input off the queue
+        pygame.event.set_blocked(IGNORED_EVENTS)
+        self._key_dispatch = {pygame.K_ESCAPE: self.on_escape, pygame.K_SPACE: self.on_space}
+        # Static screens are only redrawn after input or a state change
+        self.init_redraw_gate()
         self.running = True
         
         # Game state
@@ -1072,6 +1373,19 @@ class TenSecondLifeGame:
         self.current_level_num = 1
         self.message = ""
         self.message_timer = 0
+        self._msg_cache: Dict[str, pygame.Surface] = {}
+        # Overlay panels never move, so they are laid out once
+        self._death_panel = centered_rect(WINDOW_WIDTH - 100, 350)
+        self._game_over_panel = centered_rect(WINDOW_WIDTH - 80, 400)
+        self._lesson_panel = centered_rect(WINDOW_WIDTH - 100, 400)
+        self._menu_panel = centered_rect(WINDOW_WIDTH - 80, WINDOW_HEIGHT - 100)
+        self._victory_panel = centered_rect(WINDOW_WIDTH - 100, 450)
+        # Whole menu/victory/game over screens as (contents key, surface)
+        self._overlay_surfaces: Dict[GameState, Tuple[tuple, pygame.Surface]] = {}
+        # Rendered overlay text with its centred rect, keyed by (font, text, color, center)
+        self._text_cache: Dict[tuple, Tuple[pygame.Surface, pygame.Rect]] = {}
+        # HUD text queued by draw_ui and blitted in one batch
+        self._frame_blits: List[tuple] = []
         self.level_complete = False
         self.show_lesson = False
         self.lesson_timer = 0
@@ -1115,9 +1429,9 @@ class TenSecondLifeGame:
         }
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(24)
         
         # Load current level
         self.load_level(self.current_level_num)
@@ -1134,6 +1448,7 @@ class TenSecondLifeGame:
             self.current_level = Level4_ShadowBasics()
         elif level_number == 5:
             self.current_level = Level5_TheHelper()
+        self.current_level.prefetch_sounds()
         self.current_level_num = level_number
         self.player.reset_position()
         self.timer = 10.0
@@ -1189,10 +1504,8 @@ class TenSecondLifeGame:
         self.show_motivation = False
         self.motivation_quote = ""
         
-        # Clear time bonus display
-        self.time_bonus_message = ""
-        self.time_bonus_timer = 0
-        self.time_bonus_animation = 0
+        # Timers don't run on the death screen, so drop anything left from the last life
+        self.clear_hud_messages()
     
     def reset_entire_game(self):
         """Completely reset the entire game to initial state"""
@@ -1205,8 +1518,7 @@ class TenSecondLifeGame:
         self.lesson_timer = 0
         self.lesson_text = ""
         self.next_level_ready = False
-        self.message = ""
-        self.message_timer = 0
+        self.clear_hud_messages()
         
         # Reset global lives system
         self.lives_remaining = 3  # Reset to full 3 lives
@@ -1229,6 +1541,14 @@ class TenSecondLifeGame:
         # Load Level 1
         self.load_level(1)
     
+    def clear_hud_messages(self):
+        """Drop the HUD message and time bonus; their timers are frozen outside live states"""
+        self.message = ""
+        self.message_timer = 0
+        self.time_bonus_message = ""
+        self.time_bonus_timer = 0
+        self.time_bonus_animation = 0
+    
     def add_time_bonus(self, bonus_seconds: float):
         """Add time bonus when collecting time crystals"""
         self.timer += bonus_seconds
@@ -1269,8 +1589,7 @@ class TenSecondLifeGame:
         self.lesson_timer = 0
         self.lesson_text = ""
         self.next_level_ready = False
-        self.message = ""
-        self.message_timer = 0
+        self.clear_hud_messages()
         
         # Reset player
         self.player.reset_position()
@@ -1337,18 +1656,14 @@ class TenSecondLifeGame:
                 self.level_complete = True
                 self.show_level_lesson()
                 self.state = GameState.LEVEL_COMPLETE
-        
-        elif self.state == GameState.LEVEL_COMPLETE:
-            # Handle lesson display - wait for user input instead of auto-advancing
-            if self.show_lesson:
-                # Lesson stays on screen until user presses SPACE
-                pass
+        # LEVEL_COMPLETE only runs the display timers below; the lesson waits for SPACE
         
         # Message display timer
         if self.message_timer > 0:
             self.message_timer -= dt
             if self.message_timer <= 0:
                 self.message = ""
+                self.mark_dirty()  # Repaint once without the message
         
         # Time bonus animation
         if self.time_bonus_timer > 0:
@@ -1356,59 +1671,89 @@ class TenSecondLifeGame:
             self.time_bonus_animation += dt * 3
             if self.time_bonus_timer <= 0:
                 self.time_bonus_message = ""
+                self.mark_dirty()
     
     def handle_events(self):
         """Handle pygame events"""
         for event in pygame.event.get():
+            self.mark_dirty()  # Input, or the window needing a repaint
             if event.type == pygame.QUIT:
                 self.running = False
-            
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.state == GameState.MENU:
-                        self.running = False
-                    else:
-                        # Reset entire game when returning to menu from any state
-                        self.reset_entire_game()
-                        self.state = GameState.MENU
-                
-                elif event.key == pygame.K_SPACE:
-                    if self.state == GameState.MENU:
-                        self.state = GameState.PLAYING
-                        self.timer = 10.0
-                        self.lives_lived += 1
-                    elif self.state == GameState.DEATH:
-                        # Restart current level completely (no progress preservation)
-                        self.restart_level_completely()
-                        self.state = GameState.PLAYING
-                    elif self.state == GameState.LEVEL_COMPLETE:
-                        # Advance to next level or victory
-                        if self.next_level_ready:
-                            self.advance_to_next_level()
-                        else:
-                            self.state = GameState.VICTORY
-                    elif self.state == GameState.VICTORY:
-                        # Play again - restart the entire game
-                        self.restart_game()
-                    elif self.state == GameState.GAME_OVER:
-                        # Return to main menu and completely reset game
-                        self.reset_entire_game()
-                        self.state = GameState.MENU
-                    elif self.state == GameState.PLAYING and self.current_level:
-                        # Use SPACE for interactions
-                        interaction_result = self.current_level.handle_interaction(self.player)
-                        if interaction_result:
-                            self.message = interaction_result
-                            self.message_timer = 2.0
-                
+                handler = self._key_dispatch.get(event.key)
+                if handler:
+                    handler()
                 # E key removed - now using SPACE for all interactions
-                
-                elif self.state == GameState.LEVEL_COMPLETE:
-                    if event.key == pygame.K_SPACE:
-                        self.next_level()
+    
+    def on_escape(self):
+        if self.state == GameState.MENU:
+            self.running = False
+        else:
+            # Reset entire game when returning to menu from any state
+            self.reset_entire_game()
+            self.state = GameState.MENU
+    
+    def on_space(self):
+        if self.state == GameState.MENU:
+            self.state = GameState.PLAYING
+            self.clear_hud_messages()
+            self.timer = 10.0
+            self.lives_lived += 1
+        elif self.state == GameState.DEATH:
+            # Restart current level completely (no progress preservation)
+            self.restart_level_completely()
+            self.state = GameState.PLAYING
+        elif self.state == GameState.LEVEL_COMPLETE:
+            # Advance to next level or victory
+            if self.next_level_ready:
+                self.advance_to_next_level()
+            else:
+                self.state = GameState.VICTORY
+        elif self.state == GameState.VICTORY:
+            # Play again - restart the entire game
+            self.restart_game()
+        elif self.state == GameState.GAME_OVER:
+            # Return to main menu and completely reset game
+            self.reset_entire_game()
+            self.state = GameState.MENU
+        elif self.state == GameState.PLAYING and self.current_level:
+            # Use SPACE for interactions
+            interaction_result = self.current_level.handle_interaction(self.player)
+            if interaction_result:
+                self.message = interaction_result
+                self.message_timer = 2.0
+    
+    def get_text(self, font: pygame.font.Font, text: str, color, center) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Rendered text and its rect centred on the given point, rendered once per combination"""
+        key = (font, text, color, center)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            surface = to_display_format(font.render(text, True, color))
+            cached = self._text_cache[key] = (surface, surface.get_rect(center=center))
+        return cached
+    
+    def get_message_panel(self, message: str) -> pygame.Surface:
+        """Message text on its bordered background, composed once per message"""
+        panel = self._msg_cache.get(message)
+        if panel is None:
+            message_surface = self.font_medium.render(message, True, (255, 255, 100))
+            width, height = message_surface.get_size()
+            
+            # Message background
+            panel = pygame.Surface((width + 20, height + 10))
+            panel.fill((0, 0, 0))
+            pygame.draw.rect(panel, (255, 255, 100), panel.get_rect(), 2)
+            panel.blit(message_surface, (10, 5))
+            panel = to_display_format(panel)
+            
+            if len(self._msg_cache) >= MESSAGE_CACHE_SIZE:
+                del self._msg_cache[next(iter(self._msg_cache))]  # Drop the oldest
+            self._msg_cache[message] = panel
+        return panel
     
     def draw_ui(self):
         """Draw game UI elements"""
+        blits = self._frame_blits
         # Timer (circular)
         timer_center = (WINDOW_WIDTH - 60, 60)
         timer_radius = 30
@@ -1438,32 +1783,33 @@ class TenSecondLifeGame:
                 pygame.draw.polygon(self.screen, timer_color, points)
         
         # Timer text
+        # render_text caches by string, so these only rasterize when the shown value changes
         timer_text = f"{int(self.timer)}"
-        text_surface = self.font_medium.render(timer_text, True, (255, 255, 255))
+        text_surface = render_text(timer_text, 32, (255, 255, 255))
         text_rect = text_surface.get_rect(center=timer_center)
-        self.screen.blit(text_surface, text_rect)
+        blits.append((text_surface, text_rect))
         
         # Level info
         if self.current_level:
             level_text = f"Level {self.current_level_num}: {self.current_level.title}"
-            level_surface = self.font_medium.render(level_text, True, (255, 255, 255))
-            self.screen.blit(level_surface, (20, 20))
+            level_surface = render_text(level_text, 32, (255, 255, 255))
+            blits.append((level_surface, (20, 20)))
             
             # Current objective (dynamic based on level progress)
             if hasattr(self.current_level, 'get_current_objective'):
                 obj_text = f"Objective: {self.current_level.get_current_objective()}"
             else:
                 obj_text = f"Objective: {self.current_level.objective}"
-            obj_surface = self.font_small.render(obj_text, True, (200, 255, 200))
-            self.screen.blit(obj_surface, (20, 50))
+            obj_surface = render_text(obj_text, 24, (200, 255, 200))
+            blits.append((obj_surface, (20, 50)))
             
             # Player inventory status
             if self.player.inventory:
                 inv_text = f"Carrying: {self.player.inventory.title()}"
-                inv_surface = self.font_small.render(inv_text, True, (255, 255, 100))
-                self.screen.blit(inv_surface, (20, 75))
+                inv_surface = render_text(inv_text, 24, (255, 255, 100))
+                blits.append((inv_surface, (20, 75)))
                 
-                # Key indicator with icon
+                # Key indicator with icon; it sits clear of the queued text, so drawing it first is safe
                 if self.player.inventory == 'key':
                     # Draw small key icon
                     key_x, key_y = 150, 77
@@ -1476,35 +1822,29 @@ class TenSecondLifeGame:
                 if hasattr(self.current_level, 'key_collected') and self.current_level.key_collected:
                     if not hasattr(self.current_level, 'door_unlocked') or not self.current_level.door_unlocked:
                         hint_text = "Press SPACE near the door to unlock it!"
-                        hint_surface = self.font_small.render(hint_text, True, (100, 255, 100))
-                        self.screen.blit(hint_surface, (20, 100))
+                        hint_surface = render_text(hint_text, 24, (100, 255, 100))
+                        blits.append((hint_surface, (20, 100)))
         
         # Lives remaining counter
         lives_text = f"Lives: {self.lives_remaining}/{self.total_lives}"
-        lives_surface = self.font_small.render(lives_text, True, (200, 255, 200))
-        self.screen.blit(lives_surface, (10, WINDOW_HEIGHT - 30))
+        lives_surface = render_text(lives_text, 24, (200, 255, 200))
+        blits.append((lives_surface, (10, WINDOW_HEIGHT - 30)))
         
         # Message display
         if self.message_timer > 0:
-            message_surface = self.font_medium.render(self.message, True, (255, 255, 100))
-            message_rect = message_surface.get_rect(center=(WINDOW_WIDTH//2, 100))
-            
-            # Message background
-            bg_rect = pygame.Rect(message_rect.x - 10, message_rect.y - 5, 
-                                 message_rect.width + 20, message_rect.height + 10)
-            pygame.draw.rect(self.screen, (0, 0, 0, 150), bg_rect)
-            pygame.draw.rect(self.screen, (255, 255, 100), bg_rect, 2)
-            
-            self.screen.blit(message_surface, message_rect)
+            panel = self.get_message_panel(self.message)
+            blits.append((panel, panel.get_rect(center=(WINDOW_WIDTH//2, 100))))
+        
+        # Everything queued so far lands in one call; the bonus below draws over it
+        blit_batch(self.screen, blits)
+        blits.clear()
         
         # Time bonus display
         if self.time_bonus_timer > 0:
             # Animated scaling effect
-            scale = 1.0 + 0.3 * math.sin(self.time_bonus_animation * 2)
+            scale = 1.0 + 0.3 * fast_sin(self.time_bonus_animation * 2)
             font_size = int(36 * scale)
-            bonus_font = pygame.font.Font(None, font_size)
-            
-            bonus_surface = bonus_font.render(self.time_bonus_message, True, (100, 255, 255))
+            bonus_surface = render_text(self.time_bonus_message, font_size, (100, 255, 255))
             bonus_rect = bonus_surface.get_rect(center=(WINDOW_WIDTH//2, 150))
             
             # Glowing background
@@ -1518,34 +1858,25 @@ class TenSecondLifeGame:
     
     def draw_lesson_screen(self):
         """Draw the life lesson screen after level completion"""
+        texts = []
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(get_window_shade((0, 0, 0), 200), (0, 0))
         
         # Main lesson panel
-        panel_width = WINDOW_WIDTH - 100
-        panel_height = 400
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
+        panel_rect = self._lesson_panel
+        panel_x, panel_y, panel_width, panel_height = panel_rect
         
         # Panel background with gradient effect
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
         pygame.draw.rect(self.screen, (40, 40, 60), panel_rect)
         pygame.draw.rect(self.screen, (100, 150, 200), panel_rect, 3)
         
         # "Level Complete!" title
         title_text = f"Level {self.current_level_num} Complete!"
-        title_surface = self.font_large.render(title_text, True, (255, 255, 100))
-        title_rect = title_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 50))
-        self.screen.blit(title_surface, title_rect)
+        texts.append(self.get_text(self.font_large, title_text, (255, 255, 100), (WINDOW_WIDTH//2, panel_y + 50)))
         
         # Life Lesson header
         lesson_header = "Life Lesson:"
-        header_surface = self.font_medium.render(lesson_header, True, (150, 255, 150))
-        header_rect = header_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 100))
-        self.screen.blit(header_surface, header_rect)
+        texts.append(self.get_text(self.font_medium, lesson_header, (150, 255, 150), (WINDOW_WIDTH//2, panel_y + 100)))
         
         # Life lesson text (word wrapped)
         if self.lesson_text:
@@ -1555,72 +1886,40 @@ class TenSecondLifeGame:
         # Next level indicator
         if self.next_level_ready:
             next_text = f"Next: Level {self.current_level_num + 1}"
-            next_surface = self.font_medium.render(next_text, True, (100, 255, 100))
-            next_rect = next_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 80))
-            self.screen.blit(next_surface, next_rect)
+            texts.append(self.get_text(self.font_medium, next_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + panel_height - 80)))
             
             # Continue instruction
             continue_text = "Press SPACE to continue to next level"
-            continue_surface = self.font_small.render(continue_text, True, (100, 255, 100))
-            continue_rect = continue_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 50))
+            continue_surface, continue_rect = self.get_text(self.font_small, continue_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + panel_height - 50))
             
             # Button background
             button_bg = pygame.Rect(continue_rect.x - 15, continue_rect.y - 8, 
                                    continue_rect.width + 30, continue_rect.height + 16)
             pygame.draw.rect(self.screen, (0, 100, 0), button_bg)
             pygame.draw.rect(self.screen, (100, 255, 100), button_bg, 2)
-            self.screen.blit(continue_surface, continue_rect)
+            texts.append((continue_surface, continue_rect))
         else:
             # Final level completed
             final_text = "All levels completed!"
-            final_surface = self.font_medium.render(final_text, True, (255, 200, 100))
-            final_rect = final_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 80))
-            self.screen.blit(final_surface, final_rect)
+            texts.append(self.get_text(self.font_medium, final_text, (255, 200, 100), (WINDOW_WIDTH//2, panel_y + panel_height - 80)))
             
             # Continue to victory instruction
             continue_text = "Press SPACE to see final results"
-            continue_surface = self.font_small.render(continue_text, True, (100, 255, 100))
-            continue_rect = continue_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 50))
+            continue_surface, continue_rect = self.get_text(self.font_small, continue_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + panel_height - 50))
             
             # Button background
             button_bg = pygame.Rect(continue_rect.x - 15, continue_rect.y - 8, 
                                    continue_rect.width + 30, continue_rect.height + 16)
             pygame.draw.rect(self.screen, (0, 100, 0), button_bg)
             pygame.draw.rect(self.screen, (100, 255, 100), button_bg, 2)
-            self.screen.blit(continue_surface, continue_rect)
+            texts.append((continue_surface, continue_rect))
+        
+        blit_batch(self.screen, texts)
     
     def draw_wrapped_text(self, text, x, y, max_width, font, color, center=False):
         """Draw text with word wrapping, optionally centered"""
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surface = font.render(test_line, True, color)
-            
-            if test_surface.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        # Draw each line
-        line_height = font.get_height() + 5
-        for i, line in enumerate(lines):
-            line_surface = font.render(line, True, color)
-            if center:
-                # Center each line within the max_width
-                line_x = x + (max_width - line_surface.get_width()) // 2
-            else:
-                line_x = x
-            self.screen.blit(line_surface, (line_x, y + i * line_height))
+        blit_batch(self.screen, [(surface, (x + dx, y + dy))
+                                 for surface, (dx, dy) in layout_wrapped_text(text, max_width, font, color, center)])
     
     def draw_game(self):
         """Draw the main game scene"""
@@ -1630,22 +1929,16 @@ class TenSecondLifeGame:
     
     def draw_death_screen(self):
         """Draw death screen with motivational second chance"""
+        texts = []
         # Draw game background first
         self.draw_game()
         
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((50, 20, 20))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(get_window_shade((50, 20, 20), 180), (0, 0))
         
         # Main panel
-        panel_width = WINDOW_WIDTH - 100
-        panel_height = 350
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
-        
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        panel_rect = self._death_panel
+        panel_x, panel_y, panel_width, panel_height = panel_rect
         pygame.draw.rect(self.screen, (40, 20, 20), panel_rect)
         pygame.draw.rect(self.screen, (255, 100, 100), panel_rect, 3)
         
@@ -1667,21 +1960,18 @@ class TenSecondLifeGame:
             
             # Lives remaining display
             lives_text = f"Lives Remaining: {self.lives_remaining}"
-            lives_surface = self.font_medium.render(lives_text, True, (255, 255, 100))
-            lives_rect = lives_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 120))
-            self.screen.blit(lives_surface, lives_rect)
+            texts.append(self.get_text(self.font_medium, lives_text, (255, 255, 100), (WINDOW_WIDTH//2, panel_y + panel_height - 120)))
             
             # Restart instruction
             restart_text = "Press SPACE to try again with a fresh start"
-            restart_surface = self.font_medium.render(restart_text, True, (100, 255, 100))
-            restart_rect = restart_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 80))
+            restart_surface, restart_rect = self.get_text(self.font_medium, restart_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + panel_height - 80))
             
             # Button background
             button_bg = pygame.Rect(restart_rect.x - 25, restart_rect.y - 15, 
                                    restart_rect.width + 50, restart_rect.height + 30)
             pygame.draw.rect(self.screen, (0, 100, 0), button_bg)
             pygame.draw.rect(self.screen, (100, 255, 100), button_bg, 3)
-            self.screen.blit(restart_surface, restart_rect)
+            texts.append((restart_surface, restart_rect))
             
             # Warning text based on lives remaining
             if self.lives_remaining == 1:
@@ -1691,9 +1981,7 @@ class TenSecondLifeGame:
                 warning_text = f"⚠️  {self.lives_remaining} lives remaining!"
                 warning_color = (255, 200, 100)
             
-            warning_surface = self.font_small.render(warning_text, True, warning_color)
-            warning_rect = warning_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 40))
-            self.screen.blit(warning_surface, warning_rect)
+            texts.append(self.get_text(self.font_small, warning_text, warning_color, (WINDOW_WIDTH//2, panel_y + panel_height - 40)))
             
         else:
             # Regular death (shouldn't happen with new system, but fallback)
@@ -1701,23 +1989,20 @@ class TenSecondLifeGame:
             title_color = (255, 100, 100)
             
             restart_text = "Press SPACE to restart"
-            restart_surface = self.font_medium.render(restart_text, True, (100, 255, 100))
-            restart_rect = restart_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 60))
-            self.screen.blit(restart_surface, restart_rect)
+            texts.append(self.get_text(self.font_medium, restart_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + panel_height - 60)))
         
         # Title
-        title_surface = self.font_large.render(title_text, True, title_color)
-        title_rect = title_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 40))
-        self.screen.blit(title_surface, title_rect)
+        texts.append(self.get_text(self.font_large, title_text, title_color, (WINDOW_WIDTH//2, panel_y + 40)))
         
         # Menu instruction
         menu_text = "Press ESC for main menu"
-        menu_surface = self.font_small.render(menu_text, True, (200, 200, 200))
-        menu_rect = menu_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + panel_height - 15))
-        self.screen.blit(menu_surface, menu_rect)
+        texts.append(self.get_text(self.font_small, menu_text, (200, 200, 200), (WINDOW_WIDTH//2, panel_y + panel_height - 15)))
+        
+        blit_batch(self.screen, texts)
     
     def draw_game_over_screen(self):
         """Draw game over screen after second failure"""
+        texts = []
         # Gradient background
         for y in range(WINDOW_HEIGHT):
             color_intensity = int(30 + 20 * (y / WINDOW_HEIGHT))
@@ -1725,26 +2010,18 @@ class TenSecondLifeGame:
             pygame.draw.line(self.screen, color, (0, y), (WINDOW_WIDTH, y))
         
         # Main panel
-        panel_width = WINDOW_WIDTH - 80
-        panel_height = 400
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
-        
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        panel_rect = self._game_over_panel
+        panel_x, panel_y, panel_width, panel_height = panel_rect
         pygame.draw.rect(self.screen, (60, 20, 20), panel_rect)
         pygame.draw.rect(self.screen, (255, 100, 100), panel_rect, 4)
         
         # Game Over title
         title_text = "GAME OVER"
-        title_surface = self.font_large.render(title_text, True, (255, 100, 100))
-        title_rect = title_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 60))
-        self.screen.blit(title_surface, title_rect)
+        texts.append(self.get_text(self.font_large, title_text, (255, 100, 100), (WINDOW_WIDTH//2, panel_y + 60)))
         
         # Failure message
         failure_text = f"You ran out of lives on Level {self.current_level_num}."
-        failure_surface = self.font_medium.render(failure_text, True, (255, 200, 200))
-        failure_rect = failure_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 120))
-        self.screen.blit(failure_surface, failure_rect)
+        texts.append(self.get_text(self.font_medium, failure_text, (255, 200, 200), (WINDOW_WIDTH//2, panel_y + 120)))
         
         # Encouraging message
         encourage_lines = [
@@ -1754,30 +2031,28 @@ class TenSecondLifeGame:
         ]
         
         for i, line in enumerate(encourage_lines):
-            line_surface = self.font_small.render(line, True, (255, 255, 200))
-            line_rect = line_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 170 + i * 25))
-            self.screen.blit(line_surface, line_rect)
+            texts.append(self.get_text(self.font_small, line, (255, 255, 200), (WINDOW_WIDTH//2, panel_y + 170 + i * 25)))
         
         # Stats
         stats_text = f"You reached Level {self.current_level_num} using {self.lives_lived} lives"
-        stats_surface = self.font_small.render(stats_text, True, (200, 255, 200))
-        stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 270))
-        self.screen.blit(stats_surface, stats_rect)
+        texts.append(self.get_text(self.font_small, stats_text, (200, 255, 200), (WINDOW_WIDTH//2, panel_y + 270)))
         
         # Try again button
         try_again_text = "Press SPACE to return to main menu"
-        try_again_surface = self.font_medium.render(try_again_text, True, (100, 255, 100))
-        try_again_rect = try_again_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 320))
+        try_again_surface, try_again_rect = self.get_text(self.font_medium, try_again_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + 320))
         
         # Button background
         button_bg = pygame.Rect(try_again_rect.x - 25, try_again_rect.y - 15, 
                                try_again_rect.width + 50, try_again_rect.height + 30)
         pygame.draw.rect(self.screen, (0, 100, 0), button_bg)
         pygame.draw.rect(self.screen, (100, 255, 100), button_bg, 3)
-        self.screen.blit(try_again_surface, try_again_rect)
+        texts.append((try_again_surface, try_again_rect))
+        
+        blit_batch(self.screen, texts)
     
     def draw_victory_screen(self):
         """Draw final victory screen with play again option"""
+        texts = []
         # Gradient background
         for y in range(WINDOW_HEIGHT):
             color_intensity = int(50 + 100 * (y / WINDOW_HEIGHT))
@@ -1785,33 +2060,24 @@ class TenSecondLifeGame:
             pygame.draw.line(self.screen, color, (0, y), (WINDOW_WIDTH, y))
         
         # Victory panel
-        panel_width = WINDOW_WIDTH - 100
-        panel_height = 450
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
+        panel_rect = self._victory_panel
+        panel_x, panel_y, panel_width, panel_height = panel_rect
         
         # Panel background
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
         pygame.draw.rect(self.screen, (40, 40, 60), panel_rect)
         pygame.draw.rect(self.screen, (255, 215, 0), panel_rect, 3)
         
         # Victory text
         victory_text = "🎉 CONGRATULATIONS! 🎉"
-        victory_surface = self.font_large.render(victory_text, True, (255, 255, 100))
-        victory_rect = victory_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 60))
-        self.screen.blit(victory_surface, victory_rect)
+        texts.append(self.get_text(self.font_large, victory_text, (255, 255, 100), (WINDOW_WIDTH//2, panel_y + 60)))
         
         # Completion message
         complete_text = "You've mastered all 3 levels and learned valuable life lessons!"
-        complete_surface = self.font_medium.render(complete_text, True, (200, 255, 200))
-        complete_rect = complete_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 110))
-        self.screen.blit(complete_surface, complete_rect)
+        texts.append(self.get_text(self.font_medium, complete_text, (200, 255, 200), (WINDOW_WIDTH//2, panel_y + 110)))
         
         # Life lessons summary
         lessons_header = "Life Lessons Learned:"
-        header_surface = self.font_medium.render(lessons_header, True, (150, 255, 150))
-        header_rect = header_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 150))
-        self.screen.blit(header_surface, header_rect)
+        texts.append(self.get_text(self.font_medium, lessons_header, (150, 255, 150), (WINDOW_WIDTH//2, panel_y + 150)))
         
         # Individual lessons
         lessons = [
@@ -1821,36 +2087,32 @@ class TenSecondLifeGame:
         ]
         
         for i, lesson in enumerate(lessons):
-            lesson_surface = self.font_small.render(lesson, True, (255, 255, 255))
-            lesson_rect = lesson_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 180 + i * 25))
-            self.screen.blit(lesson_surface, lesson_rect)
+            texts.append(self.get_text(self.font_small, lesson, (255, 255, 255), (WINDOW_WIDTH//2, panel_y + 180 + i * 25)))
         
         # Stats
         stats_text = f"Total Lives Used: {self.lives_lived}"
-        stats_surface = self.font_medium.render(stats_text, True, (255, 255, 100))
-        stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 280))
-        self.screen.blit(stats_surface, stats_rect)
+        texts.append(self.get_text(self.font_medium, stats_text, (255, 255, 100), (WINDOW_WIDTH//2, panel_y + 280)))
         
         # Play again button
         play_again_text = "Press SPACE to Play Again"
-        play_again_surface = self.font_medium.render(play_again_text, True, (100, 255, 100))
-        play_again_rect = play_again_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 330))
+        play_again_surface, play_again_rect = self.get_text(self.font_medium, play_again_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + 330))
         
         # Button background
         button_bg = pygame.Rect(play_again_rect.x - 20, play_again_rect.y - 10, 
                                play_again_rect.width + 40, play_again_rect.height + 20)
         pygame.draw.rect(self.screen, (0, 100, 0), button_bg)
         pygame.draw.rect(self.screen, (100, 255, 100), button_bg, 2)
-        self.screen.blit(play_again_surface, play_again_rect)
+        texts.append((play_again_surface, play_again_rect))
         
         # Menu instruction
         menu_text = "Press ESC to return to main menu"
-        menu_surface = self.font_small.render(menu_text, True, (200, 200, 200))
-        menu_rect = menu_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 380))
-        self.screen.blit(menu_surface, menu_rect)
+        texts.append(self.get_text(self.font_small, menu_text, (200, 200, 200), (WINDOW_WIDTH//2, panel_y + 380)))
+        
+        blit_batch(self.screen, texts)
     
     def draw_menu(self):
         """Draw enhanced main menu with game information"""
+        texts = []
         # Background gradient
         for y in range(WINDOW_HEIGHT):
             color_intensity = int(30 + 50 * (y / WINDOW_HEIGHT))
@@ -1858,23 +2120,15 @@ class TenSecondLifeGame:
             pygame.draw.line(self.screen, color, (0, y), (WINDOW_WIDTH, y))
         
         # Main panel
-        panel_width = WINDOW_WIDTH - 80
-        panel_height = WINDOW_HEIGHT - 100
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
-        
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        panel_rect = self._menu_panel
+        panel_x, panel_y, panel_width, panel_height = panel_rect
         pygame.draw.rect(self.screen, (30, 30, 50, 200), panel_rect)
         pygame.draw.rect(self.screen, (100, 150, 200), panel_rect, 3)
         
         # Title
-        title = self.font_large.render("10 Second Life", True, (255, 255, 100))
-        title_rect = title.get_rect(center=(WINDOW_WIDTH//2, panel_y + 60))
-        self.screen.blit(title, title_rect)
+        texts.append(self.get_text(self.font_large, "10 Second Life", (255, 255, 100), (WINDOW_WIDTH//2, panel_y + 60)))
         
-        subtitle = self.font_medium.render("Echoes of a Short World", True, (200, 200, 255))
-        subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH//2, panel_y + 100))
-        self.screen.blit(subtitle, subtitle_rect)
+        texts.append(self.get_text(self.font_medium, "Echoes of a Short World", (200, 200, 255), (WINDOW_WIDTH//2, panel_y + 100)))
         
         # Game description
         description_lines = [
@@ -1884,15 +2138,11 @@ class TenSecondLifeGame:
         ]
         
         for i, line in enumerate(description_lines):
-            desc_surface = self.font_small.render(line, True, (200, 255, 200))
-            desc_rect = desc_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 150 + i * 25))
-            self.screen.blit(desc_surface, desc_rect)
+            texts.append(self.get_text(self.font_small, line, (200, 255, 200), (WINDOW_WIDTH//2, panel_y + 150 + i * 25)))
         
         # Level preview
         levels_header = "Levels & Life Lessons:"
-        header_surface = self.font_medium.render(levels_header, True, (255, 200, 100))
-        header_rect = header_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 240))
-        self.screen.blit(header_surface, header_rect)
+        texts.append(self.get_text(self.font_medium, levels_header, (255, 200, 100), (WINDOW_WIDTH//2, panel_y + 240)))
         
         level_info = [
             "Level 1: First Steps - Learn the power of taking initiative",
@@ -1903,92 +2153,122 @@ class TenSecondLifeGame:
         ]
         
         for i, level in enumerate(level_info):
-            level_surface = self.font_small.render(level, True, (255, 255, 255))
-            level_rect = level_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 265 + i * 22))
-            self.screen.blit(level_surface, level_rect)
+            texts.append(self.get_text(self.font_small, level, (255, 255, 255), (WINDOW_WIDTH//2, panel_y + 265 + i * 22)))
         
         # Start button (moved down to accommodate 5 levels)
         start_text = "Press SPACE to Begin Your Journey"
-        start_surface = self.font_medium.render(start_text, True, (100, 255, 100))
-        start_rect = start_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 400))
+        start_surface, start_rect = self.get_text(self.font_medium, start_text, (100, 255, 100), (WINDOW_WIDTH//2, panel_y + 400))
         
         # Button background
         button_bg = pygame.Rect(start_rect.x - 25, start_rect.y - 15, 
                                start_rect.width + 50, start_rect.height + 30)
         pygame.draw.rect(self.screen, (0, 100, 0), button_bg)
         pygame.draw.rect(self.screen, (100, 255, 100), button_bg, 3)
-        self.screen.blit(start_surface, start_rect)
+        texts.append((start_surface, start_rect))
         
         # Controls (moved down and made more compact)
         controls_header = "Controls:"
-        controls_surface = self.font_small.render(controls_header, True, (255, 200, 100))
-        controls_rect = controls_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 460))
-        self.screen.blit(controls_surface, controls_rect)
+        texts.append(self.get_text(self.font_small, controls_header, (255, 200, 100), (WINDOW_WIDTH//2, panel_y + 460)))
         
         controls = [
             "Arrow Keys: Move • SPACE: Interact & Continue • ESC: Menu"
         ]
         
         for i, control in enumerate(controls):
-            control_surface = self.font_small.render(control, True, (200, 200, 200))
-            control_rect = control_surface.get_rect(center=(WINDOW_WIDTH//2, panel_y + 480 + i * 18))
-            self.screen.blit(control_surface, control_rect)
+            texts.append(self.get_text(self.font_small, control, (200, 200, 200), (WINDOW_WIDTH//2, panel_y + 480 + i * 18)))
+        
+        blit_batch(self.screen, texts)
     
     def draw_level_complete(self):
         """Draw level complete screen"""
-        complete_text = self.font_large.render("Level Complete!", True, COLORS['success'])
-        complete_rect = complete_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-        self.screen.blit(complete_text, complete_rect)
-        
-        continue_text = self.font_medium.render("Press SPACE to continue", True, COLORS['text'])
-        continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 20))
-        self.screen.blit(continue_text, continue_rect)
+        blit_batch(self.screen, [
+            self.get_text(self.font_large, "Level Complete!", COLORS['success'], (WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50)),
+            self.get_text(self.font_medium, "Press SPACE to continue", COLORS['text'], (WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 20)),
+        ])
     
     def draw_victory(self):
         """Draw victory screen"""
-        victory_text = self.font_large.render("Congratulations!", True, COLORS['success'])
-        victory_rect = victory_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-        self.screen.blit(victory_text, victory_rect)
+        texts = []
+        texts.append(self.get_text(self.font_large, "Congratulations!", COLORS['success'], (WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50)))
         
         stats_text = f"Completed in {self.progress.total_lives_used} lives"
-        stats_surface = self.font_medium.render(stats_text, True, COLORS['text'])
-        stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-        self.screen.blit(stats_surface, stats_rect)
+        texts.append(self.get_text(self.font_medium, stats_text, COLORS['text'], (WINDOW_WIDTH//2, WINDOW_HEIGHT//2)))
+        
+        blit_batch(self.screen, texts)
+    
+    def draw_cached_overlay(self, draw_screen):
+        """Blit a full-window screen from its cached copy, redrawing it only when its numbers change"""
+        key = (self.current_level_num, self.lives_lived)
+        cached = self._overlay_surfaces.get(self.state)
+        if cached is None or cached[0] != key:
+            self.screen.fill(COLORS['background'])
+            draw_screen()
+            self._overlay_surfaces[self.state] = (key, self.screen.copy())
+        else:
+            self.screen.blit(cached[1], (0, 0))
     
     def draw(self):
         """Main draw method"""
-        self.screen.fill(COLORS['background'])
-        
         if self.state == GameState.MENU:
-            self.draw_menu()
+            self.draw_cached_overlay(self.draw_menu)
         elif self.state == GameState.PLAYING:
+            self.screen.fill(COLORS['background'])
             self.draw_game()
             self.draw_ui()
         elif self.state == GameState.DEATH:
+            self.screen.fill(COLORS['background'])
             self.draw_death_screen()
         elif self.state == GameState.LEVEL_COMPLETE:
             # Draw game background first
+            self.screen.fill(COLORS['background'])
             self.draw_game()
             self.draw_ui()
             # Then draw lesson screen overlay
             if self.show_lesson:
                 self.draw_lesson_screen()
         elif self.state == GameState.VICTORY:
-            self.draw_victory_screen()
+            self.draw_cached_overlay(self.draw_victory_screen)
         elif self.state == GameState.GAME_OVER:
-            self.draw_game_over_screen()
+            self.draw_cached_overlay(self.draw_game_over_screen)
         
         pygame.display.flip()
+        self.mark_drawn()
+    
+    def is_animating(self) -> bool:
+        if self.state == GameState.LEVEL_COMPLETE:
+            # The HUD message and time bonus keep animating under the lesson
+            return self.message_timer > 0 or self.time_bonus_timer > 0
+        return super().is_animating()
     
     def run(self):
         """Main game loop"""
         try:
+            # Simulation advances in fixed steps fed by the monotonic perf counter;
+            # tick() only paces the loop, its whole-millisecond result isn't used
+            accumulator = 0.0
+            last_time = time.perf_counter()
             while self.running:
-                dt = self.clock.tick(FPS) / 1000.0
+                # Gameplay is paced by vsync when granted, otherwise by spinning for precise
+                # frame timing; static screens only wait for input and sleep
+                if self.state == GameState.PLAYING:
+                    if not self.vsync:
+                        self.clock.tick_busy_loop(FPS)
+                else:
+                    self.clock.tick(IDLE_FPS if self.state in STATIC_STATES else FPS)
+                now = time.perf_counter()
+                # A stall (window drag, breakpoint) shouldn't eat the whole life at once
+                accumulator = min(accumulator + now - last_time, MAX_FRAME_TIME)
+                last_time = now
                 
                 self.handle_events()
-                self.update(dt)
-                self.draw()
+                if self.state in STATIC_STATES:
+                    # Nothing simulates on static screens; drop the time instead of stepping
+                    accumulator = 0.0
+                while accumulator >= UPDATE_STEP:
+                    self.update(UPDATE_STEP)
+                    accumulator -= UPDATE_STEP
+                if self.needs_redraw():
+                    self.draw()
         except Exception as e:
             print(f"Game error: {e}")
             print(f"Game state: {self.state}")
@@ -5,6 +5,7 @@ Enhanced graphics and visual effects for 10 Second Life
 import pygame
 import math
 import random
+import numpy as np
 from typing import List, Tuple
 
 # Enhanced color palette
@@ -117,24 +118,23 @@ class ParticleSystem:
 
 def draw_gradient_rect(screen, rect, color1, color2, vertical=True):
     """Draw a gradient rectangle"""
+    rect = pygame.Rect(rect)
+    area = rect.clip(screen.get_rect())
+    if not area.width or not area.height:
+        return
+    
+    # Interpolate every row (or column) at once and write them in one go
+    steps = rect.height if vertical else rect.width
+    ratio = (np.arange(steps) / steps)[:, None]
+    colors = (np.array(color1[:3]) * (1 - ratio) + np.array(color2[:3]) * ratio).astype(np.uint8)
     if vertical:
-        for y in range(rect.height):
-            ratio = y / rect.height
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(screen, (r, g, b), 
-                           (rect.x, rect.y + y), 
-                           (rect.x + rect.width, rect.y + y))
+        block = colors[None, area.top - rect.top:area.bottom - rect.top]
     else:
-        for x in range(rect.width):
-            ratio = x / rect.width
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(screen, (r, g, b), 
-                           (rect.x + x, rect.y), 
-                           (rect.x + x, rect.y + rect.height))
+        block = colors[area.left - rect.left:area.right - rect.left, None]
+    
+    pixels = pygame.surfarray.pixels3d(screen)
+    pixels[area.left:area.right, area.top:area.bottom] = block
+    del pixels  # unlock the surface
 
 def draw_enhanced_player(screen, x, y, width, height, glow=False):
     """Draw an enhanced player sprite"""
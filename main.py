@@ -5,15 +5,29 @@ A 2D puzzle-adventure game where each life lasts only 10 seconds
 """
 
 import pygame
+import gc
 import json
 import os
 import sys
 import math
+import queue
+import threading
 import random
+import numpy as np
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from advanced_graphics import *
+from render_utils import BlitRecorder, TextCache
+
+# Colors used on per-frame paths, bound once instead of looked up in PALETTE each time
+_C_VINES = PALETTE.get('tree_dark', (0, 128, 0))
+_C_ITEM_GLOW = PALETTE['item_glow']
+_C_UI_ACCENT = PALETTE['ui_accent']
+_C_SUCCESS = PALETTE['text_success']
+_C_DANGER = PALETTE['text_danger']
+_C_NATURE = PALETTE['particle_nature']
 
 # Initialize Pygame
 pygame.init()
@@ -43,9 +57,32 @@ class Direction(Enum):
     DOWN_LEFT = (-1, 1)
     DOWN_RIGHT = (1, 1)
 
+def _build_move_lut():
+    """(dx, dy) for every up/down/left/right key mask; right and down win ties"""
+    lut = []
+    for mask in range(16):
+        dx = 1 if mask & 1 else (-1 if mask & 2 else 0)
+        dy = 1 if mask & 4 else (-1 if mask & 8 else 0)
+        # Normalize diagonal movement
+        if dx != 0 and dy != 0:
+            dx *= 0.707
+            dy *= 0.707
+        lut.append((dx, dy))
+    return tuple(lut)
+
+_MOVE_LUT = _build_move_lut()
+
+# WorldState fields that are lists of ids
+_WORLD_STATE_LISTS = ('doors_opened', 'seeds_planted', 'items_collected', 'npcs_talked_to',
+                      'switches_activated', 'vines_burned', 'areas_unlocked')
+
 @dataclass
 class WorldState:
     """Persistent world state that survives across lives"""
+    # Fixed slots instead of a per-instance __dict__ (spelled out by hand so
+    # this still works before dataclass(slots=True) existed)
+    __slots__ = _WORLD_STATE_LISTS + ('life_count', 'total_time_played', '_sets')
+    
     doors_opened: List[str]
     seeds_planted: List[str]
     items_collected: List[str]
@@ -57,22 +94,74 @@ class WorldState:
     total_time_played: float
     
     def to_dict(self):
+        # Lists are copied so the snapshot can be saved from another thread
         return {
-            'doors_opened': self.doors_opened,
-            'seeds_planted': self.seeds_planted,
-            'items_collected': self.items_collected,
-            'npcs_talked_to': self.npcs_talked_to,
-            'switches_activated': self.switches_activated,
-            'vines_burned': self.vines_burned,
-            'areas_unlocked': self.areas_unlocked,
+            'doors_opened': list(self.doors_opened),
+            'seeds_planted': list(self.seeds_planted),
+            'items_collected': list(self.items_collected),
+            'npcs_talked_to': list(self.npcs_talked_to),
+            'switches_activated': list(self.switches_activated),
+            'vines_burned': list(self.vines_burned),
+            'areas_unlocked': list(self.areas_unlocked),
             'life_count': self.life_count,
             'total_time_played': self.total_time_played
         }
     
+    def __post_init__(self):
+        # Set shadows of the list fields for O(1) membership tests; the lists
+        # stay the source of truth for saving
+        self._sets = {name: set(getattr(self, name)) for name in _WORLD_STATE_LISTS}
+    
+    def has(self, field, value):
+        return value in self._sets[field]
+    
+    def add(self, field, value):
+        getattr(self, field).append(value)
+        self._sets[field].add(value)
+    
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
 
+@lru_cache(maxsize=16)
+def generate_tone_samples(frequency, duration, sample_rate):
+    """Build a stereo int16 sine tone, computed in one vectorized pass"""
+    frames = int(duration * sample_rate)
+    t = np.arange(frames) / sample_rate
+    wave = (np.sin(2 * np.pi * frequency * t) * 0.3 * 32767).astype(np.int16)  # Reduced volume
+    samples = np.column_stack((wave, wave))  # Stereo
+    samples.setflags(write=False)  # Shared between callers through the cache
+    return samples
+
+@lru_cache(maxsize=64)
+def wrap_and_render(text, max_width, font, color, max_lines=3):
+    """Word-wrap text to max_width and return the rendered line surfaces"""
+    words = text.split(' ')
+    lines = []
+    current_line = []
+    
+    for word in words:
+        test_line = ' '.join(current_line + [word])
+        if font.size(test_line)[0] < max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+    
+    if current_line:
+        lines.append(' '.join(current_line))
+    
+    return tuple(font.render(line, True, color) for line in lines[:max_lines])
+
+def swap_remove(objects, obj):
+    """Remove obj from an order-insensitive list by swapping in the last element"""
+    for i in range(len(objects) - 1, -1, -1):
+        if objects[i] is obj:
+            objects[i] = objects[-1]
+            objects.pop()
+            return
+
 class GameObject:
     def __init__(self, x, y, width, height, color=None):
         self.x = x
@@ -81,10 +170,14 @@ class GameObject:
         self.height = height
         self.color = color or PALETTE['text_primary']
         self.rect = pygame.Rect(x, y, width, height)
+        self.x2 = x + width  # Far edges kept for inline AABB tests
+        self.y2 = y + height
     
     def update_rect(self):
         self.rect.x = self.x
         self.rect.y = self.y
+        self.x2 = self.x + self.width
+        self.y2 = self.y + self.height
     
     def draw(self, screen):
         pygame.draw.rect(screen, self.color, self.rect)
@@ -98,7 +191,11 @@ class Player(GameObject):
         self.spawn_y = y
         self.glow_timer = 0
     
-    def move(self, dx, dy, dt, obstacles):
+    def move(self, dx, dy, dt, obstacle_grid):
+        # Standing still can't collide with anything new
+        if dx == 0 and dy == 0:
+            return
+        
         # Calculate new position
         new_x = self.x + dx * self.speed * dt
         new_y = self.y + dy * self.speed * dt
@@ -107,18 +204,17 @@ class Player(GameObject):
         new_x = max(0, min(SCREEN_WIDTH - self.width, new_x))
         new_y = max(0, min(SCREEN_HEIGHT - self.height, new_y))
         
-        # Check collision with obstacles
-        temp_rect = pygame.Rect(new_x, new_y, self.width, self.height)
-        collision = False
-        for obstacle in obstacles:
-            if temp_rect.colliderect(obstacle.rect):
-                collision = True
-                break
-        
-        if not collision:
-            self.x = new_x
-            self.y = new_y
-            self.update_rect()
+        # Check collision against only the obstacles in nearby grid cells,
+        # comparing raw edges instead of building a temporary Rect
+        new_x2 = new_x + self.width
+        new_y2 = new_y + self.height
+        for obstacle in obstacle_grid.query_box(new_x, new_y, new_x2, new_y2):
+            if new_x < obstacle.x2 and new_x2 > obstacle.x and new_y < obstacle.y2 and new_y2 > obstacle.y:
+                return  # Blocked, stay put
+        
+        self.x = new_x
+        self.y = new_y
+        self.update_rect()
     
     def reset_position(self):
         self.x = self.spawn_x
@@ -140,21 +236,32 @@ class NPC(GameObject):
         self.dialogue = dialogue or []
         self.dialogue_index = 0
         self.has_talked = False
+        # Dialogue picker chosen once by name instead of re-checking it on every call
+        self._dialogue_fn = _DIALOGUE_BY_NAME.get(name, _scripted_dialogue)
     
     def get_current_dialogue(self, world_state):
         if not self.dialogue:
             return f"Hello, I'm {self.name}!"
         
-        # Adjust dialogue based on world state
-        if self.name == "Talking Tree":
-            if world_state.life_count == 1:
-                return "Welcome, young soul. Your journey begins now..."
-            elif len(world_state.seeds_planted) > 0:
-                return "I remember you planted a seed. It grows with each life..."
-            else:
-                return "Each life teaches us something new. What will you learn?"
-        
-        return self.dialogue[self.dialogue_index % len(self.dialogue)]
+        return self._dialogue_fn(self, world_state)
+
+def _scripted_dialogue(npc, world_state):
+    """Cycle through the NPC's own dialogue lines"""
+    return npc.dialogue[npc.dialogue_index % len(npc.dialogue)]
+
+def _tree_dialogue(npc, world_state):
+    """Adjust the Talking Tree's dialogue based on world state"""
+    if world_state.life_count == 1:
+        return "Welcome, young soul. Your journey begins now..."
+    elif world_state.seeds_planted:
+        return "I remember you planted a seed. It grows with each life..."
+    else:
+        return "Each life teaches us something new. What will you learn?"
+
+# NPCs whose dialogue reacts to the world state; everyone else is scripted
+_DIALOGUE_BY_NAME = {
+    "Talking Tree": _tree_dialogue,
+}
 
 class Item(GameObject):
     def __init__(self, x, y, name, color=None):
@@ -199,6 +306,40 @@ class Switch(GameObject):
         color = GREEN if self.is_activated else RED
         pygame.draw.rect(screen, color, self.rect)
 
+class SpatialHash:
+    """Uniform grid of static objects, bucketed by the cells their rects cover"""
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+    
+    def _cells_for(self, left, top, right, bottom):
+        cs = self.cell_size
+        for cx in range(int(left // cs), int((right - 1) // cs) + 1):
+            for cy in range(int(top // cs), int((bottom - 1) // cs) + 1):
+                yield (cx, cy)
+    
+    def insert(self, obj):
+        for cell in self._cells_for(obj.x, obj.y, obj.x2, obj.y2):
+            self.cells.setdefault(cell, []).append(obj)
+    
+    def remove(self, obj):
+        for cell in self._cells_for(obj.x, obj.y, obj.x2, obj.y2):
+            bucket = self.cells.get(cell)
+            if bucket and obj in bucket:
+                bucket.remove(obj)
+    
+    def query(self, rect):
+        """Objects sharing a cell with rect (a superset of those colliding with it)"""
+        return self.query_box(rect.left, rect.top, rect.right, rect.bottom)
+    
+    def query_box(self, left, top, right, bottom):
+        """Same as query, for a box given by its edges"""
+        found = {}
+        for cell in self._cells_for(left, top, right, bottom):
+            for obj in self.cells.get(cell, ()):
+                found[id(obj)] = obj
+        return list(found.values())
+
 class Game:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -209,8 +350,13 @@ class Game:
         # Game state
         self.state = GameState.MENU
         self.life_timer = LIFE_DURATION
+        self._last_heartbeat = LIFE_DURATION  # Timer value at the last low-time heartbeat
         self.world_state = self.load_world_state()
         
+        # Saves are written by a background thread so a slow disk never stalls a frame
+        self._save_queue = queue.Queue()
+        threading.Thread(target=self._save_worker, daemon=True).start()
+        
         # Advanced graphics system
         self.particle_system = AdvancedParticleSystem()
         self.screen_shake = 0
@@ -228,6 +374,58 @@ class Game:
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
         
+        # Pre-rendered death screen title with its glow (text never changes)
+        self._death_title_surf = make_glow_surface(self.font_large, "Life Complete!", PALETTE['text_danger'],
+                                                   (150, 0, 0), GLOW_OFFSETS_3)
+        self._death_title_rect = self._death_title_surf.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 120))
+        
+        # Death screen overlay is allocated and filled once, then reused
+        self._death_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._death_overlay.set_alpha(200)
+        self._death_overlay.fill(PALETTE['ui_bg'])
+        
+        # Static instruction text pairs, composed once into single surfaces
+        interact_text = self.font_small.render("E/SPACE: Interact", True, PALETTE['ui_accent'])
+        move_text = self.font_small.render("WASD/Arrows: Move", True, PALETTE['text_secondary'])
+        self._controls_surf, self._controls_pos = compose_blits([
+            (interact_text, (30, SCREEN_HEIGHT - 35)),
+            (move_text, (200, SCREEN_HEIGHT - 35)),
+        ])
+        next_text = self.font_medium.render("SPACE: Next Life", True, PALETTE['text_success'])
+        reset_text = self.font_medium.render("R: Reset Progress", True, PALETTE['text_danger'])
+        self._death_controls_surf, self._death_controls_pos = compose_blits([
+            (next_text, next_text.get_rect(center=(SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2 + 185))),
+            (reset_text, reset_text.get_rect(center=(SCREEN_WIDTH//2 + 80, SCREEN_HEIGHT//2 + 185))),
+        ])
+        
+        # Static HUD panels (life, inventory, goal, controls, progress) are
+        # worked out as one blit list, rebuilt only after a life starts or the
+        # player interacts with something (the only times they can change)
+        self._hud_blits = []
+        self._hud_dirty = True
+        
+        # Fixed-layout panel rects, allocated once and reused every frame
+        self._r_life = pygame.Rect(20, 120, 220, 40)
+        self._r_inv = pygame.Rect(20, 170, 280, 35)
+        self._r_objective = pygame.Rect(20, SCREEN_HEIGHT - 80, 500, 35)
+        self._r_controls = pygame.Rect(20, SCREEN_HEIGHT - 45, 450, 30)
+        self._r_progress = pygame.Rect(20, 220, 250, 0)  # Height follows the item count
+        self._r_menu_stats = pygame.Rect(SCREEN_WIDTH//2 - 120, SCREEN_HEIGHT//2 + 90, 240, 35)
+        self._r_continue = pygame.Rect(SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2 + 160, 400, 45)
+        self._r_dialogue = pygame.Rect(50, SCREEN_HEIGHT - 150, SCREEN_WIDTH - 100, 100)
+        
+        # Shared pulse alpha for interaction hints, refreshed each draw_game
+        self._hint_alpha = 150
+        
+        # Rendered labels that repeat every frame, bounded so changing text can't grow it forever
+        self._text_cache = TextCache()
+        self._name_tags = {}
+        
+        # Last rendered timer text and the (text, color) it was rendered for
+        self._timer_key = None
+        self._timer_surf = None
+        self._timer_rect = None
+        
         # Game objects
         self.player = Player(100, 100)
         self.npcs = []
@@ -236,7 +434,7 @@ class Game:
         self.switches = []
         self.obstacles = []
         
-        # Dialogue system
+        # Dialogue system (setting current_dialogue also wraps and renders it)
         self.current_dialogue = ""
         self.dialogue_timer = 0
         self.dialogue_npc = None
@@ -277,13 +475,7 @@ class Game:
     
     def generate_tone(self, frequency, duration, sample_rate):
         """Generate a simple tone"""
-        import numpy as np
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        for i in range(frames):
-            wave = np.sin(2 * np.pi * frequency * i / sample_rate)
-            arr[i] = [wave * 0.3, wave * 0.3]  # Stereo, reduced volume
-        return (arr * 32767).astype(np.int16)
+        return generate_tone_samples(frequency, duration, sample_rate)
     
     def play_sound(self, sound_name):
         """Play a sound effect"""
@@ -311,17 +503,41 @@ class Game:
         
         # Determine level based on actual progress, not just life count
         # LEVEL 1: Until key is collected and door is opened
-        if "key" not in self.world_state.items_collected or "simple_door" not in self.world_state.doors_opened:
+        if not self.world_state.has('items_collected', "key") or not self.world_state.has('doors_opened', "simple_door"):
             self.setup_level_1()
         # LEVEL 2: After Level 1 is complete, until coin is collected
-        elif "coin" not in self.world_state.items_collected:
+        elif not self.world_state.has('items_collected', "coin"):
             self.setup_level_2()
         # LEVEL 3: After Level 2 is complete, until seed puzzle is solved
-        elif "seed" not in self.world_state.items_collected:
+        elif not self.world_state.has('items_collected', "seed"):
             self.setup_level_3()
         # LEVEL 4: Full complexity for experienced players
         else:
             self.setup_level_4()
+        
+        self.rebuild_spatial_index()
+        self.bake_static_obstacles()
+    
+    def bake_static_obstacles(self):
+        """Draw walls and barriers into a copy of the background once per world setup"""
+        base, _ = get_background_surface(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self._world_bg = base.copy()
+        self._dynamic_obstacles = []
+        for obstacle in self.obstacles:
+            if obstacle.color == _C_VINES:
+                self._dynamic_obstacles.append(obstacle)  # Vines can be burned away
+            else:
+                obstacle.draw(self._world_bg)
+    
+    def rebuild_spatial_index(self):
+        """Bucket the world's static objects so collision checks only look nearby"""
+        self.grids = {}
+        for kind, objects in (('npcs', self.npcs), ('items', self.items), ('doors', self.doors),
+                              ('switches', self.switches), ('obstacles', self.obstacles)):
+            grid = SpatialHash()
+            for obj in objects:
+                grid.insert(obj)
+            self.grids[kind] = grid
     
     def setup_level_1(self):
         """Level 1: Simple introduction - talk to tree, find obvious key"""
@@ -337,13 +553,13 @@ class Game:
         
         # VERY OBVIOUS key right next to the tree - can't miss it!
         key = Item(450, 280, "key")
-        if "key" in self.world_state.items_collected:
+        if self.world_state.has('items_collected', "key"):
             key.collected = True
         self.items.append(key)
         
         # Simple door that's clearly visible
         door1 = Door(600, 200, "simple_door")
-        if "simple_door" in self.world_state.doors_opened:
+        if self.world_state.has('doors_opened', "simple_door"):
             door1.is_open = True
         self.doors.append(door1)
         
@@ -369,7 +585,7 @@ class Game:
         
         # VERY OBVIOUS coin placement - even more obvious than the key
         coin = Item(500, 250, "coin")
-        if "coin" in self.world_state.items_collected:
+        if self.world_state.has('items_collected', "coin"):
             coin.collected = True
         self.items.append(coin)
         
@@ -379,7 +595,7 @@ class Game:
         self.doors.append(door1)
         
         # Add a second obvious door that opens when you get the coin
-        if "coin" in self.world_state.items_collected:
+        if self.world_state.has('items_collected', "coin"):
             door2 = Door(200, 300, "treasure_door")
             door2.is_open = True
             self.doors.append(door2)
@@ -415,7 +631,7 @@ class Game:
         
         # Simple seed placement - obvious but requires a bit of exploration
         seed = Item(300, 400, "seed")
-        if "seed" in self.world_state.items_collected:
+        if self.world_state.has('items_collected', "seed"):
             seed.collected = True
         self.items.append(seed)
         
@@ -429,7 +645,7 @@ class Game:
         self.doors.append(door2)
         
         # Add reward door after giving seed to tree
-        if "seed" in self.world_state.items_collected:
+        if self.world_state.has('items_collected', "seed"):
             door3 = Door(700, 400, "magic_door")
             door3.is_open = True
             self.doors.append(door3)
@@ -472,7 +688,7 @@ class Game:
         
         for item_name, x, y in items_data:
             item = Item(x, y, item_name)
-            if item_name in self.world_state.items_collected:
+            if self.world_state.has('items_collected', item_name):
                 item.collected = True
             self.items.append(item)
         
@@ -485,13 +701,13 @@ class Game:
         
         for door_id, x, y in doors_data:
             door = Door(x, y, door_id)
-            if door_id in self.world_state.doors_opened:
+            if self.world_state.has('doors_opened', door_id):
                 door.is_open = True
             self.doors.append(door)
         
         # Add vines that can be burned
         if not self.world_state.vines_burned:
-            vine_obstacle = GameObject(400, 500, 200, 50, PALETTE.get('tree_dark', (0, 128, 0)))
+            vine_obstacle = GameObject(400, 500, 200, 50, _C_VINES)
             self.obstacles.append(vine_obstacle)
         
         # Add complex walls and obstacles
@@ -556,49 +772,110 @@ class Game:
         )
     
     def save_world_state(self):
-        """Save persistent world state to file"""
-        try:
-            with open('world_state.json', 'w') as f:
-                json.dump(self.world_state.to_dict(), f, indent=2)
-        except:
-            pass
+        """Queue a snapshot of the persistent world state for saving"""
+        self._save_queue.put(self.world_state.to_dict())
+    
+    def _save_worker(self):
+        """Write queued world state snapshots to file, newest wins"""
+        while True:
+            data = self._save_queue.get()
+            pending = 1
+            while not self._save_queue.empty():
+                data = self._save_queue.get()
+                pending += 1
+            try:
+                # Write then rename, so a crash mid-save never leaves a truncated file
+                with open('world_state.json.tmp', 'w') as f:
+                    json.dump(data, f)
+                os.replace('world_state.json.tmp', 'world_state.json')
+            except:
+                pass
+            for _ in range(pending):
+                self._save_queue.task_done()
     
     def start_new_life(self):
         """Start a new 10-second life"""
         self.state = GameState.PLAYING
         self.life_timer = LIFE_DURATION
+        self._last_heartbeat = LIFE_DURATION  # Low-time heartbeats start over each life
         self.world_state.life_count += 1
         self.player.reset_position()
+        self._hud_dirty = True
         self.setup_world()  # Refresh world based on current state
         
+        # A life is only 10 seconds; hold off cyclic GC so a collection pass
+        # can't land mid-frame, and catch up on the death screen instead.
+        # GC sweeps showing up as dropped frames is the problem described in
+        # pygame issues #430 and #450
+        gc.disable()
+        
         # Play heartbeat at start of life
         self.play_sound('heartbeat')
     
     def end_life(self):
         """End current life and show death screen"""
         self.state = GameState.DEATH
+        gc.collect()
+        gc.enable()
         self.save_world_state()
+        self.on_death()
         self.play_sound('death')
     
+    def on_death(self):
+        """Render the death screen text once; the values are frozen until the next life"""
+        self._death_explanation = []
+        self._death_stats = []
+        
+        # Game explanation for new players
+        if self.world_state.life_count <= 3:
+            explanation_lines = [
+                "Each life lasts 10 seconds, but your actions persist!",
+                "Items you collect and puzzles you solve stay completed.",
+                "Use multiple lives to explore and progress through the world."
+            ]
+            
+            for i, line in enumerate(explanation_lines):
+                exp_text = self.font_small.render(line, True, PALETTE['text_secondary'])
+                exp_rect = exp_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80 + i * 25))
+                self._death_explanation.append((exp_text, exp_rect))
+        
+        # Professional stats panel
+        stats = [
+            (f"Life #{self.world_state.life_count} completed", PALETTE['ui_accent']),
+            (f"Total time played: {self.world_state.total_time_played:.1f}s", PALETTE['text_secondary']),
+            (f"Progress: {len(self.world_state.doors_opened)} doors opened", PALETTE['item_key']),
+            (f"Items found: {len(self.world_state.items_collected)}", PALETTE['item_glow']),
+        ]
+        
+        self._stats_panel_rect = pygame.Rect(SCREEN_WIDTH//2 - 220, SCREEN_HEIGHT//2 - 30, 440, len(stats) * 35 + 30)
+        
+        y_offset = SCREEN_HEIGHT//2 + 10
+        for stat, color in stats:
+            stat_text = self.font_small.render(stat, True, color)
+            stat_rect = stat_text.get_rect(center=(SCREEN_WIDTH//2, y_offset))
+            self._death_stats.append((stat_text, stat_rect))
+            y_offset += 35
+    
     def handle_interaction(self):
         """Handle player interaction with objects"""
         player_rect = self.player.rect
+        self._hud_dirty = True  # Pickups, doors and puzzles all change the HUD
         
         # Check NPC interactions
-        for npc in self.npcs:
+        for npc in self.grids['npcs'].query(player_rect):
             if player_rect.colliderect(npc.rect):
                 self.start_dialogue(npc)
                 self.play_sound('interact')
                 return
         
         # Check item pickup
-        for item in self.items[:]:  # Use slice to avoid modification during iteration
+        for item in self.grids['items'].query(player_rect):
             if player_rect.colliderect(item.rect) and not item.collected:
                 if self.player.inventory is None:  # Can only carry one item
                     self.player.inventory = item.name
-                    item.collected = True
-                    self.items.remove(item)
-                    self.world_state.items_collected.append(item.name)
+                    item.collected = True  # Tombstone; draw and objectives skip collected items
+                    self.grids['items'].remove(item)
+                    self.world_state.add('items_collected', item.name)
                     # Add advanced pickup effect
                     self.particle_system.add_explosion(item.x + 16, item.y + 16, PALETTE['item_glow'], 12)
                     self.particle_system.add_sparkle_trail(item.x + 16, item.y + 16, PALETTE['ui_accent'], 6)
@@ -610,14 +887,14 @@ class Game:
                 return
         
         # Check door interactions
-        for door in self.doors:
+        for door in self.grids['doors'].query(player_rect):
             if player_rect.colliderect(door.rect):
                 if not door.is_open:
                     # Try to open door
                     if door.door_id == "cavern_door" and self.player.inventory == "key":
                         door.is_open = True
-                        self.world_state.doors_opened.append(door.door_id)
-                        self.world_state.areas_unlocked.append("memory_cavern")
+                        self.world_state.add('doors_opened', door.door_id)
+                        self.world_state.add('areas_unlocked', "memory_cavern")
                         self.player.inventory = None  # Use up the key
                         # Add advanced door opening effect
                         self.particle_system.add_explosion(door.x + 32, door.y + 48, PALETTE['item_key'], 15)
@@ -630,12 +907,12 @@ class Game:
                 return
         
         # Check switch interactions
-        for switch in self.switches:
+        for switch in self.grids['switches'].query(player_rect):
             if player_rect.colliderect(switch.rect):
                 if not switch.is_activated:
                     switch.is_activated = True
                     switch.color = PALETTE['text_success']
-                    self.world_state.switches_activated.append(switch.switch_id)
+                    self.world_state.add('switches_activated', switch.switch_id)
                     # Add advanced switch activation effect
                     self.particle_system.add_explosion(switch.x + 16, switch.y + 8, PALETTE['text_success'], 10)
                     self.particle_system.add_sparkle_trail(switch.x + 16, switch.y + 8, PALETTE['text_success'], 4)
@@ -652,7 +929,7 @@ class Game:
                     break
             
             if tree_pos and abs(self.player.x - tree_pos[0]) < 100 and abs(self.player.y - tree_pos[1]) < 100:
-                self.world_state.seeds_planted.append("garden_seed")
+                self.world_state.add('seeds_planted', "garden_seed")
                 self.player.inventory = None
                 # Add advanced nature effect for seed planting
                 self.particle_system.add_explosion(tree_pos[0] + 32, tree_pos[1] + 40, PALETTE['particle_nature'], 12)
@@ -666,13 +943,15 @@ class Game:
         
         elif self.player.inventory == "torch":
             # Burn vines
-            for obstacle in self.obstacles[:]:
-                if player_rect.colliderect(obstacle.rect) and obstacle.color == PALETTE.get('tree_dark', (0, 128, 0)):
+            for obstacle in self.grids['obstacles'].query(player_rect):
+                if player_rect.colliderect(obstacle.rect) and obstacle.color == _C_VINES:
                     # Add advanced fire effect before removing vines
                     self.particle_system.add_explosion(obstacle.x + 32, obstacle.y + 32, PALETTE['particle_fire'], 20)
                     self.particle_system.add_fire_effect(obstacle.x + 32, obstacle.y + 32, 10)
-                    self.obstacles.remove(obstacle)
-                    self.world_state.vines_burned.append("vines_entrance")
+                    swap_remove(self.obstacles, obstacle)
+                    swap_remove(self._dynamic_obstacles, obstacle)
+                    self.grids['obstacles'].remove(obstacle)
+                    self.world_state.add('vines_burned', "vines_entrance")
                     self.player.inventory = None
                     self.screen_shake = 0.3
                     self.play_sound('interact')
@@ -686,8 +965,8 @@ class Game:
         self.dialogue_timer = 3.0  # Show dialogue for 3 seconds
         
         # Mark NPC as talked to
-        if npc.name not in self.world_state.npcs_talked_to:
-            self.world_state.npcs_talked_to.append(npc.name)
+        if not self.world_state.has('npcs_talked_to', npc.name):
+            self.world_state.add('npcs_talked_to', npc.name)
     
     def update(self, dt):
         """Update game state"""
@@ -699,7 +978,7 @@ class Game:
             self.screen_shake -= dt
         
         # Update player glow
-        if hasattr(self.player, 'glow_timer') and self.player.glow_timer > 0:
+        if self.player.glow_timer > 0:
             self.player.glow_timer -= dt
         
         if self.state == GameState.PLAYING:
@@ -712,34 +991,23 @@ class Game:
                 self.end_life()
                 return
             
-            # Handle input
+            # Handle input: pack the four directions into a mask and look up
+            # the (already diagonal-normalized) movement vector
             keys = pygame.key.get_pressed()
-            dx = dy = 0
-            
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                dx = -1
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                dx = 1
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
-                dy = -1
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                dy = 1
-            
-            # Normalize diagonal movement
-            if dx != 0 and dy != 0:
-                dx *= 0.707
-                dy *= 0.707
+            mask = ((bool(keys[pygame.K_UP] or keys[pygame.K_w]) << 3)
+                    | (bool(keys[pygame.K_DOWN] or keys[pygame.K_s]) << 2)
+                    | (bool(keys[pygame.K_LEFT] or keys[pygame.K_a]) << 1)
+                    | bool(keys[pygame.K_RIGHT] or keys[pygame.K_d]))
+            dx, dy = _MOVE_LUT[mask]
             
             # Move player
-            self.player.move(dx, dy, dt, self.obstacles)
+            self.player.move(dx, dy, dt, self.grids['obstacles'])
             
             # Play heartbeat when time is running low
             if self.life_timer <= 3.0 and int(self.life_timer * 4) % 2 == 0:
-                if hasattr(self, '_last_heartbeat') and self.life_timer < self._last_heartbeat - 0.5:
+                if self.life_timer < self._last_heartbeat - 0.5:
                     self.play_sound('heartbeat')
                     self._last_heartbeat = self.life_timer
-                elif not hasattr(self, '_last_heartbeat'):
-                    self._last_heartbeat = self.life_timer
         
         elif self.state == GameState.DIALOGUE:
             # Update dialogue timer
@@ -801,8 +1069,10 @@ class Game:
             shake_offset_x = random.randint(-3, 3)
             shake_offset_y = random.randint(-3, 3)
         
-        # Advanced professional background
-        draw_advanced_background(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+        # Advanced professional background, with the static walls baked in while playing
+        in_world = self.state == GameState.PLAYING or self.state == GameState.DIALOGUE
+        draw_advanced_background(self.screen, SCREEN_WIDTH, SCREEN_HEIGHT,
+                                 self._world_bg if in_world else None)
         
         if self.state == GameState.MENU:
             self.draw_menu()
@@ -824,28 +1094,23 @@ class Game:
     def draw_menu(self):
         """Draw the professional main menu"""
         # Title with glow effect
-        title = self.font_large.render("10 Second Life", True, PALETTE['ui_accent'])
-        subtitle = self.font_medium.render("Echoes of a Short World", True, PALETTE['text_secondary'])
-        instruction = self.font_small.render("Press SPACE to start your first life", True, PALETTE['text_primary'])
+        title = make_glow_surface(self.font_large, "10 Second Life", PALETTE['ui_accent'],
+                                  (100, 80, 0), GLOW_OFFSETS_2)
+        subtitle = self.render_text(self.font_medium, "Echoes of a Short World", PALETTE['text_secondary'])
+        instruction = self.render_text(self.font_small, "Press SPACE to start your first life", PALETTE['text_primary'])
         
         # Center text with glow effects
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
         instruction_rect = instruction.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
         
-        # Title glow effect
-        glow_title = self.font_large.render("10 Second Life", True, (100, 80, 0))
-        for offset in [(-2, -2), (2, -2), (-2, 2), (2, 2)]:
-            self.screen.blit(glow_title, (title_rect.x + offset[0], title_rect.y + offset[1]))
-        
         self.screen.blit(title, title_rect)
         self.screen.blit(subtitle, subtitle_rect)
         self.screen.blit(instruction, instruction_rect)
         
         # Show stats if player has played before
         if self.world_state.life_count > 0:
-            stats_panel_rect = pygame.Rect(SCREEN_WIDTH//2 - 120, SCREEN_HEIGHT//2 + 90, 240, 35)
-            draw_advanced_ui_panel(self.screen, stats_panel_rect, f"Lives lived: {self.world_state.life_count}", 
+            draw_advanced_ui_panel(self.screen, self._r_menu_stats, f"Lives lived: {self.world_state.life_count}", 
                                   alpha=180, border_color=PALETTE['text_success'])
             
             # Add sparkle effects around the title
@@ -853,11 +1118,18 @@ class Game:
     
     def draw_game(self):
         """Draw the main game with advanced graphics"""
-        # Draw obstacles with better styling
-        for obstacle in self.obstacles:
-            if obstacle.color == PALETTE.get('tree_dark', (0, 128, 0)):
+        # Pulsing effects share one clock read per frame instead of one per object
+        now = pygame.time.get_ticks()
+        item_glow_alpha = int(100 + 50 * math.sin(now * 0.005))
+        npc_glow_alpha = int(80 + 40 * math.sin(now * 0.004))
+        # Hint panels pulse in steps of 10 alpha so their cached panels get reused
+        self._hint_alpha = int(150 + 50 * math.sin(now * 0.003)) // 10 * 10
+        
+        # Draw obstacles with better styling (static ones are already in the background)
+        for obstacle in self._dynamic_obstacles:
+            if obstacle.color == _C_VINES:
                 # Draw vines with texture
-                pygame.draw.rect(self.screen, PALETTE['particle_nature'], obstacle.rect)
+                pygame.draw.rect(self.screen, _C_NATURE, obstacle.rect)
                 # Add vine texture
                 for i in range(0, obstacle.rect.width, 8):
                     for j in range(0, obstacle.rect.height, 8):
@@ -890,7 +1162,7 @@ class Game:
         
         # Draw switches with professional styling
         for switch in self.switches:
-            base_color = PALETTE['text_success'] if switch.is_activated else PALETTE['text_danger']
+            base_color = _C_SUCCESS if switch.is_activated else _C_DANGER
             
             # Switch base
             pygame.draw.rect(self.screen, base_color, switch.rect, border_radius=4)
@@ -903,10 +1175,8 @@ class Game:
             
             # Glow effect for activated switches
             if switch.is_activated:
-                glow_surf = pygame.Surface((switch.rect.width + 8, switch.rect.height + 8), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, (*PALETTE['text_success'], 100), 
-                               (0, 0, switch.rect.width + 8, switch.rect.height + 8), 
-                               border_radius=6)
+                glow_surf = get_glow_rect((switch.rect.width + 8, switch.rect.height + 8),
+                                          (*_C_SUCCESS, 100), 6)
                 self.screen.blit(glow_surf, (switch.rect.x - 4, switch.rect.y - 4))
         
         # Draw items with advanced sprites and interaction hints
@@ -922,24 +1192,23 @@ class Game:
                                      (item.x + item.width//2, item.y + item.height//2), 
                                      max(item.width, item.height)//2)
                     # Add bright border to make it more visible
-                    pygame.draw.circle(self.screen, PALETTE['item_glow'], 
+                    pygame.draw.circle(self.screen, _C_ITEM_GLOW, 
                                      (item.x + item.width//2, item.y + item.height//2), 
                                      max(item.width, item.height)//2, 3)
                 
                 # Add glow effect and interaction hint when near
                 if self.is_near_player(item, 50):
                     # Pulsing glow effect
-                    time_offset = pygame.time.get_ticks() * 0.005
-                    glow_alpha = int(100 + 50 * math.sin(time_offset))
-                    glow_surf = pygame.Surface((item.width + 20, item.height + 20), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (*PALETTE['item_glow'][:3], glow_alpha), 
-                                     (item.width//2 + 10, item.height//2 + 10), item.width//2 + 10)
+                    glow_surf = get_glow_circle((item.width + 20, item.height + 20),
+                                                (item.width//2 + 10, item.height//2 + 10), item.width//2 + 10,
+                                                (*_C_ITEM_GLOW, item_glow_alpha))
                     self.screen.blit(glow_surf, (item.x - 10, item.y - 10))
                     
                     # Interaction hint
                     self.draw_interaction_hint(item.x + item.width//2, item.y - 25, f"Press E to take {item.name}")
         
         # Draw NPCs with advanced sprites and interaction feedback
+        name_tags = []
         for npc in self.npcs:
             if id(npc) in self.sprites['npcs']:
                 npc_sprite = self.sprites['npcs'][id(npc)]
@@ -952,28 +1221,22 @@ class Game:
             
             # Add interaction glow when near
             if self.is_near_player(npc, 60):
-                time_offset = pygame.time.get_ticks() * 0.004
-                glow_alpha = int(80 + 40 * math.sin(time_offset))
-                glow_surf = pygame.Surface((npc.width + 30, npc.height + 30), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*PALETTE['ui_accent'][:3], glow_alpha), 
-                                 (npc.width//2 + 15, npc.height//2 + 15), npc.width//2 + 15)
+                glow_surf = get_glow_circle((npc.width + 30, npc.height + 30),
+                                            (npc.width//2 + 15, npc.height//2 + 15), npc.width//2 + 15,
+                                            (*_C_UI_ACCENT, npc_glow_alpha))
                 self.screen.blit(glow_surf, (npc.x - 15, npc.y - 15))
                 
                 # Interaction hint
                 self.draw_interaction_hint(npc.x + npc.width//2, npc.y - 35, f"Press E to talk to {npc.name}")
             
-            # Draw professional name tag
-            name_text = self.font_small.render(npc.name, True, PALETTE['ui_accent'])
-            name_rect = name_text.get_rect(center=(npc.x + npc.width//2, npc.y - 20))
-            
-            # Professional name background
-            bg_rect = pygame.Rect(name_rect.x - 8, name_rect.y - 4, 
-                                name_rect.width + 16, name_rect.height + 8)
-            draw_advanced_ui_panel(self.screen, bg_rect, alpha=180)
-            self.screen.blit(name_text, name_rect)
+            # Professional name tag, queued so all tags go out in one batch
+            name_tag = self.get_name_tag(npc.name)
+            name_tags.append((name_tag, name_tag.get_rect(center=(npc.x + npc.width//2, npc.y - 20))))
+        
+        blit_batch(self.screen, name_tags)
         
         # Draw player with advanced sprite
-        glow = hasattr(self.player, 'glow_timer') and self.player.glow_timer > 0
+        glow = self.player.glow_timer > 0
         self.player_sprite.draw_with_glow(self.screen, self.player.x, self.player.y, glow)
         
         # Draw UI
@@ -982,25 +1245,25 @@ class Game:
     def get_current_objective(self):
         """Get the current objective for the player based on actual progress"""
         # Level 1: Until key is collected and door is opened
-        if "key" not in self.world_state.items_collected or "simple_door" not in self.world_state.doors_opened:
+        if not self.world_state.has('items_collected', "key") or not self.world_state.has('doors_opened', "simple_door"):
             if self.world_state.life_count == 1:
                 return "Talk to the Talking Tree (E to interact)"
             elif "key" in [item.name for item in self.items if not item.collected]:
                 return "Pick up the GOLDEN KEY next to the tree"
-            elif "simple_door" not in self.world_state.doors_opened:
+            elif not self.world_state.has('doors_opened', "simple_door"):
                 return "Use the key to unlock the door (E to interact)"
             else:
                 return "🎉 Amazing! You've mastered the basics!"
         
         # Level 2: After Level 1 complete, until coin is collected
-        elif "coin" not in self.world_state.items_collected:
+        elif not self.world_state.has('items_collected', "coin"):
             if "coin" in [item.name for item in self.items if not item.collected]:
                 return "Collect the SHINY COIN near the tree"
             else:
                 return "🌟 Fantastic! You found the treasure! Talk to the Fox!"
         
         # Level 3: After Level 2 complete, until seed puzzle is solved
-        elif "seed" not in self.world_state.items_collected:
+        elif not self.world_state.has('items_collected', "seed"):
             if "seed" in [item.name for item in self.items if not item.collected]:
                 return "Find the SEED and bring it to the hungry tree"
             else:
@@ -1015,6 +1278,35 @@ class Game:
             else:
                 return "🏆 Master level! Explore all areas and NPCs"
     
+    @property
+    def current_dialogue(self):
+        return self._current_dialogue
+    
+    @current_dialogue.setter
+    def current_dialogue(self, text):
+        # Wrap and render up front so draw_dialogue only blits
+        self._current_dialogue = text
+        self._dialogue_surfs = wrap_and_render(text, self._r_dialogue.width - 20,
+                                               self.font_small, PALETTE['text_primary'])
+    
+    def render_text(self, font, text, color):
+        """Render a label once and reuse the surface on later frames"""
+        return self._text_cache.render(font, text, color)
+    
+    def get_name_tag(self, name):
+        """NPC name label on its panel background, composed once per name"""
+        name_tag = self._name_tags.get(name)
+        if name_tag is None:
+            name_text = self.render_text(self.font_small, name, PALETTE['ui_accent'])
+            tag_rect = pygame.Rect(0, 0, name_text.get_width() + 16, name_text.get_height() + 8)
+            name_tag = pygame.Surface(tag_rect.size, pygame.SRCALPHA)
+            
+            # Professional name background
+            draw_advanced_ui_panel(name_tag, tag_rect, alpha=180)
+            name_tag.blit(name_text, (8, 4))
+            self._name_tags[name] = name_tag
+        return name_tag
+    
     def is_near_player(self, obj, distance=40):
         """Check if object is near the player"""
         player_center = (self.player.x + 16, self.player.y + 16)
@@ -1025,74 +1317,88 @@ class Game:
     
     def draw_interaction_hint(self, x, y, text):
         """Draw floating interaction hint"""
-        hint_text = self.font_small.render(text, True, PALETTE['ui_accent'])
+        hint_text = self.render_text(self.font_small, text, _C_UI_ACCENT)
         hint_rect = hint_text.get_rect(center=(x, y))
         
-        # Animated background
-        time_offset = pygame.time.get_ticks() * 0.003
-        alpha = int(150 + 50 * math.sin(time_offset))
-        
+        # Animated background (alpha computed once per frame in draw_game)
         bg_rect = pygame.Rect(hint_rect.x - 8, hint_rect.y - 4, 
                             hint_rect.width + 16, hint_rect.height + 8)
-        draw_advanced_ui_panel(self.screen, bg_rect, alpha=alpha, border_color=PALETTE['ui_accent'])
+        draw_advanced_ui_panel(self.screen, bg_rect, alpha=self._hint_alpha, border_color=_C_UI_ACCENT)
         self.screen.blit(hint_text, hint_rect)
     
     def draw_ui(self):
         """Draw professional UI elements"""
+        # Per-frame lookups bound to locals once
+        life_timer = self.life_timer
+        screen = self.screen
+        
         # Advanced circular timer
-        timer_progress = self.life_timer / LIFE_DURATION
-        if self.life_timer <= 3.0:
+        timer_progress = life_timer / LIFE_DURATION
+        if life_timer <= 3.0:
             timer_color = PALETTE['text_danger']
-        elif self.life_timer <= 5.0:
+        elif life_timer <= 5.0:
             timer_color = (255, 165, 0)  # Orange warning
         else:
             timer_color = PALETTE['text_primary']
         
         # Draw professional circular timer
         timer_center = (80, 60)
-        draw_circular_timer(self.screen, timer_center, 35, timer_progress, timer_color)
+        draw_circular_timer(screen, timer_center, 35, timer_progress, timer_color)
+        
+        # HUD text is collected here and blitted in one batch at the end
+        blit_list = []
+        
+        # Timer text in center, with a glow sprite for low time; the shown
+        # value only changes every 0.1s, so re-render only when it does
+        timer_key = (f"{life_timer:.1f}", timer_color)
+        if timer_key != self._timer_key:
+            timer_str = timer_key[0]
+            if life_timer <= 3.0:
+                timer_text = make_glow_surface(self.font_medium, timer_str, timer_color,
+                                               (100, 0, 0), GLOW_OFFSETS_1)
+            else:
+                timer_text = self.font_medium.render(timer_str, True, timer_color)
+            self._timer_surf = timer_text
+            self._timer_rect = timer_text.get_rect(center=timer_center)
+            self._timer_key = timer_key
         
-        # Timer text in center with glow effect
-        timer_text = self.font_medium.render(f"{self.life_timer:.1f}", True, timer_color)
-        timer_rect = timer_text.get_rect(center=timer_center)
+        blit_list.append((self._timer_surf, self._timer_rect))
         
-        # Add glow effect for low time
-        if self.life_timer <= 3.0:
-            glow_text = self.font_medium.render(f"{self.life_timer:.1f}", True, (100, 0, 0))
-            for offset in [(-1, -1), (1, -1), (-1, 1), (1, 1)]:
-                self.screen.blit(glow_text, (timer_rect.x + offset[0], timer_rect.y + offset[1]))
+        # Static panels come from the cached HUD layer
+        if self._hud_dirty:
+            self.build_hud_background(self.get_current_objective())
+            self._hud_dirty = False
+        blit_list.extend(self._hud_blits)
         
-        self.screen.blit(timer_text, timer_rect)
+        # Text never overlaps a panel drawn after it, so batching keeps the layering
+        blit_batch(screen, blit_list)
+    
+    def build_hud_background(self, objective):
+        """Work out the static HUD panel blits once; draw_ui replays them each frame"""
+        # Recorded rather than flattened into one layer: translucent panels composited
+        # into an SRCALPHA layer don't blend to the same pixels as drawing them directly
+        layer = BlitRecorder()
         
         # Professional life count panel
-        life_panel_rect = pygame.Rect(20, 120, 220, 40)
-        draw_advanced_ui_panel(self.screen, life_panel_rect, f"Life #{self.world_state.life_count}", 
+        draw_advanced_ui_panel(layer, self._r_life, f"Life #{self.world_state.life_count}", 
                               alpha=200, border_color=PALETTE['ui_accent'])
         
         # Professional inventory display
         if self.player.inventory:
-            inv_panel_rect = pygame.Rect(20, 170, 280, 35)
-            draw_advanced_ui_panel(self.screen, inv_panel_rect, f"Carrying: {self.player.inventory}", 
+            draw_advanced_ui_panel(layer, self._r_inv, f"Carrying: {self.player.inventory}", 
                                   alpha=190, border_color=PALETTE['item_glow'])
         
         # Clear objective panel - show current goal
-        objective = self.get_current_objective()
         if objective:
-            obj_panel_rect = pygame.Rect(20, SCREEN_HEIGHT - 80, 500, 35)
-            draw_advanced_ui_panel(self.screen, obj_panel_rect, f"Goal: {objective}", 
+            draw_advanced_ui_panel(layer, self._r_objective, f"Goal: {objective}", 
                                   alpha=200, border_color=PALETTE['text_success'])
         
         # Professional instructions panel
-        instruction_panel_rect = pygame.Rect(20, SCREEN_HEIGHT - 45, 450, 30)
-        draw_advanced_ui_panel(self.screen, instruction_panel_rect, "Controls", 
+        draw_advanced_ui_panel(layer, self._r_controls, "Controls", 
                               alpha=160, border_color=PALETTE['text_secondary'])
         
         # Split instructions for better readability
-        interact_text = self.font_small.render("E/SPACE: Interact", True, PALETTE['ui_accent'])
-        move_text = self.font_small.render("WASD/Arrows: Move", True, PALETTE['text_secondary'])
-        
-        self.screen.blit(interact_text, (30, SCREEN_HEIGHT - 35))
-        self.screen.blit(move_text, (200, SCREEN_HEIGHT - 35))
+        layer.blit(self._controls_surf, self._controls_pos)
         
         # Professional progress tracking
         progress_items = []
@@ -1106,117 +1412,53 @@ class Game:
             progress_items.append((f"✓ {len(self.world_state.areas_unlocked)} areas unlocked", PALETTE['ui_accent']))
         
         if progress_items:
-            progress_panel_height = len(progress_items) * 28 + 25
-            progress_panel_rect = pygame.Rect(20, 220, 250, progress_panel_height)
-            draw_advanced_ui_panel(self.screen, progress_panel_rect, "Progress", 
+            self._r_progress.height = len(progress_items) * 28 + 25
+            draw_advanced_ui_panel(layer, self._r_progress, "Progress", 
                                   alpha=185, border_color=PALETTE['text_success'])
             
             for i, (item, color) in enumerate(progress_items):
                 progress_text = self.font_small.render(item, True, color)
                 # Add small glow effect for achievements
                 glow_text = self.font_small.render(item, True, (color[0]//3, color[1]//3, color[2]//3))
-                self.screen.blit(glow_text, (31, 246 + i * 28))
-                self.screen.blit(progress_text, (30, 245 + i * 28))
+                layer.blit(glow_text, (31, 246 + i * 28))
+                layer.blit(progress_text, (30, 245 + i * 28))
+        
+        self._hud_blits = layer.blits
     
     def draw_death_screen(self):
         """Draw the professional death screen"""
         # Professional overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(PALETTE['ui_bg'])
-        self.screen.blit(overlay, (0, 0))
-        
-        # Professional death message
-        death_text = self.font_large.render("Life Complete!", True, PALETTE['text_danger'])
-        death_rect = death_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 120))
-        
-        # Enhanced glow effect
-        for i, offset in enumerate([(3, 3), (-3, -3), (3, -3), (-3, 3)]):
-            alpha = 150 - i * 30
-            glow_text = self.font_large.render("Life Complete!", True, (150, 0, 0))
-            glow_rect = glow_text.get_rect(center=(SCREEN_WIDTH//2 + offset[0], SCREEN_HEIGHT//2 - 120 + offset[1]))
-            self.screen.blit(glow_text, glow_rect)
+        self.screen.blit(self._death_overlay, (0, 0))
         
-        self.screen.blit(death_text, death_rect)
+        # Professional death message with enhanced glow effect
+        self.screen.blit(self._death_title_surf, self._death_title_rect)
         
-        # Game explanation for new players
-        if self.world_state.life_count <= 3:
-            explanation_lines = [
-                "Each life lasts 10 seconds, but your actions persist!",
-                "Items you collect and puzzles you solve stay completed.",
-                "Use multiple lives to explore and progress through the world."
-            ]
-            
-            for i, line in enumerate(explanation_lines):
-                exp_text = self.font_small.render(line, True, PALETTE['text_secondary'])
-                exp_rect = exp_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80 + i * 25))
-                self.screen.blit(exp_text, exp_rect)
-        
-        # Professional stats panel
-        stats = [
-            (f"Life #{self.world_state.life_count} completed", PALETTE['ui_accent']),
-            (f"Total time played: {self.world_state.total_time_played:.1f}s", PALETTE['text_secondary']),
-            (f"Progress: {len(self.world_state.doors_opened)} doors opened", PALETTE['item_key']),
-            (f"Items found: {len(self.world_state.items_collected)}", PALETTE['item_glow']),
-        ]
-        
-        stats_panel_rect = pygame.Rect(SCREEN_WIDTH//2 - 220, SCREEN_HEIGHT//2 - 30, 440, len(stats) * 35 + 30)
-        draw_advanced_ui_panel(self.screen, stats_panel_rect, "Life Summary", 
+        # Explanation and stats panel, with the text rendered once in on_death()
+        blit_batch(self.screen, self._death_explanation)
+        draw_advanced_ui_panel(self.screen, self._stats_panel_rect, "Life Summary", 
                               alpha=220, border_color=PALETTE['ui_accent'])
-        
-        y_offset = SCREEN_HEIGHT//2 + 10
-        for stat, color in stats:
-            stat_text = self.font_small.render(stat, True, color)
-            stat_rect = stat_text.get_rect(center=(SCREEN_WIDTH//2, y_offset))
-            self.screen.blit(stat_text, stat_rect)
-            y_offset += 35
+        blit_batch(self.screen, self._death_stats)
         
         # Professional instructions
-        instruction_panel_rect = pygame.Rect(SCREEN_WIDTH//2 - 200, SCREEN_HEIGHT//2 + 160, 400, 45)
-        draw_advanced_ui_panel(self.screen, instruction_panel_rect, "Continue", 
+        draw_advanced_ui_panel(self.screen, self._r_continue, "Continue", 
                               alpha=200, border_color=PALETTE['text_primary'])
         
         # Split instructions for clarity
-        next_text = self.font_medium.render("SPACE: Next Life", True, PALETTE['text_success'])
-        reset_text = self.font_medium.render("R: Reset Progress", True, PALETTE['text_danger'])
-        
-        next_rect = next_text.get_rect(center=(SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2 + 185))
-        reset_rect = reset_text.get_rect(center=(SCREEN_WIDTH//2 + 80, SCREEN_HEIGHT//2 + 185))
-        
-        self.screen.blit(next_text, next_rect)
-        self.screen.blit(reset_text, reset_rect)
+        self.screen.blit(self._death_controls_surf, self._death_controls_pos)
     
     def draw_dialogue(self):
         """Draw dialogue box"""
         # Professional dialogue box background
-        dialogue_rect = pygame.Rect(50, SCREEN_HEIGHT - 150, SCREEN_WIDTH - 100, 100)
+        dialogue_rect = self._r_dialogue
         draw_advanced_ui_panel(self.screen, dialogue_rect, alpha=220, border_color=PALETTE['ui_accent'])
         
         # NPC name with professional styling
         if self.dialogue_npc:
-            name_text = self.font_medium.render(self.dialogue_npc.name, True, PALETTE['ui_accent'])
+            name_text = self.render_text(self.font_medium, self.dialogue_npc.name, PALETTE['ui_accent'])
             self.screen.blit(name_text, (dialogue_rect.x + 15, dialogue_rect.y + 10))
         
-        # Dialogue text (wrap if too long)
-        words = self.current_dialogue.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if self.font_small.size(test_line)[0] < dialogue_rect.width - 20:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
         # Draw dialogue lines with professional styling
-        for i, line in enumerate(lines[:3]):  # Max 3 lines
-            line_text = self.font_small.render(line, True, PALETTE['text_primary'])
+        for i, line_text in enumerate(self._dialogue_surfs):  # Max 3 lines
             self.screen.blit(line_text, (dialogue_rect.x + 15, dialogue_rect.y + 40 + i * 20))
     
     def run(self):
@@ -1228,18 +1470,12 @@ class Game:
             self.update(dt)
             self.draw()
         
-        # Save state before quitting
+        # Save state before quitting, waiting for the writer to finish
         self.save_world_state()
+        self._save_queue.join()
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    try:
-        import numpy as np
-    except ImportError:
-        print("Installing required dependencies...")
-        os.system("pip install numpy pygame")
-        import numpy as np
-    
     game = Game()
     game.run()
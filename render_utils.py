@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Shared Rendering Helpers for 10 Second Life
+Small pieces used by every game module's draw code
+"""
+
+import numpy as np
+from collections import OrderedDict
+
+TEXT_CACHE_SIZE = 256
+
+def blit_batch(screen, blit_list):
+    """Blit a list of (surface, pos) pairs in one call"""
+    # pygame-ce has the faster fblits; plain pygame only has blits
+    if hasattr(screen, 'fblits'):
+        screen.fblits(blit_list)
+    else:
+        screen.blits(blit_list, doreturn=False)
+
+class TextCache:
+    """Rendered labels keyed by (font, text, color), least recently used dropped first"""
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+    
+    def render(self, font, text, color):
+        """Render a label once and reuse the surface on later frames"""
+        key = (font, text, color)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._surfaces[key] = surf
+            if len(self._surfaces) > self.max_size:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(key)
+        return surf
+
+class BlitRecorder:
+    """Stands in for a surface and records its blits, to be replayed later with blit_batch"""
+    def __init__(self):
+        self.blits = []
+    
+    def blit(self, source, dest):
+        # Keep just the position; callers may reuse and resize the rect afterwards
+        self.blits.append((source, tuple(dest[:2])))
+
+class ParticlePool:
+    """Base for particle systems that keep their particles in parallel NumPy arrays"""
+    # Subclasses list their array attribute names here; live particles are
+    # packed into [:count] of each
+    _ARRAYS = ()
+    
+    def _reserve(self, needed: int):
+        """Grow the arrays (doubling) so they can hold at least needed particles"""
+        capacity = len(getattr(self, self._ARRAYS[0]))
+        if needed <= capacity:
+            return
+        # max() covers an empty pool, which doubling alone would never grow
+        capacity = max(needed, capacity * 2, 1)
+        for name in self._ARRAYS:
+            old = getattr(self, name)
+            grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
+
+class RedrawGate:
+    """Mixin for games that skip redrawing a static screen when nothing on it changed"""
+    # Screens that only change in response to input; set per game
+    STATIC_STATES = ()
+    
+    def init_redraw_gate(self):
+        self._dirty = True
+        self._drawn_state = None
+    
+    def mark_dirty(self):
+        """Force a repaint on the next frame"""
+        self._dirty = True
+    
+    def mark_drawn(self):
+        """Call after flipping a finished frame"""
+        self._dirty = False
+        self._drawn_state = self.state
+    
+    def is_animating(self) -> bool:
+        """Whether the current screen changes on its own; games extend this"""
+        return self.state not in self.STATIC_STATES
+    
+    def needs_redraw(self) -> bool:
+        """False while a static screen is already on display and nothing changed"""
+        return self._dirty or self.state is not self._drawn_state or self.is_animating()
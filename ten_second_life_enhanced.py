@@ -7,7 +7,9 @@ Beautiful graphics, immersive audio, and meaningful life lessons
 import pygame
 import json
 import math
-import random
+import operator
+import time
+import numpy as np
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
@@ -15,6 +17,7 @@ from typing import List, Dict, Optional, Tuple
 # Import our enhanced systems
 from enhanced_graphics import *
 from audio_system import AudioSystem
+from render_utils import RedrawGate, TextCache
 
 # Initialize Pygame
 pygame.init()
@@ -24,6 +27,7 @@ WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 768
 FPS = 60
 LIFE_DURATION = 10.0
+RAND_BATCH = 1024
 
 class GameState(Enum):
     MENU = "menu"
@@ -33,6 +37,9 @@ class GameState(Enum):
     LESSON = "lesson"
     VICTORY = "victory"
 
+# Screens that only change in response to input
+STATIC_STATES = (GameState.MENU, GameState.LEVEL_COMPLETE, GameState.VICTORY)
+
 @dataclass
 class GameProgress:
     current_level: int = 1
@@ -57,7 +64,9 @@ class GameObject:
         self.glow_time = 0
     
     def update_rect(self):
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        # Size never changes after construction, so just move the existing rect
+        self.rect.x = int(self.x)
+        self.rect.y = int(self.y)
     
     def update(self, dt: float):
         self.glow_time += dt
@@ -66,6 +75,10 @@ class GameObject:
         pygame.draw.rect(screen, self.color, self.rect)
 
 class EnhancedPlayer(GameObject):
+    # One C call pulls every movement key out of get_pressed()
+    _movekeys = operator.itemgetter(pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d,
+                                    pygame.K_UP, pygame.K_w, pygame.K_DOWN, pygame.K_s)
+    
     def __init__(self, x: int, y: int, audio_system: AudioSystem):
         super().__init__(x, y, 20, 20, PALETTE['player_blue'])
         self.speed = 200
@@ -74,24 +87,31 @@ class EnhancedPlayer(GameObject):
         self.start_y = y
         self.audio = audio_system
         self.move_timer = 0
+        # Movement bounds, fixed for the player's size
+        self.max_x = WINDOW_WIDTH - self.width - 10
+        self.max_y = WINDOW_HEIGHT - self.height - 10
     
     def update(self, dt: float, keys):
         super().update(dt)
         old_x, old_y = self.x, self.y
         
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.x -= self.speed * dt
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.x += self.speed * dt
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.y -= self.speed * dt
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            self.y += self.speed * dt
-        
-        self.x = max(10, min(WINDOW_WIDTH - self.width - 10, self.x))
-        self.y = max(10, min(WINDOW_HEIGHT - self.height - 10, self.y))
-        
-        if (old_x != self.x or old_y != self.y):
+        l1, l2, r1, r2, u1, u2, d1, d2 = self._movekeys(keys)
+        step = self.speed * dt
+        x = old_x + ((r1 or r2) - (l1 or l2)) * step
+        y = old_y + ((d1 or d2) - (u1 or u2)) * step
+        
+        # Plain compares instead of max(min(...)) builtin calls
+        if x < 10:
+            x = 10
+        elif x > self.max_x:
+            x = self.max_x
+        if y < 10:
+            y = 10
+        elif y > self.max_y:
+            y = self.max_y
+        self.x, self.y = x, y
+        
+        if (old_x != x or old_y != y):
             self.move_timer += dt
             if self.move_timer > 0.3:
                 self.audio.play_contextual_sound("player_move")
@@ -157,10 +177,45 @@ class Level:
         self.items = []
         self.doors = []
         self.particles = ParticleSystem()
+        
+        # Rects of uncollected items and of doors, in the order collidelist reports them
+        self._live_items = []
+        self._item_rects = []
+        self._door_rects = []
+        
+        # Per-frame spawn rolls come from a pre-generated NumPy batch
+        self._rng = np.random.default_rng()
+        self._refill_random()
     
     def setup(self, audio_system: AudioSystem):
         pass
     
+    def _refill_random(self):
+        """Pre-generate a batch of spawn rolls and (dx, dy) jitter offsets"""
+        self._rand_rolls = self._rng.random(RAND_BATCH).tolist()
+        self._rand_offsets = self._rng.integers(-20, 21, size=(RAND_BATCH, 2)).tolist()
+        self._rand_i = 0
+    
+    def next_random(self):
+        """Next (roll, (dx, dy)) pair from the batch, refilling it when used up"""
+        i = self._rand_i
+        if i == RAND_BATCH:
+            self._refill_random()
+            i = 0
+        self._rand_i = i + 1
+        return self._rand_rolls[i], self._rand_offsets[i]
+    
+    def index_objects(self):
+        """Rebuild the rect lists used for collision; call after items/doors change"""
+        self._live_items = [item for item in self.items if not item.collected]
+        self._item_rects = [item.rect for item in self._live_items]
+        self._door_rects = [door.rect for door in self.doors]
+    
+    def colliding_item(self, player: EnhancedPlayer) -> Optional[EnhancedItem]:
+        """First uncollected item the player touches, found in a single C call"""
+        idx = player.rect.collidelist(self._item_rects)
+        return None if idx == -1 else self._live_items[idx]
+    
     def update(self, dt: float, player: EnhancedPlayer) -> bool:
         self.particles.update(dt)
         for item in self.items:
@@ -187,22 +242,24 @@ class Level1_FirstSteps(Level):
     def setup(self, audio_system: AudioSystem):
         orb = EnhancedItem(WINDOW_WIDTH//2 - 7, WINDOW_HEIGHT//2 - 7, 'orb', audio_system)
         self.items.append(orb)
+        self.index_objects()
     
     def update(self, dt: float, player: EnhancedPlayer) -> bool:
         super().update(dt, player)
         
-        if random.random() < 0.3:
-            self.particles.add_sparkle(WINDOW_WIDTH//2 + random.randint(-20, 20), 
-                                     WINDOW_HEIGHT//2 + random.randint(-20, 20))
-        
-        for item in self.items:
-            if not item.collected and player.rect.colliderect(item.rect):
-                item.collect()
-                for _ in range(10):
-                    self.particles.add_sparkle(player.x + player.width//2, 
-                                             player.y + player.height//2, 
-                                             PALETTE['sparkle_white'])
-                return True
+        roll, (dx, dy) = self.next_random()
+        if roll < 0.3:
+            self.particles.add_sparkle(WINDOW_WIDTH//2 + dx, WINDOW_HEIGHT//2 + dy)
+        
+        item = self.colliding_item(player)
+        if item:
+            item.collect()
+            self.index_objects()
+            for _ in range(10):
+                self.particles.add_sparkle(player.x + player.width//2, 
+                                         player.y + player.height//2, 
+                                         PALETTE['sparkle_white'])
+            return True
         return False
 
 class Level2_TheDoor(Level):
@@ -217,21 +274,24 @@ class Level2_TheDoor(Level):
         self.items.append(key)
         door = EnhancedDoor(WINDOW_WIDTH - 100, WINDOW_HEIGHT//2 - 25, audio_system)
         self.doors.append(door)
+        self.index_objects()
     
     def update(self, dt: float, player: EnhancedPlayer) -> bool:
         super().update(dt, player)
         
-        for item in self.items:
-            if not item.collected and random.random() < 0.2:
+        for item in self._live_items:
+            if self.next_random()[0] < 0.2:
                 self.particles.add_sparkle(item.x + item.width//2, item.y + item.height//2)
         
-        for item in self.items:
-            if not item.collected and player.rect.colliderect(item.rect):
-                item.collect()
-                player.inventory = 'key'
+        item = self.colliding_item(player)
+        while item:
+            item.collect()
+            player.inventory = 'key'
+            self.index_objects()
+            item = self.colliding_item(player)
         
-        for door in self.doors:
-            if door.is_open and player.rect.colliderect(door.rect):
+        for idx in player.rect.collidelistall(self._door_rects):
+            if self.doors[idx].is_open:
                 return True
         return False
     
@@ -246,7 +306,9 @@ class Level2_TheDoor(Level):
                     return "This door requires a key. Preparation opens opportunities."
         return None
 
-class TenSecondLifeEnhanced:
+class TenSecondLifeEnhanced(RedrawGate):
+    STATIC_STATES = STATIC_STATES
+    
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("10 Second Life: Enhanced Edition")
@@ -272,6 +334,46 @@ class TenSecondLifeEnhanced:
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
         
+        # Rendered labels, bounded so changing text can't grow it forever
+        self._text_cache = TextCache()
+        
+        # Fullscreen death shade, allocated and filled once
+        self._death_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self._death_overlay.fill((*PALETTE['shadow'], 150))
+        # Whole death screen (frozen level + shade + card), captured once per death
+        self._death_frame = None
+        
+        # Last tenth-of-a-second of the life timer that timer sounds were checked at
+        self._timer_tenths = None
+        # Bound once for the per-frame timer sounds
+        self._audio_enabled = self.audio.enabled
+        self._contextual_sound = self.audio.play_contextual_sound
+        
+        # Fixed UI layout, built once
+        self._ui_level_rect = pygame.Rect(10, 10, 400, 100)
+        self._ui_inv_rect = pygame.Rect(10, WINDOW_HEIGHT - 60, 200, 40)
+        self._menu_panel_rect = pygame.Rect(WINDOW_WIDTH//2 - 200, WINDOW_HEIGHT//2 + 20, 400, 120)
+        self._death_panel_rect = pygame.Rect(WINDOW_WIDTH//2 - 200, WINDOW_HEIGHT//2 - 100, 400, 200)
+        # (message, surface, text rect, panel rect) for the current message
+        self._message_layout = (None, None, None, None)
+        
+        # Static screens are only redrawn after input or a state change
+        self.init_redraw_gate()
+        
+        # Per-state update and draw handlers
+        self._update_dispatch = {
+            GameState.PLAYING: self._update_playing,
+            GameState.LESSON: self._update_lesson,
+        }
+        self._draw_dispatch = {
+            GameState.MENU: self.draw_menu,
+            GameState.PLAYING: self.draw_playing,
+            GameState.DEATH: self.draw_death,
+            GameState.LESSON: self.draw_lesson_screen,
+            GameState.LEVEL_COMPLETE: self.draw_level_complete,
+            GameState.VICTORY: self.draw_victory,
+        }
+        
         self.audio.play_ambient('ambient')
         self.load_level(self.progress.current_level)
     
@@ -290,6 +392,7 @@ class TenSecondLifeEnhanced:
         self.life_timer = LIFE_DURATION
         self.progress.total_lives_used += 1
         self.player.reset_position()
+        self._death_frame = None
         self.audio.play_sound('heartbeat', 0.6)
     
     def complete_level(self):
@@ -315,35 +418,49 @@ class TenSecondLifeEnhanced:
     def update(self, dt: float):
         self.particles.update(dt)
         
-        if self.state == GameState.PLAYING:
-            self.life_timer -= dt
-            self.audio.play_contextual_sound("timer_low", time_remaining=self.life_timer)
-            if self.life_timer < 5:
-                self.audio.play_contextual_sound("heartbeat", time_remaining=self.life_timer)
-            
-            if self.life_timer <= 0:
-                self.state = GameState.DEATH
-                return
-            
-            keys = pygame.key.get_pressed()
-            self.player.update(dt, keys)
-            
-            if self.current_level:
-                if self.current_level.update(dt, self.player):
-                    self.complete_level()
-        
-        elif self.state == GameState.LESSON:
-            self.lesson_timer -= dt
-            if self.lesson_timer <= 0:
-                self.state = GameState.LEVEL_COMPLETE
+        # One dict lookup instead of a chain of enum compares
+        state_update = self._update_dispatch.get(self.state)
+        if state_update:
+            state_update(dt)
         
         if self.message_timer > 0:
             self.message_timer -= dt
             if self.message_timer <= 0:
                 self.message = ""
     
+    def _update_playing(self, dt: float):
+        self.life_timer -= dt
+        # Timer sounds only care about tenth-of-a-second boundaries, so
+        # only consult the audio system when one is crossed
+        tenths = int(self.life_timer * 10)
+        if tenths != self._timer_tenths and self._audio_enabled:
+            last_tenths, self._timer_tenths = self._timer_tenths, tenths
+            self._contextual_sound("timer_low", self.life_timer)
+            # Once per second, as each whole second is crossed; comparing seconds
+            # rather than looking for one tenth keeps the beat after a slow frame
+            if self.life_timer < 5 and last_tenths is not None and tenths // 10 != last_tenths // 10:
+                self._contextual_sound("heartbeat", self.life_timer)
+        
+        if self.life_timer <= 0:
+            self.state = GameState.DEATH
+            self._death_frame = None
+            return
+        
+        keys = pygame.key.get_pressed()
+        self.player.update(dt, keys)
+        
+        if self.current_level:
+            if self.current_level.update(dt, self.player):
+                self.complete_level()
+    
+    def _update_lesson(self, dt: float):
+        self.lesson_timer -= dt
+        if self.lesson_timer <= 0:
+            self.state = GameState.LEVEL_COMPLETE
+    
     def handle_events(self):
         for event in pygame.event.get():
+            self.mark_dirty()
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -380,60 +497,60 @@ class TenSecondLifeEnhanced:
                     if event.key == pygame.K_SPACE:
                         self.next_level()
     
+    def _render(self, font, text, color):
+        """Render a label once and reuse the surface on later frames"""
+        return self._text_cache.render(font, text, color)
+    
     def draw_enhanced_ui(self):
         draw_circular_timer(self.screen, WINDOW_WIDTH - 80, 80, 50, 
                           self.life_timer, LIFE_DURATION)
         
+        blit_list = []
+        
         if self.current_level:
-            panel_rect = pygame.Rect(10, 10, 400, 100)
-            draw_modern_ui_panel(self.screen, panel_rect)
+            draw_modern_ui_panel(self.screen, self._ui_level_rect)
             
-            title_surface = self.font_medium.render(f"Level {self.current_level.number}: {self.current_level.title}", 
-                                                   True, PALETTE['text_primary'])
-            self.screen.blit(title_surface, (20, 25))
-            
-            obj_surface = self.font_small.render(self.current_level.objective, True, PALETTE['ui_warning'])
-            self.screen.blit(obj_surface, (20, 55))
-            
-            lives_surface = self.font_small.render(f"Lives Used: {self.progress.total_lives_used}", 
-                                                  True, PALETTE['text_secondary'])
-            self.screen.blit(lives_surface, (20, 80))
+            title_surface = self._render(self.font_medium, f"Level {self.current_level.number}: {self.current_level.title}", 
+                                         PALETTE['text_primary'])
+            obj_surface = self._render(self.font_small, self.current_level.objective, PALETTE['ui_warning'])
+            lives_surface = self._render(self.font_small, f"Lives Used: {self.progress.total_lives_used}", 
+                                         PALETTE['text_secondary'])
+            blit_list += [(title_surface, (20, 25)), (obj_surface, (20, 55)), (lives_surface, (20, 80))]
         
         if self.player.inventory:
-            inv_rect = pygame.Rect(10, WINDOW_HEIGHT - 60, 200, 40)
-            draw_modern_ui_panel(self.screen, inv_rect)
-            inv_surface = self.font_small.render(f"Carrying: {self.player.inventory}", 
-                                               True, PALETTE['ui_success'])
-            self.screen.blit(inv_surface, (20, WINDOW_HEIGHT - 45))
+            draw_modern_ui_panel(self.screen, self._ui_inv_rect)
+            inv_surface = self._render(self.font_small, f"Carrying: {self.player.inventory}", 
+                                       PALETTE['ui_success'])
+            blit_list.append((inv_surface, (20, WINDOW_HEIGHT - 45)))
         
         if self.message:
-            msg_surface = self.font_medium.render(self.message, True, PALETTE['ui_warning'])
-            msg_rect = msg_surface.get_rect(center=(WINDOW_WIDTH//2, 150))
-            bg_rect = pygame.Rect(msg_rect.x - 15, msg_rect.y - 10, msg_rect.width + 30, msg_rect.height + 20)
+            if self._message_layout[0] != self.message:
+                msg_surface = self._render(self.font_medium, self.message, PALETTE['ui_warning'])
+                msg_rect = msg_surface.get_rect(center=(WINDOW_WIDTH//2, 150))
+                self._message_layout = (self.message, msg_surface, msg_rect, msg_rect.inflate(30, 20))
+            _, msg_surface, msg_rect, bg_rect = self._message_layout
             draw_modern_ui_panel(self.screen, bg_rect)
-            self.screen.blit(msg_surface, msg_rect)
+            blit_list.append((msg_surface, msg_rect))
+        
+        # Panels never overlap each other's text, so all labels go out in one batch
+        blit_batch(self.screen, blit_list)
     
     def draw_menu(self):
         create_background_pattern(self.screen)
         
-        title = self.font_title.render("10 Second Life", True, PALETTE['text_primary'])
-        title_rect = title.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 150))
-        self.screen.blit(title, title_rect)
+        draw_modern_ui_panel(self.screen, self._menu_panel_rect)
         
-        subtitle = self.font_large.render("Enhanced Edition", True, PALETTE['ui_warning'])
-        subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 100))
-        self.screen.blit(subtitle, subtitle_rect)
+        title = self._render(self.font_title, "10 Second Life", PALETTE['text_primary'])
+        subtitle = self._render(self.font_large, "Enhanced Edition", PALETTE['ui_warning'])
+        instruction1 = self._render(self.font_medium, "Press SPACE to begin", PALETTE['ui_success'])
+        instruction2 = self._render(self.font_small, "Each level teaches a life lesson", PALETTE['text_secondary'])
         
-        panel_rect = pygame.Rect(WINDOW_WIDTH//2 - 200, WINDOW_HEIGHT//2 + 20, 400, 120)
-        draw_modern_ui_panel(self.screen, panel_rect)
-        
-        instruction1 = self.font_medium.render("Press SPACE to begin", True, PALETTE['ui_success'])
-        instruction1_rect = instruction1.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 50))
-        self.screen.blit(instruction1, instruction1_rect)
-        
-        instruction2 = self.font_small.render("Each level teaches a life lesson", True, PALETTE['text_secondary'])
-        instruction2_rect = instruction2.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 80))
-        self.screen.blit(instruction2, instruction2_rect)
+        blit_batch(self.screen, [
+            (title, title.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 150))),
+            (subtitle, subtitle.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 100))),
+            (instruction1, instruction1.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 50))),
+            (instruction2, instruction2.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 80))),
+        ])
     
     def draw_lesson_screen(self):
         create_background_pattern(self.screen)
@@ -442,81 +559,87 @@ class TenSecondLifeEnhanced:
             draw_lesson_panel(self.screen, self.current_level.lesson, 
                             WINDOW_WIDTH//2 - 300, WINDOW_HEIGHT//2 - 150, 600)
             
-            continue_text = self.font_medium.render("Press SPACE to continue", True, PALETTE['ui_success'])
+            continue_text = self._render(self.font_medium, "Press SPACE to continue", PALETTE['ui_success'])
             continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 150))
             self.screen.blit(continue_text, continue_rect)
     
     def draw_death_screen(self):
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (*PALETTE['shadow'], 150), (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
-        self.screen.blit(overlay, (0, 0))
-        
-        panel_rect = pygame.Rect(WINDOW_WIDTH//2 - 200, WINDOW_HEIGHT//2 - 100, 400, 200)
-        draw_modern_ui_panel(self.screen, panel_rect)
+        self.screen.blit(self._death_overlay, (0, 0))
         
-        death_text = self.font_large.render("Life Ended", True, PALETTE['ui_danger'])
-        death_rect = death_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-        self.screen.blit(death_text, death_rect)
+        draw_modern_ui_panel(self.screen, self._death_panel_rect)
         
-        continue_text = self.font_medium.render("Press SPACE for new life", True, PALETTE['text_primary'])
-        continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-        self.screen.blit(continue_text, continue_rect)
+        death_text = self._render(self.font_large, "Life Ended", PALETTE['ui_danger'])
+        continue_text = self._render(self.font_medium, "Press SPACE for new life", PALETTE['text_primary'])
+        blit_batch(self.screen, [
+            (death_text, death_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))),
+            (continue_text, continue_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))),
+        ])
     
     def draw_level_complete(self):
         create_background_pattern(self.screen)
         
-        complete_text = self.font_large.render("Level Complete!", True, PALETTE['ui_success'])
-        complete_rect = complete_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-        self.screen.blit(complete_text, complete_rect)
-        
-        continue_text = self.font_medium.render("Press SPACE to continue", True, PALETTE['text_primary'])
-        continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 20))
-        self.screen.blit(continue_text, continue_rect)
+        complete_text = self._render(self.font_large, "Level Complete!", PALETTE['ui_success'])
+        continue_text = self._render(self.font_medium, "Press SPACE to continue", PALETTE['text_primary'])
+        blit_batch(self.screen, [
+            (complete_text, complete_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))),
+            (continue_text, continue_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 20))),
+        ])
     
     def draw_victory(self):
         create_background_pattern(self.screen)
         
-        victory_text = self.font_title.render("Congratulations!", True, PALETTE['ui_success'])
-        victory_rect = victory_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 100))
-        self.screen.blit(victory_text, victory_rect)
-        
+        victory_text = self._render(self.font_title, "Congratulations!", PALETTE['ui_success'])
         stats_text = f"Journey completed in {self.progress.total_lives_used} lives"
-        stats_surface = self.font_medium.render(stats_text, True, PALETTE['text_primary'])
-        stats_rect = stats_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))
-        self.screen.blit(stats_surface, stats_rect)
+        stats_surface = self._render(self.font_medium, stats_text, PALETTE['text_primary'])
+        blit_batch(self.screen, [
+            (victory_text, victory_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 100))),
+            (stats_surface, stats_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 50))),
+        ])
     
-    def draw(self):
-        if self.state == GameState.MENU:
-            self.draw_menu()
-        else:
+    def draw_playing(self):
+        create_background_pattern(self.screen)
+        if self.current_level:
+            self.current_level.draw(self.screen)
+        self.player.draw(self.screen)
+        self.draw_enhanced_ui()
+    
+    def draw_death(self):
+        if self._death_frame is None:
             create_background_pattern(self.screen)
-            
-            if self.state == GameState.PLAYING:
-                if self.current_level:
-                    self.current_level.draw(self.screen)
-                self.player.draw(self.screen)
-                self.draw_enhanced_ui()
-            elif self.state == GameState.DEATH:
-                if self.current_level:
-                    self.current_level.draw(self.screen)
-                self.player.draw(self.screen)
-                self.draw_death_screen()
-            elif self.state == GameState.LESSON:
-                self.draw_lesson_screen()
-            elif self.state == GameState.LEVEL_COMPLETE:
-                self.draw_level_complete()
-            elif self.state == GameState.VICTORY:
-                self.draw_victory()
+            if self.current_level:
+                self.current_level.draw(self.screen)
+            self.player.draw(self.screen)
+            self.draw_death_screen()
+            # Nothing under the death card moves until the next life
+            self._death_frame = self.screen.copy()
+        else:
+            self.screen.blit(self._death_frame, (0, 0))
+    
+    def draw(self):
+        # Every screen draws its own background
+        self._draw_dispatch[self.state]()
         
         self.particles.draw(self.screen)
         pygame.display.flip()
+        self.mark_drawn()
+    
+    def is_animating(self) -> bool:
+        # Particles keep moving over any screen
+        return super().is_animating() or self.particles.count > 0
     
     def run(self):
+        # dt comes from the monotonic perf counter; tick() only caps the frame rate
+        last_time = time.perf_counter()
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            self.clock.tick(FPS)
+            now = time.perf_counter()
+            dt = now - last_time
+            last_time = now
+            
             self.handle_events()
             self.update(dt)
-            self.draw()
+            if self.needs_redraw():
+                self.draw()
         
         self.audio.cleanup()
         pygame.quit()